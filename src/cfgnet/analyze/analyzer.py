@@ -14,21 +14,48 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import hashlib
 import logging
 import time
 
-from typing import Optional, Set
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional, Set
+from git.objects.commit import Commit
 from cfgnet.vcs.git import Git
 from cfgnet.vcs.git_history import GitHistory
+from cfgnet.vcs.changed_files import ChangedFileIndex
+from cfgnet.plugins.plugin_manager import PluginManager
+from cfgnet.plugins.include_resolver import GLOB_CHARS
+from cfgnet.utility.util import is_in_test_directory
 from cfgnet.network.network import Network, NetworkConfiguration
+from cfgnet.conflicts.conflict_detector import ConflictDetector
 from cfgnet.analyze.csv_writer import CSVWriter
 
 
 class Analyzer:
-    def __init__(self, cfg: NetworkConfiguration):
+    def __init__(
+        self,
+        cfg: NetworkConfiguration,
+        branch: Optional[str] = None,
+        rev_range: Optional[str] = None,
+        first_parent: bool = False,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        sample_interval: Optional[int] = None,
+        sample_tags: bool = False,
+    ):
         self.cfg: NetworkConfiguration = cfg
+        self.branch: Optional[str] = branch
+        self.rev_range: Optional[str] = rev_range
+        self.first_parent: bool = first_parent
+        self.since: Optional[str] = since
+        self.until: Optional[str] = until
+        self.sample_interval: Optional[int] = sample_interval
+        self.sample_tags: bool = sample_tags
         self.conflicts_cvs_path: Optional[str] = None
         self.time_last_progress_print: float = 0
+        self.commit_hash_pre_analysis: Optional[str] = None
+        self.current_commit: Optional[Commit] = None
         self._setup_dirs()
 
     def _setup_dirs(self) -> None:
@@ -37,13 +64,13 @@ class Analyzer:
             self.cfg.project_root_abs, self.cfg.cfgnet_path_rel
         )
 
-        analysis_dir = os.path.join(data_dir, "analysis")
+        self.analysis_dir = os.path.join(data_dir, "analysis")
 
-        if not os.path.exists(analysis_dir):
-            os.makedirs(analysis_dir)
+        if not os.path.exists(self.analysis_dir):
+            os.makedirs(self.analysis_dir)
 
         self.conflicts_csv_path = os.path.join(
-            analysis_dir, f"conflicts_{self.cfg.project_name()}.csv"
+            self.analysis_dir, f"conflicts_{self.cfg.project_name()}.csv"
         )
 
         if os.path.exists(self.conflicts_csv_path):
@@ -64,20 +91,185 @@ class Analyzer:
         if final:
             print()
 
-    def analyze_commit_history(self) -> None:
-        """Analyze the commit history."""
-        repo = Git(project_root=self.cfg.project_root_abs)
-        branch_pre_analysis = repo.get_current_branch_name()
-        commit_hash_pre_analysis = repo.get_current_commit_hash()
+    def _get_changed_file_index(
+        self, repo: Git, history: GitHistory, dependencies: Set[str]
+    ) -> Optional[ChangedFileIndex]:
+        """
+        Index the config files changed by each commit of the history.
+
+        Files outside of the history can change independently of commits,
+        in which case no index is created.
+
+        :param repo: Analyzed repository
+        :param history: Analyzed commit history
+        :param dependencies: Paths and patterns of files referenced by
+            artifacts, e.g. included files, which are indexed as well
+        :return: Index of changed config files or None
+        """
+        if self.cfg.config_files or self.cfg.system_level:
+            return None
+
+        config_file_filter = PluginManager.get_config_file_filter(
+            self.cfg.project_root_abs, self.cfg.enable_file_type_plugins
+        )
+        ignorefile_path = os.path.relpath(
+            self.cfg.ignorefile_path(), self.cfg.project_root_abs
+        )
+        dependency_patterns = [
+            dependency.split(os.sep)
+            for dependency in dependencies
+            if not GLOB_CHARS.isdisjoint(dependency)
+        ]
+
+        def is_dependency(rel_file_path: str) -> bool:
+            if rel_file_path in dependencies:
+                return True
+            parts = rel_file_path.split("/")
+            return any(
+                len(parts) == len(pattern)
+                and all(map(fnmatchcase, parts, pattern))
+                for pattern in dependency_patterns
+            )
+
+        def file_filter(rel_file_path: str) -> bool:
+            if rel_file_path == ignorefile_path or is_dependency(
+                rel_file_path
+            ):
+                return True
+            return not is_in_test_directory(
+                rel_file_path
+            ) and config_file_filter(rel_file_path)
+
+        return ChangedFileIndex.load_or_build(
+            repo,
+            history.rev_args,
+            cache_dir=self.analysis_dir,
+            file_filter=file_filter,
+            cache_key=self._get_changed_file_cache_key(dependencies),
+        )
+
+    def _get_changed_file_cache_key(self, dependencies: Set[str]) -> str:
+        """
+        Identify the file filter of the changed file index.
+
+        :param dependencies: Paths and patterns of referenced files
+        :return: Key of the plugins, filter settings and ignore file
+        """
+        ignorefile_digest = ""
+        if os.path.isfile(self.cfg.ignorefile_path()):
+            with open(self.cfg.ignorefile_path(), "rb") as ignorefile:
+                ignorefile_digest = hashlib.md5(ignorefile.read()).hexdigest()
+
+        return "|".join(
+            [
+                "plugins="
+                + PluginManager.get_fingerprint(
+                    self.cfg.enable_file_type_plugins
+                ),
+                f"file_type_plugins={self.cfg.enable_file_type_plugins}",
+                f"ignorefile={self.cfg.ignorefile_path()}:{ignorefile_digest}",
+                "dependencies=" + ",".join(sorted(dependencies)),
+            ]
+        )
+
+    def _is_sampled(self) -> bool:
+        """Return if networks are only built at sampled commits."""
+        return bool(
+            (self.sample_interval and self.sample_interval > 1)
+            or self.sample_tags
+        )
+
+    def _localize_conflicts(
+        self,
+        repo: Git,
+        window: List[Commit],
+        ref_network: Network,
+        sample_network: Network,
+    ) -> Set:
+        """
+        Find the commits between two samples that introduced conflicts.
+
+        Each link missing in the sample network is searched by bisection
+        for the first commit of the window in which it disappeared. There,
+        conflicts are detected as in a full analysis of the history.
+
+        :param repo: Analyzed repository
+        :param window: Commits after the reference sample up to the sample
+        :param ref_network: Network of the previous sample
+        :param sample_network: Network of the last commit in the window
+        :return: Set of conflicts detected in the window
+        """
+        missing_links = ref_network.find_missing_links(sample_network)
+        if not missing_links:
+            return set()
+
+        networks: Dict[int, Network] = {
+            -1: ref_network,
+            len(window) - 1: sample_network,
+        }
+
+        def network_at(index: int) -> Network:
+            if index not in networks:
+                networks[index] = Network.init_network(
+                    cfg=self.cfg, commit=window[index].hexsha, repo=repo
+                )
+            return networks[index]
+
+        introducing_commits: Set[int] = set()
+        for link in missing_links:
+            low, high = 0, len(window) - 1
+            while low < high:
+                middle = (low + high) // 2
+                if network_at(middle).has_link(link):
+                    low = middle + 1
+                else:
+                    high = middle
+            introducing_commits.add(low)
 
         conflicts: Set = set()
-        history = GitHistory(repo)
-        commit = history.restore_initial_commit()
+        for index in sorted(introducing_commits):
+            conflicts.update(
+                ConflictDetector.detect(
+                    ref_network=network_at(index - 1),
+                    new_network=network_at(index),
+                    enable_all_conflicts=self.cfg.enable_all_conflicts,
+                    commit_hash=window[index].hexsha,
+                )
+            )
 
-        try:
-            ref_network = Network.init_network(cfg=self.cfg)
-            while history.has_next_commit():
-                commit = history.next_commit()
+        logging.debug(
+            "Built %s networks for %s commits between samples.",
+            str(len(networks) - 1),
+            str(len(window)),
+        )
+
+        return conflicts
+
+    def _analyze_commits(
+        self, repo: Git, history: GitHistory, conflicts: Set
+    ) -> None:
+        """Build a network at every commit and detect conflicts."""
+        ref_network = Network.init_network(cfg=self.cfg)
+
+        # referenced files of the initial network are indexed as well
+        indexed_dependencies = ref_network.dependencies
+        changed_files = self._get_changed_file_index(
+            repo, history, indexed_dependencies
+        )
+
+        previous_hash = self.current_commit.hexsha
+        while history.has_next_commit():
+            commit = history.next_commit(checkout=False)
+            self.current_commit = commit
+
+            # the network only changes if a config file or a file referenced
+            # by the network changed
+            if (
+                not changed_files
+                or not ref_network.dependencies <= indexed_dependencies
+                or not changed_files.is_unchanged(commit.hexsha, previous_hash)
+            ):
+                history.checkout(commit)
 
                 detected_conflicts, ref_network = ref_network.validate(
                     commit.hexsha
@@ -85,26 +277,102 @@ class Analyzer:
 
                 conflicts.update(detected_conflicts)
 
-                self._print_progress(num_commit=history.commit_index + 1)
+            previous_hash = commit.hexsha
+
+            self._print_progress(num_commit=history.commit_index + 1)
+
+            if commit.hexsha == self.commit_hash_pre_analysis:
+                break
+
+    def _analyze_samples(
+        self, repo: Git, history: GitHistory, conflicts: Set
+    ) -> None:
+        """Build networks at sampled commits and bisect conflicts in between."""
+        tagged_commits = (
+            repo.get_tagged_commits() if self.sample_tags else set()
+        )
+
+        ref_network = Network.init_network(cfg=self.cfg)
+        window: List[Commit] = []
+        while history.has_next_commit():
+            commit = history.next_commit(checkout=False)
+            self.current_commit = commit
+            window.append(commit)
+
+            is_sample = (
+                len(window) == self.sample_interval
+                or commit.hexsha in tagged_commits
+                or commit.hexsha == self.commit_hash_pre_analysis
+                or not history.has_next_commit()
+            )
+            if not is_sample:
+                continue
+
+            # networks of samples are built from blobs without checkout
+            sample_network = Network.init_network(
+                cfg=self.cfg, commit=commit.hexsha, repo=repo
+            )
 
-                if commit.hexsha == commit_hash_pre_analysis:
-                    break
+            conflicts.update(
+                self._localize_conflicts(
+                    repo, window, ref_network, sample_network
+                )
+            )
+
+            ref_network = sample_network
+            window = []
+
+            self._print_progress(num_commit=history.commit_index + 1)
+
+            if commit.hexsha == self.commit_hash_pre_analysis:
+                break
+
+    def analyze_commit_history(self) -> None:
+        """Analyze the commit history."""
+        repo = Git(project_root=self.cfg.project_root_abs)
+        branch_pre_analysis = repo.get_current_branch_name()
+        self.commit_hash_pre_analysis = repo.get_current_commit_hash()
+
+        conflicts: Set = set()
+        history = GitHistory(
+            repo,
+            branch=self.branch,
+            rev_range=self.rev_range,
+            first_parent=self.first_parent,
+            since=self.since,
+            until=self.until,
+        )
+        commit = history.restore_initial_commit()
+
+        if commit is None:
+            logging.error("No commits to analyze.")
+            return
+
+        self.current_commit = commit
+
+        try:
+            if self._is_sampled():
+                self._analyze_samples(repo, history, conflicts)
+            else:
+                self._analyze_commits(repo, history, conflicts)
 
         except Exception as error:
             logging.error(
                 "An exception occurred during analysis at commit %s.",
-                commit.hexsha,
+                self.current_commit.hexsha,
             )
             logging.error(error)
             raise
 
         finally:
+            history.close()
+
             if branch_pre_analysis:
                 # HEAD was a branch, so go back to that branch
                 repo.checkout(branch_pre_analysis)
             else:
                 # HEAD was detached, so got back to the commit
-                repo.checkout(commit_hash_pre_analysis)
+                repo.checkout(self.commit_hash_pre_analysis)
 
             CSVWriter.write_conflicts_to_csv(
                 csv_path=self.conflicts_csv_path, conflicts=conflicts
@@ -114,7 +382,9 @@ class Analyzer:
                 num_commit=history.commit_index + 1, final=True
             )
 
-            logging.debug("Latest commit analyzed: %s", commit.hexsha)
+            logging.debug(
+                "Latest commit analyzed: %s", self.current_commit.hexsha
+            )
             logging.debug(
                 "Total analyzed commits %s", str(history.commit_index + 1)
             )
@@ -13,10 +13,22 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import re
-from typing import Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Tuple
 from enum import Enum
 from cfgnet.config_types.config_types import ConfigType
 
+if TYPE_CHECKING:
+    from cfgnet.network.nodes import ValueNode
+
+# maximum number of cached option names and option-value pairs
+CACHE_SIZE = 2**16
+
+BOOLEAN_VALUES = frozenset(
+    ("true", "false", "1", "0", "yes", "no", "on", "off")
+)
+
 
 class Confidence(Enum):
     HIGH = 2
@@ -38,6 +50,10 @@ class ConfigTypeInferer:
     2. Second, the option name or value are checked against specific types
     for which exist only one regular expression.
     3. Lastly, the option name or value checked against general types.
+
+    The option name regexes are evaluated once per option name, and the
+    inferred types are cached by option name and value for all inferers,
+    since the same pairs occur in many files and commits.
     """
 
     regex_password_option = re.compile(r"password|pwd|pass")
@@ -102,6 +118,47 @@ class ConfigTypeInferer:
         r"allow|inactive|enable|disable|flag|switch|active"
     )
 
+    option_patterns = {
+        "password": regex_password_option,
+        "port": regex_port_option,
+        "size": regex_size_option,
+        "username": regex_username_option,
+        "time": regex_time_option,
+        "filepath": regex_filepath_option,
+        "filename": regex_filename_option,
+        "version_number": regex_version_number_option,
+        "ip_address": regex_ip_address_option,
+        "url": regex_url_option,
+        "email": regex_email_option,
+        "speed": regex_speed_option,
+        "id": regex_id_option,
+        "name": regex_name_option,
+        "image": regex_image_option,
+        "command": regex_command_option,
+        "license": regex_license_option,
+        "type": regex_type_option,
+        "platform": regex_platform_option,
+        "boolean": regex_boolean_option,
+    }
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def get_option_patterns(option_name: str) -> FrozenSet[str]:
+        """
+        Return the names of all option patterns that occur in an option name.
+
+        :param option_name: lower case name of option
+        :return: keys of `option_patterns` whose regex matches
+        """
+        return frozenset(
+            pattern_name
+            for pattern_name, regex in ConfigTypeInferer.option_patterns.items()
+            if regex.search(option_name)
+        )
+
+    def _matches_option(self, option_name: str, pattern_name: str) -> bool:
+        return pattern_name in self.get_option_patterns(option_name)
+
     def is_number(self, value: str) -> bool:
         try:
             float(value)
@@ -110,40 +167,22 @@ class ConfigTypeInferer:
             return False
 
     def is_boolean(self, value: str) -> bool:
-        return value.lower() in [
-            "true",
-            "false",
-            "1",
-            "0",
-            "yes",
-            "no",
-            "on",
-            "off",
-        ]
+        return value.lower() in BOOLEAN_VALUES
 
     def is_bool(self, option_name: str, value: str) -> Tuple:
-        if re.search(
-            self.regex_boolean_option, option_name
-        ) and value.lower() in [
-            "true",
-            "false",
-            "1",
-            "0",
-            "yes",
-            "no",
-            "on",
-            "off",
-        ]:
+        if self._matches_option(option_name, "boolean") and self.is_boolean(
+            value
+        ):
             return True, Confidence.HIGH
         return False, None
 
     def is_username(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_username_option, option_name) and re.fullmatch(
-            self.regex_username_value, value
-        ):
+        if self._matches_option(
+            option_name, "username"
+        ) and self.regex_username_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_username_option, option_name):
+        if self._matches_option(option_name, "username"):
             return True, Confidence.LOW
 
         return False, None
@@ -152,15 +191,10 @@ class ConfigTypeInferer:
         try:
             port_value = int(value)
             is_port_value = 0 <= port_value <= 665535
-            if is_port_value and re.search(
-                self.regex_port_option, option_name
-            ):
+            if is_port_value and self._matches_option(option_name, "port"):
                 return True, Confidence.HIGH
 
-            if (
-                re.search(self.regex_port_option, option_name)
-                and not is_port_value
-            ):
+            if self._matches_option(option_name, "port") and not is_port_value:
                 return True, Confidence.LOW
 
             return False, None
@@ -168,202 +202,198 @@ class ConfigTypeInferer:
             return False, None
 
     def is_size(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_size_option, option_name) and re.fullmatch(
-            self.regex_size_value, value
-        ):
+        if self._matches_option(
+            option_name, "size"
+        ) and self.regex_size_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_size_option, option_name) and self.is_number(
-            value
-        ):
+        if self._matches_option(option_name, "size") and self.is_number(value):
             return True, Confidence.HIGH
 
-        if re.fullmatch(self.regex_size_value, value) or re.search(
-            self.regex_size_option, option_name
+        if self.regex_size_value.fullmatch(value) or self._matches_option(
+            option_name, "size"
         ):
             return True, Confidence.LOW
 
         return False, None
 
     def is_time(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_time_option, option_name) and re.fullmatch(
-            self.regex_time_value, value
-        ):
+        if self._matches_option(
+            option_name, "time"
+        ) and self.regex_time_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_time_option, option_name) and self.is_number(
-            value
-        ):
+        if self._matches_option(option_name, "time") and self.is_number(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_time_option, option_name):
+        if self._matches_option(option_name, "time"):
             return True, Confidence.LOW
 
         return False, None
 
     def is_password(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_password_option, option_name) and re.fullmatch(
-            self.regex_password_value, value
-        ):
+        if self._matches_option(
+            option_name, "password"
+        ) and self.regex_password_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_password_option, option_name):
+        if self._matches_option(option_name, "password"):
             return True, Confidence.LOW
 
         return False, None
 
     def is_path(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_filepath_option, option_name) and re.fullmatch(
-            self.regex_filepath_value, value
-        ):
+        if self._matches_option(
+            option_name, "filepath"
+        ) and self.regex_filepath_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_filepath_option, option_name) or re.fullmatch(
-            self.regex_filepath_value, value
-        ):
+        if self._matches_option(
+            option_name, "filepath"
+        ) or self.regex_filepath_value.fullmatch(value):
             return True, Confidence.LOW
 
         return False, None
 
     def is_filename(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_filename_option, option_name) and re.fullmatch(
-            self.regex_filename_value, value
-        ):
+        if self._matches_option(
+            option_name, "filename"
+        ) and self.regex_filename_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.fullmatch(self.regex_filename_value, value):
+        if self.regex_filename_value.fullmatch(value):
             return True, Confidence.LOW
 
         return False, None
 
     def is_version_number(self, option_name: str, value: str) -> Tuple:
-        if re.search(
-            self.regex_version_number_option, option_name
-        ) and re.fullmatch(self.regex_version_number_value, value):
+        if self._matches_option(
+            option_name, "version_number"
+        ) and self.regex_version_number_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_version_number_option, option_name):
+        if self._matches_option(option_name, "version_number"):
             return True, Confidence.LOW
 
         return False, None
 
     def is_ip_address(self, option_name: str, value: str) -> Tuple:
-        if re.search(
-            self.regex_ip_address_option, option_name
-        ) and re.fullmatch(self.regex_ip_address_value, value):
+        if self._matches_option(
+            option_name, "ip_address"
+        ) and self.regex_ip_address_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.fullmatch(self.regex_ip_address_value, value):
+        if self.regex_ip_address_value.fullmatch(value):
             return True, Confidence.LOW
 
         return False, None
 
     def is_email(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_email_option, option_name) and re.fullmatch(
-            self.regex_email_value, value
-        ):
+        if self._matches_option(
+            option_name, "email"
+        ) and self.regex_email_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.fullmatch(self.regex_email_value, value) or re.search(
-            self.regex_email_option, option_name
+        if self.regex_email_value.fullmatch(value) or self._matches_option(
+            option_name, "email"
         ):
             return True, Confidence.LOW
 
         return False, None
 
     def is_speed(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_speed_option, option_name) and re.fullmatch(
-            self.regex_speed_value, value
-        ):
+        if self._matches_option(
+            option_name, "speed"
+        ) and self.regex_speed_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_speed_option, option_name) and self.is_number(
+        if self._matches_option(option_name, "speed") and self.is_number(
             value
         ):
             return True, Confidence.HIGH
 
-        if re.fullmatch(self.regex_speed_value, value) or re.search(
-            self.regex_speed_option, option_name
+        if self.regex_speed_value.fullmatch(value) or self._matches_option(
+            option_name, "speed"
         ):
             return True, Confidence.LOW
 
         return False, None
 
     def is_url(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_url_option, option_name) and re.fullmatch(
-            self.regex_url_value, value
-        ):
+        if self._matches_option(
+            option_name, "url"
+        ) and self.regex_url_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.fullmatch(self.regex_url_value, value) or re.search(
-            self.regex_url_option, option_name
+        if self.regex_url_value.fullmatch(value) or self._matches_option(
+            option_name, "url"
         ):
             return True, Confidence.LOW
 
         return False, None
 
     def is_id(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_id_option, option_name) and re.fullmatch(
-            self.regex_id_value, value
-        ):
+        if self._matches_option(
+            option_name, "id"
+        ) and self.regex_id_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_id_option, option_name):
+        if self._matches_option(option_name, "id"):
             return True, Confidence.LOW
 
         return False, None
 
     # pylint: disable=unused-argument
     def is_image(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_image_option, option_name):
+        if self._matches_option(option_name, "image"):
             return True, Confidence.LOW
 
         return False, None
 
     def is_command(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_command_option, option_name) and re.fullmatch(
-            self.regex_command_value, value
-        ):
+        if self._matches_option(
+            option_name, "command"
+        ) and self.regex_command_value.fullmatch(value):
             return True, Confidence.HIGH
 
-        if re.search(self.regex_command_option, option_name):
+        if self._matches_option(option_name, "command"):
             return True, Confidence.LOW
 
         return False, None
 
     # pylint: disable=unused-argument
     def is_license(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_license_option, option_name):
+        if self._matches_option(option_name, "license"):
             return True, Confidence.LOW
 
         return False, None
 
     def is_name(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_name_option, option_name) and re.fullmatch(
-            self.regex_name_value, value
-        ):
+        if self._matches_option(
+            option_name, "name"
+        ) and self.regex_name_value.fullmatch(value):
             return True, Confidence.LOW
 
-        if re.search(self.regex_name_option, option_name):
+        if self._matches_option(option_name, "name"):
             return True, Confidence.LOW
 
         return False, None
 
     # pylint: disable=unused-argument
     def is_type(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_type_option, option_name):
+        if self._matches_option(option_name, "type"):
             return True, Confidence.LOW
 
         return False, None
 
     # pylint: disable=unused-argument
     def is_platform(self, option_name: str, value: str) -> Tuple:
-        if re.search(self.regex_platform_option, option_name):
+        if self._matches_option(option_name, "platform"):
             return True, Confidence.LOW
 
         return False, None
 
-    def get_config_type(self, option_name: str, value: str):
+    def get_config_type(self, option_name: str, value: str) -> ConfigType:
         """
         Get config type based on naming conventions and syntax patterns.
 
@@ -371,6 +401,52 @@ class ConfigTypeInferer:
         :param value: value of option
         :return: return configuration type
         """
+        return self._get_cached_config_type(option_name.lower(), value)
+
+    def infer_value_types(self, value_nodes: Iterable["ValueNode"]) -> None:
+        """
+        Infer the config types of value nodes in a single batch.
+
+        Only value nodes whose type is still unknown after parsing are
+        inferred. They are grouped by the name of their option, so that the
+        option name is normalized and classified once per group and every
+        distinct value once per option name.
+
+        :param value_nodes: value nodes whose parents are option nodes
+        """
+        groups: Dict[str, List["ValueNode"]] = defaultdict(list)
+        for value_node in value_nodes:
+            if value_node.config_type == ConfigType.UNKNOWN:
+                groups[value_node.parent.name].append(value_node)
+
+        for option_name, nodes in groups.items():
+            option_name = option_name.lower()
+            config_types: Dict[str, ConfigType] = {}
+            for value_node in nodes:
+                config_type = config_types.get(value_node.name)
+                if config_type is None:
+                    config_type = self._get_cached_config_type(
+                        option_name, value_node.name
+                    )
+                    config_types[value_node.name] = config_type
+                value_node.config_type = config_type
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def _get_cached_config_type(option_name: str, value: str) -> ConfigType:
+        return INFERER.infer_config_type(option_name, value)
+
+    def infer_config_type(self, option_name: str, value: str) -> ConfigType:
+        """
+        Infer the config type without consulting the cache.
+
+        :param option_name: lower case name of option
+        :param value: value of option
+        :return: return configuration type
+        """
+        if self.is_boolean(value):
+            return ConfigType.BOOLEAN
+
         results = []
 
         # Check for each type using respective methods and append to results
@@ -397,8 +473,6 @@ class ConfigTypeInferer:
             (self.is_bool, ConfigType.BOOLEAN),
         ]
 
-        option_name = option_name.lower()
-
         for check_method, config_type in checks:
             matched, confidence = check_method(option_name, value)
             if matched:
@@ -406,9 +480,6 @@ class ConfigTypeInferer:
 
         results.sort(key=lambda x: x[1].value, reverse=True)
 
-        if self.is_boolean(value):
-            return ConfigType.BOOLEAN
-
         if results:
             if len(results) == 1:
                 return results[0][0]
@@ -428,3 +499,7 @@ class ConfigTypeInferer:
             return ConfigType.NUMBER
 
         return ConfigType.UNKNOWN
+
+
+# inferer shared by all users of the type cache
+INFERER = ConfigTypeInferer()
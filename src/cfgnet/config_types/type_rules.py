@@ -0,0 +1,142 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Declarative rules that map option names of a concept to config types."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from cfgnet.config_types.config_types import ConfigType
+
+# key of the rule index in the nodes of a trie
+RULE = ""
+
+
+@dataclass(frozen=True)
+class TypeRule:
+    """
+    Option names that have the same config type.
+
+    Parameters
+    ----------
+    config_type: Optional[ConfigType]
+        Type of matching options. None leaves matching options to the
+        generic inference, even if a later rule matches.
+    names: Tuple[str, ...]
+        Exact option names.
+    suffixes: Tuple[str, ...]
+        Suffixes of option names.
+    prefixes: Tuple[str, ...]
+        Prefixes of option names.
+    substrings: Tuple[str, ...]
+        Parts that may occur anywhere in option names.
+
+    """
+
+    config_type: Optional[ConfigType]
+    names: Tuple[str, ...] = ()
+    suffixes: Tuple[str, ...] = ()
+    prefixes: Tuple[str, ...] = ()
+    substrings: Tuple[str, ...] = ()
+
+
+class TypeRules:
+    """
+    Ordered type rules of a concept, compiled for fast lookups.
+
+    The first rule that matches an option name decides its type. Exact
+    names are looked up in a hash table, suffixes and prefixes in tries
+    that are walked along the reversed and the original option name. So
+    classifying an option takes time linear in the length of its name
+    instead of the number of rules.
+
+    Parameters
+    ----------
+    rules: Sequence[TypeRule]
+        Rules in the order of precedence.
+    ignore_case: bool
+        Compare option names in lower case.
+
+    """
+
+    def __init__(
+        self, rules: Sequence[TypeRule], ignore_case: bool = False
+    ) -> None:
+        self.rules: Tuple[TypeRule, ...] = tuple(rules)
+        self.ignore_case: bool = ignore_case
+
+        self._names: Dict[str, int] = {}
+        self._suffixes: Dict[str, Any] = {}
+        self._prefixes: Dict[str, Any] = {}
+        self._substrings: List[Tuple[str, int]] = []
+
+        for index, rule in enumerate(self.rules):
+            for name in self._normalize(rule.names):
+                self._names.setdefault(name, index)
+            for suffix in self._normalize(rule.suffixes):
+                self._insert(self._suffixes, reversed(suffix), index)
+            for prefix in self._normalize(rule.prefixes):
+                self._insert(self._prefixes, prefix, index)
+            for substring in self._normalize(rule.substrings):
+                self._substrings.append((substring, index))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _normalize(self, values: Iterable[str]) -> Iterable[str]:
+        if self.ignore_case:
+            return (value.lower() for value in values)
+        return values
+
+    @staticmethod
+    def _insert(
+        trie: Dict[str, Any], chars: Iterable[str], index: int
+    ) -> None:
+        node = trie
+        for char in chars:
+            node = node.setdefault(char, {})
+        node.setdefault(RULE, index)
+
+    @staticmethod
+    def _walk(trie: Dict[str, Any], chars: Iterable[str], index: int) -> int:
+        """Return the first rule of all keys of the trie that prefix chars."""
+        node = trie
+        for char in chars:
+            node = node.get(char)
+            if node is None:
+                break
+            index = min(index, node.get(RULE, index))
+        return index
+
+    def match(self, option_name: str) -> Optional[ConfigType]:
+        """
+        Return the config type of the first rule that matches an option.
+
+        :param option_name: name of option
+        :return: config type or None if the option is left to the inference
+        """
+        if self.ignore_case:
+            option_name = option_name.lower()
+
+        index = self._names.get(option_name, len(self.rules))
+        index = self._walk(self._suffixes, reversed(option_name), index)
+        index = self._walk(self._prefixes, option_name, index)
+        for substring, rule_index in self._substrings:
+            if rule_index < index and substring in option_name:
+                index = rule_index
+
+        if index < len(self.rules):
+            return self.rules[index].config_type
+        return None
@@ -0,0 +1,173 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Conversion of sizes, durations and speeds into canonical units."""
+
+import re
+
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Optional
+
+from cfgnet.config_types.config_types import ConfigType
+
+CACHE_SIZE = 2**16
+
+KIB = 1024
+
+# sizes in bytes; units of configuration files are mostly binary, e.g. the
+# `512m` of a JVM heap or the `16MB` of a MySQL buffer
+SIZE_UNITS: Dict[str, int] = {
+    "": 1,
+    "b": 1,
+    "byte": 1,
+    "bytes": 1,
+    "k": KIB,
+    "kb": KIB,
+    "kib": KIB,
+    "m": KIB**2,
+    "mb": KIB**2,
+    "mib": KIB**2,
+    "g": KIB**3,
+    "gb": KIB**3,
+    "gib": KIB**3,
+    "t": KIB**4,
+    "tb": KIB**4,
+    "tib": KIB**4,
+    "p": KIB**5,
+    "pb": KIB**5,
+    "pib": KIB**5,
+}
+
+# durations in milliseconds
+TIME_UNITS: Dict[str, Fraction] = {
+    "": Fraction(1),
+    "ns": Fraction(1, 10**6),
+    "us": Fraction(1, 10**3),
+    "µs": Fraction(1, 10**3),
+    "ms": Fraction(1),
+    "millis": Fraction(1),
+    "milliseconds": Fraction(1),
+    "s": Fraction(1000),
+    "sec": Fraction(1000),
+    "secs": Fraction(1000),
+    "second": Fraction(1000),
+    "seconds": Fraction(1000),
+    "m": Fraction(60 * 1000),
+    "min": Fraction(60 * 1000),
+    "mins": Fraction(60 * 1000),
+    "minute": Fraction(60 * 1000),
+    "minutes": Fraction(60 * 1000),
+    "h": Fraction(3600 * 1000),
+    "hr": Fraction(3600 * 1000),
+    "hour": Fraction(3600 * 1000),
+    "hours": Fraction(3600 * 1000),
+    "d": Fraction(86400 * 1000),
+    "day": Fraction(86400 * 1000),
+    "days": Fraction(86400 * 1000),
+    "w": Fraction(7 * 86400 * 1000),
+    "week": Fraction(7 * 86400 * 1000),
+    "weeks": Fraction(7 * 86400 * 1000),
+}
+
+# speeds in bits per second
+SPEED_UNITS: Dict[str, int] = {
+    "": 1,
+    "bps": 1,
+    "kbps": 10**3,
+    "mbps": 10**6,
+    "gbps": 10**9,
+    "b/s": 8,
+    "kb/s": 8 * KIB,
+    "mb/s": 8 * KIB**2,
+    "gb/s": 8 * KIB**3,
+}
+
+UNITS = {
+    ConfigType.SIZE: SIZE_UNITS,
+    ConfigType.TIME: TIME_UNITS,
+    ConfigType.SPEED: SPEED_UNITS,
+}
+
+# a number followed by an optional unit, e.g. `512m`, `1.5 GB` or `30s`
+REGEX_QUANTITY = re.compile(r"(\d+(?:\.\d+)?) ?([a-zµ/]*)")
+
+# durations made of several quantities, e.g. `1h30m`
+REGEX_DURATION = re.compile(r"(?:\d+(?:\.\d+)?[a-zµ]+)+")
+
+# units of plain numbers given in the option name, e.g. `timeout_ms` or
+# `timeoutMs`; the unit has to be a separate word of the name
+OPTION_UNITS = "ms|millis|seconds|secs|sec|minutes|mins|hours|bytes|kb|mb|gb"
+REGEX_OPTION_UNIT = re.compile(rf"[_.\-]({OPTION_UNITS})$", re.IGNORECASE)
+REGEX_CAMEL_CASE_OPTION_UNIT = re.compile(
+    rf"[a-z0-9]({OPTION_UNITS.title()}|KB|MB|GB)$"
+)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def get_option_unit(option_name: str) -> str:
+    """
+    Return the unit of plain numbers given in the name of an option.
+
+    :param option_name: Name of the option
+    :return: Lower case unit or an empty string
+    """
+    match = REGEX_OPTION_UNIT.search(
+        option_name
+    ) or REGEX_CAMEL_CASE_OPTION_UNIT.search(option_name)
+    if match is None:
+        return ""
+    return match.group(1).lower()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_canonical_unit(
+    config_type: ConfigType, value: str, default_unit: str = ""
+) -> Optional[Fraction]:
+    """
+    Convert a size, duration or speed into its canonical unit.
+
+    Sizes are converted to bytes, durations to milliseconds and speeds to
+    bits per second. Plain numbers are given in the default unit, or in
+    the canonical unit if the default unit does not apply to the type.
+
+    :param config_type: Config type of the value
+    :param value: Value with an optional unit
+    :param default_unit: Unit of plain numbers, e.g. taken from the option
+    :return: Value in the canonical unit or None if it cannot be parsed
+    """
+    units = UNITS.get(config_type)
+    if units is None:
+        return None
+
+    value = value.strip().lower()
+    match = REGEX_QUANTITY.fullmatch(value)
+    if match is not None:
+        number, unit = match.groups()
+        if not unit and default_unit in units:
+            unit = default_unit
+        if unit not in units:
+            return None
+        return Fraction(number) * units[unit]
+
+    if config_type is ConfigType.TIME and REGEX_DURATION.fullmatch(value):
+        total = Fraction(0)
+        for number, unit in REGEX_QUANTITY.findall(value):
+            if unit not in units:
+                return None
+            total += Fraction(number) * units[unit]
+        return total
+
+    return None
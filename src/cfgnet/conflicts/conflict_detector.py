@@ -49,7 +49,7 @@ class ConflictDetector:
         """
         conflicts: Set = set()
 
-        missing_links = ref_network.links.difference(new_network.links)
+        missing_links = ref_network.find_missing_links(new_network)
 
         for link in missing_links:
             if enable_all_conflicts:
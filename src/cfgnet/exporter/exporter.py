@@ -14,14 +14,39 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from json import dumps
-from typing import Dict, Set, TYPE_CHECKING, TextIO
+from typing import Dict, List, Set, TYPE_CHECKING, TextIO
 from graphviz import Digraph
 from cfgnet.network.nodes import Node
+from cfgnet.linker.link_group import LinkGroup
 
 if TYPE_CHECKING:
     from cfgnet.network.network import Network
 
 
+def get_sorted_groups(network: "Network") -> List[LinkGroup]:
+    """Return the link groups of a network in a stable order."""
+    return sorted(
+        network.link_groups,
+        key=lambda group: [node.id for node in group],
+    )
+
+
+def is_hub(group: LinkGroup) -> bool:
+    """
+    Check if a link group is exported as a hub linked to each node.
+
+    Only groups of more than two nodes that link all pairs of their nodes
+    are hubs. Other groups are exported as their links.
+
+    :param group: Link group of a network
+    :return: True if the group is a hub
+    """
+    return (
+        len(group) > 2
+        and group.count_links() == len(group) * (len(group) - 1) // 2
+    )
+
+
 class DotExporter:
     _dot: Digraph
     _dot_exported_nodes: Set
@@ -68,12 +93,29 @@ class DotExporter:
         self._dot_exported_nodes = set()
         self._dot = Digraph(strict=True)
         self._dot.attr(overlap="false")
-        for link in self.network.links:
-            id_a = self._dot_add_node(link.node_a)
-            id_b = self._dot_add_node(link.node_b)
-            self._dot.edge(
-                id_a, id_b, constraint="false", color="red", dir="none"
-            )
+        for index, group in enumerate(get_sorted_groups(self.network)):
+            if not is_hub(group):
+                for link in group.links():
+                    self._dot.edge(
+                        self._dot_add_node(link.node_a),
+                        self._dot_add_node(link.node_b),
+                        constraint="false",
+                        color="red",
+                        dir="none",
+                    )
+                continue
+            # groups of more nodes are drawn as a hub linked to each node
+            ids = [self._dot_add_node(node) for node in group]
+            id_group = f"group_{index}"
+            self._dot.node(id_group, "", shape="point", color="red")
+            for id_node in ids:
+                self._dot.edge(
+                    id_group,
+                    id_node,
+                    constraint="false",
+                    color="red",
+                    dir="none",
+                )
         if include_unlinked:
             self.network.traverse(self.network.root, self._dot_add_node)
 
@@ -114,12 +156,24 @@ class JSONExporter:
             "nodes": {},
             "links": [],
         }
-        for link in self.network.links:
-            id_a = self._json_add_node(link.node_a)
-            id_b = self._json_add_node(link.node_b)
-            self._json_export_cache["links"].append(
-                {"source": id_a, "target": id_b, "type": "link"}
-            )
+        for index, group in enumerate(get_sorted_groups(self.network)):
+            if not is_hub(group):
+                for link in group.links():
+                    self._json_export_cache["links"].append(
+                        {
+                            "source": self._json_add_node(link.node_a),
+                            "target": self._json_add_node(link.node_b),
+                            "type": "link",
+                        }
+                    )
+                continue
+            # groups of more nodes are exported as a hub linked to each node
+            ids = [self._json_add_node(node) for node in group]
+            id_group = self._json_add_group(group, index)
+            for id_json in ids:
+                self._json_export_cache["links"].append(
+                    {"source": id_group, "target": id_json, "type": "link"}
+                )
         if include_unlinked:
             self.network.traverse(self.network.root, self._json_add_node)
 
@@ -128,6 +182,17 @@ class JSONExporter:
         )
         file.write(dumps(self._json_export_cache, indent=4))
 
+    def _json_add_group(self, group: LinkGroup, index: int):
+        id_group = f"group_{index}"
+        id_json = len(self._json_export_cache["nodes"])
+        self._json_export_cache["nodes"][id_group] = {
+            "id": id_json,
+            "id_cfgnet": id_group,
+            "label": group.nodes[0].name,
+            "type": type(group).__name__,
+        }
+        return id_json
+
     def _json_add_node(self, node: Node):
         if node.id in self._json_export_cache["nodes"]:
             return self._json_export_cache["nodes"][node.id]["id"]
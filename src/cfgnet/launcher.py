@@ -3,7 +3,7 @@ import sys
 import time
 import logging
 import json
-from typing import List
+from typing import List, Optional
 import click
 
 from cfgnet.utility import logger
@@ -47,6 +47,44 @@ add_enable_file_type_plugins = click.option(
     "Besides concept plugins also file type plugins will be used to construct the network.",
 )
 
+stop_value_options = [
+    click.option(
+        "--enable-stop-values",
+        is_flag=True,
+        help="Suppress values that are too frequent to be meaningful links.",
+    ),
+    click.option(
+        "--stop-value-max-nodes",
+        type=click.IntRange(min=1),
+        default=100,
+        show_default=True,
+        help="Values of more value nodes are stop values.",
+    ),
+    click.option(
+        "--stop-value-max-artifact-share",
+        type=click.FloatRange(min=0.0, max=1.0),
+        default=0.5,
+        show_default=True,
+        help="Values spread over a larger share of artifacts are stop values.",
+    ),
+    click.option(
+        "--cap-stop-values",
+        is_flag=True,
+        help="Link the first nodes of stop values instead of dropping them.",
+    ),
+    click.option(
+        "--save-stop-values",
+        is_flag=True,
+        help="Persist stop values in .cfgnet/stopvalues for later runs.",
+    ),
+]
+
+
+def add_stop_value_options(command):
+    for option in reversed(stop_value_options):
+        command = option(command)
+    return command
+
 
 @click.group()
 @click.option(
@@ -67,6 +105,7 @@ def main(verbose: bool):
 @add_enable_linker_option
 @add_disable_linker_option
 @add_enable_file_type_plugins
+@add_stop_value_options
 def init(
     enable_static_blacklist: bool,
     enable_internal_links: bool,
@@ -76,6 +115,11 @@ def init(
     enable_linker: List[str],
     disable_linker: List[str],
     enable_file_type_plugins: bool,
+    enable_stop_values: bool,
+    stop_value_max_nodes: int,
+    stop_value_max_artifact_share: float,
+    cap_stop_values: bool,
+    save_stop_values: bool,
     config_files: List,
 ):
     """Initialize configuration network."""
@@ -90,6 +134,11 @@ def init(
         enabled_linkers=list(set(enable_linker) - set(disable_linker)),
         enable_all_conflicts=enable_all_conflicts,
         enable_file_type_plugins=enable_file_type_plugins,
+        enable_stop_values=enable_stop_values,
+        stop_value_max_nodes=stop_value_max_nodes,
+        stop_value_max_artifact_share=stop_value_max_artifact_share,
+        cap_stop_values=cap_stop_values,
+        save_stop_values=save_stop_values,
         system_level=system_level,
     )
     LinkerManager.set_enabled_linkers(network_configuration.enabled_linkers)
@@ -118,8 +167,6 @@ def validate(project_root: str):
     ref_network = Network.load_network(project_root=project_root)
     logger.configure_repo_logger(ref_network.cfg.logfile_path())
 
-    # TODO Network should configure LinkerManager with list of enabled linkers
-
     conflicts, new_network = ref_network.validate()
 
     new_network.save()
@@ -151,10 +198,26 @@ def validate(project_root: str):
 @click.option("-c", "--enable-all-conflicts", is_flag=True)
 @click.option("-f", "--config-files", multiple=True)
 @click.option("-s", "--system_level", multiple=True)
+@click.option("--branch", help="Branch to analyze.")
+@click.option("--rev-range", help="Revision range, e.g. `v1.0..v2.0`.")
+@click.option("--first-parent", is_flag=True)
+@click.option("--since", help="Only analyze commits after this date.")
+@click.option("--until", help="Only analyze commits before this date.")
+@click.option(
+    "--sample-interval",
+    type=click.IntRange(min=1),
+    help="Only build networks at every k-th commit and bisect conflicts.",
+)
+@click.option(
+    "--sample-tags",
+    is_flag=True,
+    help="Build networks at tagged commits and bisect conflicts.",
+)
 @add_project_root_argument
 @add_enable_linker_option
 @add_disable_linker_option
 @add_enable_file_type_plugins
+@add_stop_value_options
 def analyze(
     enable_static_blacklist: bool,
     enable_internal_links: bool,
@@ -164,7 +227,19 @@ def analyze(
     disable_linker: List[str],
     config_files: List,
     system_level: bool,
+    branch: Optional[str],
+    rev_range: Optional[str],
+    first_parent: bool,
+    since: Optional[str],
+    until: Optional[str],
+    sample_interval: Optional[int],
+    sample_tags: bool,
     enable_file_type_plugins: bool,
+    enable_stop_values: bool,
+    stop_value_max_nodes: int,
+    stop_value_max_artifact_share: float,
+    cap_stop_values: bool,
+    save_stop_values: bool,
 ):
     """Run self-evaluating analysis of commit history."""
     project_name = os.path.basename(project_root)
@@ -180,6 +255,11 @@ def analyze(
         enable_all_conflicts=enable_all_conflicts,
         system_level=system_level,
         enable_file_type_plugins=enable_file_type_plugins,
+        enable_stop_values=enable_stop_values,
+        stop_value_max_nodes=stop_value_max_nodes,
+        stop_value_max_artifact_share=stop_value_max_artifact_share,
+        cap_stop_values=cap_stop_values,
+        save_stop_values=save_stop_values,
     )
     LinkerManager.set_enabled_linkers(network_configuration.enabled_linkers)
     logger.configure_repo_logger(network_configuration.logfile_path())
@@ -189,7 +269,16 @@ def analyze(
 
     start = time.time()
 
-    analyzer = Analyzer(cfg=network_configuration)
+    analyzer = Analyzer(
+        cfg=network_configuration,
+        branch=branch,
+        rev_range=rev_range,
+        first_parent=first_parent,
+        since=since,
+        until=until,
+        sample_interval=sample_interval,
+        sample_tags=sample_tags,
+    )
 
     analyzer.analyze_commit_history()
 
@@ -245,6 +334,11 @@ def export(
 @click.option("-f", "--config-files", multiple=True)
 @click.option("-o", "--output", required=True)
 @click.option("-f", "--system_level", is_flag=False)
+@click.option(
+    "--skip-types",
+    is_flag=True,
+    help="Do not infer the types of values.",
+)
 @add_project_root_argument
 @add_enable_file_type_plugins
 def extract(
@@ -253,6 +347,7 @@ def extract(
     output: str,
     enable_file_type_plugins: bool,
     system_level: bool,
+    skip_types: bool,
 ):
     """Extract key-value pairs."""
     project_name = os.path.basename(project_root)
@@ -266,6 +361,7 @@ def extract(
         enable_all_conflicts=False,
         enable_file_type_plugins=enable_file_type_plugins,
         system_level=system_level,
+        infer_types=not skip_types,
     )
 
     start = time.time()
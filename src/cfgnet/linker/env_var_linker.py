@@ -0,0 +1,161 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import re
+
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
+
+from cfgnet.network.nodes import ArtifactNode, Node, OptionNode, ValueNode
+from cfgnet.linker.linker import Linker
+from cfgnet.linker.link_group import get_artifact_id
+
+# options whose children define environment variables, e.g. `ENV` in a
+# Dockerfile, `environment` in docker-compose or `env` in CI pipelines
+ENV_BLOCKS = frozenset(("ENV", "ARG", "env", "environment", "variables"))
+
+# nested blocks of env blocks, e.g. `env.global` in Travis CI
+NESTED_ENV_BLOCKS = frozenset(("global", "matrix", "jobs"))
+
+# artifacts whose options all define environment variables
+ENV_CONCEPTS = frozenset(("dotenv",))
+
+REGEX_VARIABLE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# assignments in values like `TEST_SUITE=units FOLDER=integration`
+REGEX_ASSIGNMENT = re.compile(r"(?:^|\s)([A-Za-z_][A-Za-z0-9_]*)=")
+
+# references like `$VAR`, `${VAR}`, `${VAR:-default}` or `${{ env.VAR }}`
+REGEX_REFERENCE = re.compile(
+    r"\$(?:\{\{\s*env\.([A-Za-z_][A-Za-z0-9_]*)\s*\}\}"
+    r"|\{([A-Za-z_][A-Za-z0-9_]*)(?:[:?+\-=][^}]*)?\}"
+    r"|([A-Za-z_][A-Za-z0-9_]*))"
+)
+
+
+class EnvVarLinker(Linker):
+    """
+    Environment variable Linker.
+
+    Definitions of environment variables, e.g. in Dockerfiles, docker-compose
+    files, `.env` files and CI pipelines, are collected in a symbol table.
+    Values that reference a variable, like `${DB_PORT}`, are linked to all
+    definitions of the variable with one lookup per reference. References
+    to the same variable are not linked with each other.
+    """
+
+    name: str = "environment"
+
+    def __init__(self):
+        super().__init__()
+        self._definitions: Dict[str, List[ValueNode]] = {}
+
+    def create_links(self) -> None:
+        self._definitions = self._find_definitions()
+        self.target_nodes = self._find_target_nodes()
+
+        # references are linked to definitions, not to other references
+        for node in self.target_nodes:
+            for definition in self._find_matches(node):
+                self._add_link(node, definition)
+
+    def _find_target_nodes(self):
+        return [node for node in self._get_value_nodes() if "$" in node.name]
+
+    def _find_definitions(self) -> Dict[str, List[ValueNode]]:
+        """Build the symbol table of all variable definitions."""
+        definitions: Dict[str, List[ValueNode]] = defaultdict(list)
+        for artifact in self.network.get_nodes(ArtifactNode):
+            if artifact.concept_name in ENV_CONCEPTS:
+                blocks = [artifact]
+            else:
+                blocks = [
+                    option
+                    for option in artifact.get_nodes(node_type=OptionNode)
+                    if option.name in ENV_BLOCKS
+                ]
+
+            for block in blocks:
+                for variable, node in self._get_definitions(block):
+                    definitions[variable].append(node)
+        return definitions
+
+    def _get_definitions(self, block: Node) -> Iterator:
+        """
+        Find the variables that are defined in the children of a block.
+
+        :param block: Env block or artifact of an env concept
+        :return: Iterator over variable names and defining value nodes
+        """
+        # name of a variable defined by `name` and `value` options,
+        # e.g. in Kubernetes
+        pending: Optional[str] = None
+        for child in block.children:
+            if isinstance(child, ValueNode):
+                for variable in REGEX_ASSIGNMENT.findall(child.name):
+                    yield variable, child
+                continue
+
+            # skip the option holding the path of the artifact
+            if not isinstance(child, OptionNode) or (
+                child.location == "file_path"
+            ):
+                continue
+
+            values = [
+                node for node in child.children if isinstance(node, ValueNode)
+            ]
+            if child.name == "name" and values:
+                pending = values[0].name
+            elif child.name == "value" and pending is not None:
+                if REGEX_VARIABLE.fullmatch(pending):
+                    for value in values:
+                        yield pending, value
+                pending = None
+            elif child.name in NESTED_ENV_BLOCKS:
+                yield from self._get_definitions(child)
+            elif REGEX_VARIABLE.fullmatch(child.name):
+                for value in values:
+                    yield child.name, value
+
+    @staticmethod
+    def get_references(value: str) -> List[str]:
+        """
+        Return the names of all variables referenced in a value.
+
+        :param value: Value that may contain references
+        :return: Names of the referenced variables
+        """
+        return [
+            next(name for name in match if name)
+            for match in REGEX_REFERENCE.findall(value)
+        ]
+
+    def _find_matches(self, node: ValueNode) -> List[ValueNode]:
+        matches = []
+        for variable in dict.fromkeys(self.get_references(node.name)):
+            for definition in self._definitions.get(variable, []):
+                if definition is not node and (
+                    self.enable_internal_links
+                    or get_artifact_id(node.id)
+                    != get_artifact_id(definition.id)
+                ):
+                    matches.append(definition)
+        return matches
+
+    def _check_config_types(
+        self, node_a: ValueNode, node_b: ValueNode
+    ) -> bool:
+        # references link values of any type, e.g. a port and an URL
+        return True
@@ -12,68 +12,77 @@
 #
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
-from typing import List
+from collections import defaultdict
+from typing import Dict, List
 
+from cfgnet.config_types.config_types import ConfigType
 from cfgnet.network.nodes import ValueNode
 from cfgnet.linker.linker import Linker
+from cfgnet.linker.link_group import get_artifact_id
 
 
 class EqualityLinker(Linker):
-    """Equality-based Linker."""
+    """
+    Equality-based Linker.
+
+    Value nodes with equal names and config types are linked as one group,
+    which hashes each node once instead of comparing all pairs of nodes.
+    """
 
     name: str = "equality"
 
+    def __init__(self):
+        super().__init__()
+        self._nodes_by_name: Dict[str, List[ValueNode]] = {}
+
     def create_links(self) -> None:
         self.target_nodes = self._find_target_nodes()
 
+        self._nodes_by_name = defaultdict(list)
         for node in self.target_nodes:
             if not node.name:
-                return
+                continue
 
             # discard words from static blacklist
             if self.network:
                 if self.network.cfg.enable_static_blacklist:
                     if node.name in self.static_blacklist.values:
-                        return
+                        continue
+
+            self._nodes_by_name[node.name].append(node)
 
-            # find all matches with the given linker criterion
-            matches = self._find_matches(node)
+        for nodes in self._nodes_by_name.values():
+            if self.stop_value_filter:
+                nodes = self.stop_value_filter.filter(nodes)
+            if len(nodes) < 2:
+                continue
 
-            # add link for all matches
-            for match in matches:
-                # check config types before creating a link
-                if self._check_config_types(node, match):
-                    self._add_link(node, match)
+            # nodes are only linked to nodes of the same config type
+            groups: Dict[ConfigType, List[ValueNode]] = defaultdict(list)
+            for node in nodes:
+                groups[node.config_type].append(node)
+
+            for group in groups.values():
+                if len(group) > 1:
+                    self._add_link_group(group)
 
     def _find_target_nodes(self):
         return [
             node
-            for node in self.network.get_nodes(ValueNode)
+            for node in self._get_value_nodes()
             if not self.inferer.is_boolean(node.name)
         ]
 
     def _find_matches(self, node: ValueNode) -> List[ValueNode]:
-        target_nodes = self._filter_target_nodes(node)
-
         return [
             value_node
-            for value_node in target_nodes
-            if value_node.name == node.name and node is not value_node
-        ]
-
-    def _filter_target_nodes(self, node) -> List[ValueNode]:
-        """Filter target nodes to avoid links within the same file."""
-        if self.enable_internal_links:
-            return self.target_nodes
-
-        artifact_name = node.id.split("::::")[1]
-
-        return list(
-            filter(
-                lambda x: artifact_name not in x.id.split("::::")[1],
-                self.target_nodes,
+            for value_node in self._nodes_by_name.get(node.name, [])
+            if node is not value_node
+            and (
+                self.enable_internal_links
+                or get_artifact_id(node.id) != get_artifact_id(value_node.id)
             )
-        )
+        ]
 
     def _check_config_types(
         self, node_a: ValueNode, node_b: ValueNode
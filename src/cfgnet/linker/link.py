@@ -13,46 +13,86 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Any, Tuple, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from cfgnet.network.nodes import Node, ArtifactNode, OptionNode, ValueNode
 
+Components = Tuple[ArtifactNode, List[OptionNode]]
+
 
 class Link:
-    """Datastructure for network links between Value or artifact nodes."""
+    """
+    Datastructure for network links between Value or artifact nodes.
+
+    A link is a compact record of its two nodes, ordered by ID, and their
+    precomputed hash. The artifact and option stack of each node are only
+    determined when they are accessed and can be shared between links with
+    the same nodes.
 
+    Parameters
+    ----------
     node_a: ValueNode
-    artifact_a: ArtifactNode
-    option_stack_a: List[OptionNode]
+        Node with the smaller ID.
+    node_b: ValueNode
+        Node with the greater ID.
+    components: Optional[Dict[str, Components]]
+        Artifact and option stack by node ID, shared between links.
+
+    """
+
+    __slots__ = ("node_a", "node_b", "_hash", "_components")
 
+    node_a: ValueNode
     node_b: ValueNode
-    artifact_b: ArtifactNode
-    option_stack_b: List[OptionNode]
 
-    def __init__(self, node_a: ValueNode, node_b: ValueNode):
+    def __init__(
+        self,
+        node_a: ValueNode,
+        node_b: ValueNode,
+        components: Optional[Dict[str, Components]] = None,
+    ):
         if node_b.id < node_a.id:
             node_a, node_b = node_b, node_a
 
         self.node_a = node_a
-        (
-            self.artifact_a,
-            self.option_stack_a,
-        ) = self._determine_components(node_a)
-
         self.node_b = node_b
-        (
-            self.artifact_b,
-            self.option_stack_b,
-        ) = self._determine_components(node_b)
+        # node IDs cache their own hashes, so this only combines them once
+        self._hash: int = hash((node_a.id, node_b.id))
+        self._components: Dict[str, Components] = (
+            components if components is not None else {}
+        )
+
+    @property
+    def artifact_a(self) -> ArtifactNode:
+        return self._get_components(self.node_a)[0]
+
+    @property
+    def option_stack_a(self) -> List[OptionNode]:
+        return self._get_components(self.node_a)[1]
+
+    @property
+    def artifact_b(self) -> ArtifactNode:
+        return self._get_components(self.node_b)[0]
+
+    @property
+    def option_stack_b(self) -> List[OptionNode]:
+        return self._get_components(self.node_b)[1]
+
+    def _get_components(self, node: Node) -> Components:
+        components = self._components.get(node.id)
+        if components is None:
+            components = self._determine_components(node)
+            self._components[node.id] = components
+        return components
 
     @staticmethod
     def _determine_components(
         node: Node,
-    ) -> Tuple[ArtifactNode, List[OptionNode]]:
+    ) -> Components:
         """
         Backtrace parent node information.
 
         :param node: Node to collect information about
-        :return: Concept node, artifact node, option node stack
+        :return: Artifact node, option node stack
         """
         artifact: Optional[ArtifactNode] = None
         option_stack: List[OptionNode] = []
@@ -60,13 +100,14 @@ class Link:
         current: Any = node
         while True:
             if isinstance(current, OptionNode):
-                option_stack.insert(0, current)
+                option_stack.append(current)
             elif isinstance(current, ArtifactNode):
                 artifact = current
                 break
 
             current = current.parent
 
+        option_stack.reverse()
         return artifact, option_stack
 
     def is_node_involved(self, node: Node) -> bool:
@@ -78,12 +119,26 @@ class Link:
         """
         return node in (self.node_a, self.node_b)
 
+    def __getstate__(self):
+        return self.node_a, self.node_b
+
+    def __setstate__(self, state):
+        # links saved before links became compact store their attributes
+        if isinstance(state, dict):
+            state = state["node_a"], state["node_b"]
+        # hashes of strings differ between processes
+        self.__init__(*state)
+
     def __hash__(self):
-        obj_hash = hash("|".join([self.node_a.id, self.node_b.id]))
-        return obj_hash
+        return self._hash
 
     def __eq__(self, other):
-        return self.__hash__() == other.__hash__()
+        return (
+            isinstance(other, Link)
+            and self._hash == other._hash
+            and self.node_a.id == other.node_a.id
+            and self.node_b.id == other.node_b.id
+        )
 
     def __str__(self):
         return f"{self.node_a} <-> {self.node_b}"
@@ -0,0 +1,142 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Groups of value nodes that are linked with each other."""
+
+from collections import Counter
+from itertools import combinations
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from cfgnet.linker.link import Components, Link
+from cfgnet.network.nodes import ValueNode
+
+
+def get_artifact_id(node_id: str) -> str:
+    """Return the part of a node ID that names the artifact of the node."""
+    return node_id.split("::::", 2)[1]
+
+
+class LinkGroup:
+    """
+    Value nodes of which each is linked to all others (a hyperedge).
+
+    A group of k nodes stands for up to k * (k - 1) / 2 links, but only
+    stores the k nodes. Links between nodes of the same artifact are only
+    part of the group if internal links are enabled. Nodes may also be
+    partitioned by their names, so that only nodes with different names,
+    e.g. `512m` and `536870912`, are linked. The links are created on
+    demand.
+
+    Parameters
+    ----------
+    nodes: List[ValueNode]
+        Linked value nodes, sorted by ID.
+    enable_internal_links: bool
+        Link nodes of the same artifact.
+    link_equal_names: bool
+        Link nodes with the same name.
+
+    """
+
+    # groups saved before the partition by names link all names
+    link_equal_names: bool = True
+
+    def __init__(
+        self,
+        nodes: Iterable[ValueNode],
+        enable_internal_links: bool = False,
+        link_equal_names: bool = True,
+    ) -> None:
+        self.nodes: List[ValueNode] = sorted(nodes, key=lambda node: node.id)
+        self.enable_internal_links: bool = enable_internal_links
+        self.link_equal_names = link_equal_names
+        self._node_ids: Counter = Counter(node.id for node in self.nodes)
+        self._key: Tuple = (
+            tuple(node.id for node in self.nodes),
+            enable_internal_links,
+            link_equal_names,
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[ValueNode]:
+        return iter(self.nodes)
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __eq__(self, other):
+        return isinstance(other, LinkGroup) and self._key == other._key
+
+    def __str__(self):
+        return " <-> ".join(str(node) for node in self.nodes)
+
+    def _is_linked(self, node_a: ValueNode, node_b: ValueNode) -> bool:
+        if not self.link_equal_names and node_a.name == node_b.name:
+            return False
+        return self.enable_internal_links or get_artifact_id(
+            node_a.id
+        ) != get_artifact_id(node_b.id)
+
+    def links(self) -> Iterator[Link]:
+        """Create the links between all nodes of the group."""
+        # links of the group share the parent nodes of their value nodes
+        components: Dict[str, Components] = {}
+        for node_a, node_b in combinations(self.nodes, 2):
+            if self._is_linked(node_a, node_b):
+                yield Link(node_a, node_b, components)
+
+    def count_links(self) -> int:
+        """Return the number of links without creating them."""
+        count = len(self.nodes) * (len(self.nodes) - 1) // 2
+        # pairs of the same artifact and of the same name are excluded,
+        # pairs that are both were excluded twice
+        if not self.enable_internal_links:
+            count -= self._count_pairs(
+                Counter(get_artifact_id(node.id) for node in self.nodes)
+            )
+        if not self.link_equal_names:
+            count -= self._count_pairs(
+                Counter(node.name for node in self.nodes)
+            )
+        if not self.enable_internal_links and not self.link_equal_names:
+            count += self._count_pairs(
+                Counter(
+                    (get_artifact_id(node.id), node.name)
+                    for node in self.nodes
+                )
+            )
+        return count
+
+    @staticmethod
+    def _count_pairs(sizes: Counter) -> int:
+        """Return the number of pairs within each part of a partition."""
+        return sum(size * (size - 1) // 2 for size in sizes.values())
+
+    def has_link(self, link: Link) -> bool:
+        """
+        Check if the group contains a link.
+
+        :param link: link between two value nodes
+        :return: true if both nodes of the link are linked by the group
+        """
+        id_a, id_b = link.node_a.id, link.node_b.id
+        if id_a == id_b:
+            if self._node_ids[id_a] < 2:
+                return False
+        elif id_a not in self._node_ids or id_b not in self._node_ids:
+            return False
+        return self._is_linked(link.node_a, link.node_b)
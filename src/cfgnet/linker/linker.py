@@ -16,11 +16,13 @@
 """Package for linking nodes."""
 
 import abc
-from typing import List, Optional, TYPE_CHECKING
-from cfgnet.linker.link import Link
+from typing import FrozenSet, Iterable, List, Optional, TYPE_CHECKING
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.link_group import LinkGroup
 from cfgnet.linker.static_blacklist import StaticBlackList
+from cfgnet.linker.stop_values import StopValueFilter
 from cfgnet.network.nodes import ValueNode
-from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
+from cfgnet.config_types.config_type_inferer import INFERER
 
 if TYPE_CHECKING:
     from cfgnet.network.network import Network
@@ -30,13 +32,30 @@ class Linker(abc.ABC):
     """Helper class for establishing links while constructing a network."""
 
     name: str = ""
+    # config types of the nodes that the linker links, None for all types
+    config_types: Optional[FrozenSet[ConfigType]] = None
 
     def __init__(self):
         self.network: Optional["Network"] = None
         self.enable_internal_links: Optional[bool] = None
         self.target_nodes: List = None
         self.static_blacklist = StaticBlackList()
-        self.inferer = ConfigTypeInferer()
+        self.stop_value_filter: Optional[StopValueFilter] = None
+        # value nodes of the config types of the linker, set while linking
+        self.value_nodes: Optional[List[ValueNode]] = None
+        self.inferer = INFERER
+
+    def _get_value_nodes(self) -> List[ValueNode]:
+        """Return the value nodes of the config types of the linker."""
+        if self.value_nodes is not None:
+            return self.value_nodes
+
+        return [
+            node
+            for node in self.network.get_nodes(ValueNode)
+            if self.config_types is None
+            or node.config_type in self.config_types
+        ]
 
     @abc.abstractmethod
     def create_links(self) -> None:
@@ -70,6 +89,29 @@ class Linker(abc.ABC):
         :param node_b: Second node to be linked to the first.
         :return: None
         """
-        link = Link(node_a, node_b)
         if self.network:
-            self.network.links.add(link)
+            self.network.add_link_group(
+                LinkGroup((node_a, node_b), enable_internal_links=True)
+            )
+
+    def _add_link_group(
+        self, nodes: Iterable[ValueNode], link_equal_names: bool = True
+    ):
+        """
+        Establish links between all of the given nodes.
+
+        Nodes of the same artifact are only linked if internal links are
+        enabled.
+
+        :param nodes: Nodes to be linked to each other.
+        :param link_equal_names: Link nodes with the same name, otherwise
+            they are left to the equality linker.
+        :return: None
+        """
+        group = LinkGroup(
+            nodes,
+            enable_internal_links=bool(self.enable_internal_links),
+            link_equal_names=link_equal_names,
+        )
+        if self.network and group.count_links():
+            self.network.add_link_group(group)
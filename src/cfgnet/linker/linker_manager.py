@@ -13,10 +13,18 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Iterable, TYPE_CHECKING
+from collections import defaultdict
+from typing import Dict, List, Iterable, Optional, TYPE_CHECKING
+
+from cfgnet.config_types.config_types import ConfigType
 
 from cfgnet.linker.linker import Linker
 from cfgnet.linker.equality_linker import EqualityLinker
+from cfgnet.linker.env_var_linker import EnvVarLinker
+from cfgnet.linker.path_linker import PathLinker
+from cfgnet.linker.stop_values import StopValueFilter
+from cfgnet.linker.unit_linker import UnitLinker
+from cfgnet.network.nodes import ArtifactNode, ValueNode
 
 if TYPE_CHECKING:
     from cfgnet.network.network import Network
@@ -25,29 +33,124 @@ if TYPE_CHECKING:
 class LinkerManager:
     """Manager for linker implementations."""
 
-    all_linkers: List[Linker] = [EqualityLinker()]
+    all_linkers: List[Linker] = [
+        EqualityLinker(),
+        UnitLinker(),
+        PathLinker(),
+        EnvVarLinker(),
+    ]
     enabled_linkers: List[Linker] = []
 
     @staticmethod
     def apply_linkers(network: "Network") -> None:
         """
-        Apply all existing linker to create links in the configuration network.
+        Apply the enabled linkers to create links in the configuration network.
+
+        The value nodes are collected once and sharded by config type, so
+        each linker only visits the nodes of the config types it links.
+        Disabled linkers are not run at all.
 
         :param: Configuration network
         """
-        for linker in LinkerManager.all_linkers:
+        linkers = LinkerManager.get_enabled_linkers(
+            network.cfg.enabled_linkers
+        )
+        if not linkers:
+            return
+
+        value_nodes = network.get_nodes(node_type=ValueNode)
+        shards = LinkerManager.shard_by_config_type(value_nodes)
+        stop_value_filter = LinkerManager.find_stop_values(
+            network, value_nodes
+        )
+
+        for linker in linkers:
             linker.network = network
             linker.enable_internal_links = network.cfg.enable_internal_links
-            linker.create_links()
+            linker.stop_value_filter = stop_value_filter
+            if linker.config_types is None:
+                linker.value_nodes = value_nodes
+            else:
+                linker.value_nodes = [
+                    node
+                    for config_type in linker.config_types
+                    for node in shards.get(config_type, [])
+                ]
+            try:
+                linker.create_links()
+            finally:
+                linker.value_nodes = None
 
     @staticmethod
-    def get_linker_names() -> List[str]:
-        return [linker.name for linker in LinkerManager.all_linkers]
+    def get_enabled_linkers(
+        linker_names: Optional[Iterable[str]],
+    ) -> List[Linker]:
+        """
+        Return the linkers with the given names.
 
-    @staticmethod
-    def set_enabled_linkers(linker_names: Iterable[str]) -> None:
-        LinkerManager.enabled_linkers = [
+        :param linker_names: Names of enabled linkers or None for all linkers
+        :return: Enabled linkers in the order of all linkers
+        """
+        if linker_names is None:
+            return list(LinkerManager.all_linkers)
+
+        linker_names = set(linker_names)
+        return [
             linker
             for linker in LinkerManager.all_linkers
             if linker.name in linker_names
         ]
+
+    @staticmethod
+    def shard_by_config_type(
+        value_nodes: Iterable[ValueNode],
+    ) -> Dict[ConfigType, List[ValueNode]]:
+        """
+        Split value nodes by their config type.
+
+        :param value_nodes: Value nodes of a network
+        :return: Value nodes by config type, in the order of the input
+        """
+        shards: Dict[ConfigType, List[ValueNode]] = defaultdict(list)
+        for node in value_nodes:
+            shards[node.config_type].append(node)
+        return shards
+
+    @staticmethod
+    def find_stop_values(
+        network: "Network", value_nodes: List[ValueNode]
+    ) -> Optional[StopValueFilter]:
+        """
+        Find the values that are too frequent to be linked.
+
+        :param network: Configuration network
+        :param value_nodes: Value nodes of the network
+        :return: Filter of stop values or None if they are disabled
+        """
+        cfg = network.cfg
+        if not cfg.enable_stop_values:
+            return None
+
+        stop_value_filter = StopValueFilter(
+            max_nodes=cfg.stop_value_max_nodes,
+            max_artifact_share=cfg.stop_value_max_artifact_share,
+            cap=cfg.cap_stop_values,
+        )
+        stop_value_filter.load(cfg.stopvalues_path())
+        stop_value_filter.analyze(
+            value_nodes, len(network.get_nodes(node_type=ArtifactNode))
+        )
+        stop_value_filter.report()
+        if cfg.save_stop_values:
+            stop_value_filter.save(cfg.stopvalues_path())
+        return stop_value_filter
+
+    @staticmethod
+    def get_linker_names() -> List[str]:
+        return [linker.name for linker in LinkerManager.all_linkers]
+
+    @staticmethod
+    def set_enabled_linkers(linker_names: Iterable[str]) -> None:
+        LinkerManager.enabled_linkers = LinkerManager.get_enabled_linkers(
+            linker_names
+        )
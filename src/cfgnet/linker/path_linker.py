@@ -0,0 +1,200 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import posixpath
+
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.network.nodes import ValueNode
+from cfgnet.linker.linker import Linker
+from cfgnet.linker.link_group import get_artifact_id
+
+# values with these parts are patterns, variables or URLs, not paths
+NON_PATH_PARTS = ("://", "$", "*", "?", "{", "}", "%", "\n")
+
+
+class PathTrieNode:
+    """Node of a path trie, reached by the reversed components of paths."""
+
+    __slots__ = ("children", "path", "count", "sample")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, PathTrieNode] = {}
+        # path that ends at this node
+        self.path: Optional[str] = None
+        # number of paths that end at this node or below and one of them
+        self.count: int = 0
+        self.sample: Optional[str] = None
+
+
+class PathTrie:
+    """
+    Trie over the reversed components of paths.
+
+    Paths that refer to the same file often differ in their leading parts,
+    e.g. `config/app.yml`, `../config/app.yml` and `/srv/config/app.yml`.
+    Walking the trie along the components of a path from its file name
+    upwards finds the stored path with the longest common suffix in time
+    linear in the number of components.
+    """
+
+    def __init__(self) -> None:
+        self.root: PathTrieNode = PathTrieNode()
+
+    def insert(self, path: str) -> None:
+        """Insert a normalized path."""
+        node = self.root
+        node.count += 1
+        node.sample = path
+        for component in reversed(path.split("/")):
+            node = node.children.setdefault(component, PathTrieNode())
+            node.count += 1
+            node.sample = path
+        node.path = path
+
+    def find(self, path: str) -> Optional[str]:
+        """
+        Find the stored path that a normalized path refers to.
+
+        A stored path matches if it is the path itself, if the path is a
+        suffix of only this stored path, or if the stored path is the
+        longest stored suffix of the path.
+
+        :param path: Normalized path
+        :return: Matching stored path or None
+        """
+        node = self.root
+        longest_suffix = None
+        for component in reversed(path.split("/")):
+            node = node.children.get(component)
+            if node is None:
+                return longest_suffix
+            if node.path is not None:
+                longest_suffix = node.path
+
+        if node.path is not None:
+            return node.path
+        if node.count == 1:
+            return node.sample
+        return longest_suffix
+
+
+class PathLinker(Linker):
+    """
+    Path-aware Linker.
+
+    Values of type PATH are normalized and resolved against the directory
+    of their artifact. A value that refers to a tracked artifact is linked
+    to the path of this artifact, and values that refer to the same path
+    are linked with each other, although they are written differently,
+    e.g. `./.env` in a docker-compose file and `.env`. Identical values are
+    left to the equality linker.
+    """
+
+    name: str = "path"
+    config_types = frozenset((ConfigType.PATH,))
+
+    def __init__(self):
+        super().__init__()
+        self._nodes_by_path: Dict[str, List[ValueNode]] = {}
+        self._artifact_paths: PathTrie = PathTrie()
+
+    def create_links(self) -> None:
+        self.target_nodes = self._find_target_nodes()
+
+        self._artifact_paths = PathTrie()
+        for node in self.target_nodes:
+            if self._is_artifact_path(node):
+                self._artifact_paths.insert(posixpath.normpath(node.name))
+
+        self._nodes_by_path = defaultdict(list)
+        for node in self.target_nodes:
+            path = self._resolve(node)
+            if path is not None:
+                self._nodes_by_path[path].append(node)
+
+        for nodes in self._nodes_by_path.values():
+            # identical values are left to the equality linker
+            self._add_link_group(nodes, link_equal_names=False)
+
+    def _find_target_nodes(self):
+        return [
+            node
+            for node in self._get_value_nodes()
+            if node.name
+            and not (
+                self.stop_value_filter
+                and self.stop_value_filter.is_stop_value(node.name)
+            )
+        ]
+
+    @staticmethod
+    def _is_artifact_path(node: ValueNode) -> bool:
+        """Return true if the node holds the path of its artifact."""
+        return node.parent.location == "file_path"
+
+    @staticmethod
+    def normalize(value: str, base_dir: str) -> Optional[str]:
+        """
+        Normalize a path and resolve it against a directory.
+
+        :param value: Value of type PATH
+        :param base_dir: Directory of relative paths within the project
+        :return: Normalized path or None if the value is not a plain path
+        """
+        value = value.strip().strip("\"'").replace("\\", "/")
+        if not value or any(part in value for part in NON_PATH_PARTS):
+            return None
+
+        if not posixpath.isabs(value):
+            value = posixpath.join(base_dir, value)
+
+        path = posixpath.normpath(value)
+        if path in (".", "/"):
+            return None
+        return path
+
+    def _resolve(self, node: ValueNode) -> Optional[str]:
+        """Return the path that a node refers to."""
+        artifact_path = get_artifact_id(node.id)
+        if self._is_artifact_path(node):
+            return posixpath.normpath(artifact_path)
+
+        path = self.normalize(node.name, posixpath.dirname(artifact_path))
+        if path is None:
+            return None
+
+        return self._artifact_paths.find(path) or path
+
+    def _find_matches(self, node: ValueNode) -> List[ValueNode]:
+        path = self._resolve(node)
+        if path is None:
+            return []
+
+        return [
+            value_node
+            for value_node in self._nodes_by_path.get(path, [])
+            if node.name != value_node.name
+            and (
+                self.enable_internal_links
+                or get_artifact_id(node.id) != get_artifact_id(value_node.id)
+            )
+        ]
+
+    def _check_config_types(
+        self, node_a: ValueNode, node_b: ValueNode
+    ) -> bool:
+        return node_a.config_type == node_b.config_type == ConfigType.PATH
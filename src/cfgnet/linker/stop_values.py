@@ -0,0 +1,203 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Frequency-based suppression of values that are too common to link."""
+
+import logging
+import os
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set
+
+from cfgnet.linker.link_group import get_artifact_id
+from cfgnet.network.nodes import ValueNode
+
+
+@dataclass(frozen=True)
+class StopValue:
+    """
+    Value that is suppressed before linking.
+
+    Parameters
+    ----------
+    value: str
+        Name of the value nodes.
+    nodes: int
+        Number of value nodes with this value.
+    artifacts: int
+        Number of artifacts that contain the value.
+    learned: bool
+        True if the value was read from the persisted stop list.
+
+    """
+
+    value: str
+    nodes: int
+    artifacts: int
+    learned: bool = False
+
+
+class StopValueFilter:
+    """
+    Finds values that occur in too many places to be meaningful links.
+
+    Values like `latest`, `0.0.0.0` or `utf-8` appear in most artifacts of a
+    project and link otherwise unrelated options. A value is a stop value if
+    more than `max_nodes` value nodes have it or if it is spread over more
+    than `max_artifact_share` of all artifacts. The share is only applied to
+    networks with at least `min_artifacts` artifacts, since every value of a
+    small project is spread over a large share of its artifacts.
+
+    Stop values are either dropped from linking or capped to their first
+    `max_nodes` nodes. Stop values can be persisted per project, so later
+    runs suppress them even if they are less frequent in a commit.
+
+    Parameters
+    ----------
+    max_nodes: int
+        Maximum number of value nodes with the same value.
+    max_artifact_share: float
+        Maximum share of artifacts that contain the same value.
+    min_artifacts: int
+        Minimum number of artifacts to apply the artifact share.
+    cap: bool
+        Link the first nodes of stop values instead of dropping them.
+
+    """
+
+    def __init__(
+        self,
+        max_nodes: int = 100,
+        max_artifact_share: float = 0.5,
+        min_artifacts: int = 10,
+        cap: bool = False,
+    ) -> None:
+        self.max_nodes: int = max_nodes
+        self.max_artifact_share: float = max_artifact_share
+        self.min_artifacts: int = min_artifacts
+        self.cap: bool = cap
+        self.learned_values: Set[str] = set()
+        self.suppressed: Dict[str, StopValue] = {}
+
+    def analyze(
+        self, value_nodes: Iterable[ValueNode], num_artifacts: int
+    ) -> Dict[str, StopValue]:
+        """
+        Compute the stop values of a network.
+
+        :param value_nodes: All value nodes of the network
+        :param num_artifacts: Number of artifacts of the network
+        :return: Suppressed values by value
+        """
+        nodes: Dict[str, int] = defaultdict(int)
+        artifacts: Dict[str, Set[str]] = defaultdict(set)
+        for node in value_nodes:
+            nodes[node.name] += 1
+            artifacts[node.name].add(get_artifact_id(node.id))
+
+        max_artifacts = num_artifacts
+        if num_artifacts >= self.min_artifacts:
+            max_artifacts = int(num_artifacts * self.max_artifact_share)
+
+        self.suppressed = {}
+        for value, count in nodes.items():
+            spread = len(artifacts[value])
+            learned = value in self.learned_values
+            if learned or count > self.max_nodes or spread > max_artifacts:
+                self.suppressed[value] = StopValue(
+                    value, count, spread, learned
+                )
+
+        return self.suppressed
+
+    def is_stop_value(self, value: str) -> bool:
+        """Return true if a value is suppressed."""
+        return value in self.suppressed
+
+    def filter(self, nodes: List[ValueNode]) -> List[ValueNode]:
+        """
+        Filter value nodes with equal values before they are linked.
+
+        :param nodes: Value nodes with the same value
+        :return: Nodes that may be linked
+        """
+        if not nodes or not self.is_stop_value(nodes[0].name):
+            return nodes
+        if self.cap:
+            return sorted(nodes, key=lambda node: node.id)[: self.max_nodes]
+        return []
+
+    def report(self) -> None:
+        """Log the suppressed values, most frequent values first."""
+        if not self.suppressed:
+            return
+
+        action = "Capped" if self.cap else "Dropped"
+        logging.info(
+            "%s %d stop values before linking.", action, len(self.suppressed)
+        )
+        for stop_value in sorted(
+            self.suppressed.values(),
+            key=lambda stop_value: (-stop_value.nodes, stop_value.value),
+        ):
+            logging.debug(
+                'Stop value "%s": %d nodes in %d artifacts%s.',
+                stop_value.value,
+                stop_value.nodes,
+                stop_value.artifacts,
+                " (learned)" if stop_value.learned else "",
+            )
+
+    def load(self, stopvalues_path: str) -> None:
+        """
+        Read the persisted stop values of a project.
+
+        :param stopvalues_path: File with one stop value per line
+        """
+        self.learned_values = set()
+        if not os.path.exists(stopvalues_path):
+            return
+
+        try:
+            with open(stopvalues_path, "r", encoding="utf-8") as stopvalues:
+                self.learned_values.update(
+                    line for line in stopvalues.read().splitlines() if line
+                )
+        except OSError as error:
+            logging.error(
+                "Couldn't read stop values '%s': %s", stopvalues_path, error
+            )
+
+    def save(self, stopvalues_path: str) -> None:
+        """
+        Persist the stop values of a project for later runs.
+
+        :param stopvalues_path: File with one stop value per line
+        """
+        values = self.learned_values | set(self.suppressed)
+        # values containing line breaks cannot be persisted line by line
+        values = {value for value in values if value.splitlines() == [value]}
+        if values == self.learned_values and os.path.exists(stopvalues_path):
+            return
+
+        try:
+            with open(stopvalues_path, "w", encoding="utf-8") as stopvalues:
+                stopvalues.writelines(f"{value}\n" for value in sorted(values))
+            self.learned_values = values
+        except OSError as error:
+            logging.error(
+                "Couldn't write stop values '%s': %s", stopvalues_path, error
+            )
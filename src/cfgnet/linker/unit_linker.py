@@ -0,0 +1,97 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+from collections import defaultdict
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.units import (
+    UNITS,
+    get_option_unit,
+    to_canonical_unit,
+)
+from cfgnet.network.nodes import ValueNode
+from cfgnet.linker.linker import Linker
+from cfgnet.linker.link_group import get_artifact_id
+
+CanonicalKey = Tuple[ConfigType, Fraction]
+
+
+class UnitLinker(Linker):
+    """
+    Unit-normalizing Linker.
+
+    Sizes, durations and speeds are converted into canonical units, so
+    `512m`, `512MB` and `536870912` are linked, as are `30s` and `30000`.
+    Nodes are indexed by config type and canonical value, which links them
+    in linear time. Only quantities that are written differently are
+    linked, identical values are left to the equality linker.
+    """
+
+    name: str = "unit"
+    config_types = frozenset(UNITS)
+
+    def __init__(self):
+        super().__init__()
+        self._nodes_by_key: Dict[CanonicalKey, List[ValueNode]] = {}
+
+    def create_links(self) -> None:
+        self.target_nodes = self._find_target_nodes()
+
+        self._nodes_by_key = defaultdict(list)
+        for node in self.target_nodes:
+            key = self._get_key(node)
+            if key is not None:
+                self._nodes_by_key[key].append(node)
+
+        for nodes in self._nodes_by_key.values():
+            # identical values are left to the equality linker
+            self._add_link_group(nodes, link_equal_names=False)
+
+    def _find_target_nodes(self):
+        return [
+            node
+            for node in self._get_value_nodes()
+            if node.name
+            and not (
+                self.stop_value_filter
+                and self.stop_value_filter.is_stop_value(node.name)
+            )
+        ]
+
+    @staticmethod
+    def _get_key(node: ValueNode) -> Optional[CanonicalKey]:
+        default_unit = get_option_unit(node.parent.name)
+        value = to_canonical_unit(node.config_type, node.name, default_unit)
+        if value is None:
+            return None
+        return node.config_type, value
+
+    def _find_matches(self, node: ValueNode) -> List[ValueNode]:
+        return [
+            value_node
+            for value_node in self._nodes_by_key.get(self._get_key(node), [])
+            if node is not value_node
+            and node.name != value_node.name
+            and (
+                self.enable_internal_links
+                or get_artifact_id(node.id) != get_artifact_id(value_node.id)
+            )
+        ]
+
+    def _check_config_types(
+        self, node_a: ValueNode, node_b: ValueNode
+    ) -> bool:
+        return node_a.config_type == node_b.config_type
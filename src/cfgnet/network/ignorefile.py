@@ -17,7 +17,7 @@ import platform
 import pathlib
 import logging
 import os
-from typing import Iterable, Set
+from typing import Iterable, Optional, Set
 
 
 class IgnoreFile:
@@ -35,9 +35,21 @@ class IgnoreFile:
     system = platform.system()
 
     @staticmethod
-    def configure(ignorefile_path: str):
+    def configure(ignorefile_path: str, content: Optional[bytes] = None):
+        """
+        Read the ignored patterns.
+
+        :param ignorefile_path: Path of the ignorefile
+        :param content: Content of the ignorefile, e.g. from a git blob,
+            read from the ignorefile path if not given
+        """
         IgnoreFile.ignored_globs = set()
-        if os.path.exists(ignorefile_path):
+        if content is not None:
+            logging.debug("Ignorefile given for %s", ignorefile_path)
+            IgnoreFile.ignored_globs.update(
+                content.decode("utf-8", "replace").splitlines()
+            )
+        elif os.path.exists(ignorefile_path):
             logging.debug("Ignorefile found at %s", ignorefile_path)
             try:
                 with open(
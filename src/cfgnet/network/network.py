@@ -24,8 +24,16 @@ import pickle
 from typing import List, Set, Any, Optional, Callable, Tuple, Dict
 from collections import defaultdict
 from cfgnet.vcs.git import Git
+from cfgnet.config_types.config_type_inferer import INFERER
 from cfgnet.plugins.plugin_manager import PluginManager
+from cfgnet.plugins.file_content import (
+    CommitSource,
+    FileContent,
+    WorkingTreeSource,
+)
 from cfgnet.linker.linker_manager import LinkerManager
+from cfgnet.linker.link import Link
+from cfgnet.linker.link_group import LinkGroup
 from cfgnet.conflicts.conflict_detector import ConflictDetector
 from cfgnet.network.ignorefile import IgnoreFile
 from cfgnet.network.nodes import (
@@ -53,7 +61,11 @@ class Network:
         self.root.network = self
         self.project_root: str = root.root_dir
 
-        self.links: Set = set()
+        self.link_groups: Set[LinkGroup] = set()
+        # files that artifacts reference, e.g. includes or parent POMs
+        self.dependencies: Set[str] = set()
+        # link groups by the IDs of their nodes, built on demand
+        self._link_index: Optional[Dict[str, List[LinkGroup]]] = None
 
         self.nodes = defaultdict(list)
         self.nodes[self.root.id].append(self.root)
@@ -63,6 +75,79 @@ class Network:
 
         IgnoreFile.configure(cfg.ignorefile_path())
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_link_index"] = None
+        return state
+
+    def __setstate__(self, state):
+        # networks saved before links were grouped store a set of links
+        links = state.pop("links", None)
+        if "link_groups" not in state:
+            state["link_groups"] = {
+                LinkGroup((link.node_a, link.node_b), True)
+                for link in links or ()
+            }
+        state.setdefault("_link_index", None)
+        state.setdefault("dependencies", set())
+        self.__dict__.update(state)
+
+    @property
+    def links(self) -> Set[Link]:
+        """
+        Return the links of all link groups.
+
+        The links are created on each call. Prefer the link groups or the
+        link queries of the network for large networks.
+        """
+        return {link for group in self.link_groups for link in group.links()}
+
+    def add_link_group(self, group: LinkGroup) -> None:
+        """
+        Add a group of linked value nodes to the network.
+
+        :param group: Group of linked value nodes
+        """
+        self.link_groups.add(group)
+        self._link_index = None
+
+    def has_link(self, link: Link) -> bool:
+        """
+        Check if the network contains a link.
+
+        :param link: Link between two value nodes
+        :return: True if a link group of the network contains the link
+        """
+        if self._link_index is None:
+            self._link_index = defaultdict(list)
+            for group in self.link_groups:
+                for node_id in {node.id for node in group}:
+                    self._link_index[node_id].append(group)
+
+        return any(
+            group.has_link(link)
+            for group in self._link_index.get(link.node_a.id, ())
+        )
+
+    def find_missing_links(self, other: Network) -> Set[Link]:
+        """
+        Find the links of this network that the other network lacks.
+
+        Groups that exist unchanged in the other network are skipped as a
+        whole, so only the links of changed groups are created.
+
+        :param other: Network to compare with
+        :return: Links missing in the other network
+        """
+        missing_links: Set[Link] = set()
+        for group in self.link_groups:
+            if group in other.link_groups:
+                continue
+            for link in group.links():
+                if not other.has_link(link):
+                    missing_links.add(link)
+        return missing_links
+
     def find_artifact_node(self, node: Node) -> Optional[ArtifactNode]:
         """
         Find instance of the given node with the same ID.
@@ -278,15 +363,46 @@ class Network:
             return pickle.load(pickle_file)
 
     @staticmethod
-    def init_network(cfg: NetworkConfiguration) -> Network:
+    def init_network(
+        cfg: NetworkConfiguration,
+        commit: Optional[str] = None,
+        repo: Optional[Git] = None,
+    ) -> Network:
         """
         Initialize a configuration network.
 
+        By default the network is built from the working tree. If a commit
+        is given, the files tracked at that commit are parsed directly from
+        their git blobs, so the commit does not have to be checked out.
+
         :param cfg: network configuration
+        :param commit: commit whose files are parsed instead of the working tree
+        :param repo: repository of the project, opened if not given
         :return: configuration network
         """
-        repo = Git(project_root=cfg.project_root_abs)
-        tracked_files: Set[str] = set(repo.get_tracked_files())
+        if repo is None:
+            repo = Git(project_root=cfg.project_root_abs)
+        config_file_filter = PluginManager.get_config_file_filter(
+            cfg.project_root_abs, cfg.enable_file_type_plugins
+        )
+
+        # blob ids of the files at the given commit
+        blobs: Dict[str, str] = {}
+        source: Optional[CommitSource] = None
+        if commit is None:
+            tracked_files: Set[str] = set(
+                repo.get_tracked_files(file_filter=config_file_filter)
+            )
+        else:
+            blobs = dict(
+                repo.get_object_reader().list_blobs(
+                    commit, file_filter=config_file_filter
+                )
+            )
+            tracked_files = set(blobs)
+            source = CommitSource(
+                repo.get_object_reader(), commit, cfg.project_root_abs, blobs
+            )
 
         if cfg.config_files:
             tracked_files.update(cfg.config_files)
@@ -297,8 +413,19 @@ class Network:
 
         project_name = cfg.project_name()
         root = ProjectNode(name=project_name, root_dir=cfg.project_root_abs)
+        # files of the working tree only load files within the project
+        working_tree = WorkingTreeSource(cfg.project_root_abs)
         network = Network(project_name=project_name, root=root, cfg=cfg)
 
+        if commit is not None:
+            # a checkout would replace the ignorefile if it is tracked
+            ignorefile = repo.get_object_reader().read_blob(
+                commit,
+                os.path.relpath(cfg.ignorefile_path(), cfg.project_root_abs),
+            )
+            if ignorefile is not None:
+                IgnoreFile.configure(cfg.ignorefile_path(), ignorefile)
+
         tracked_files = IgnoreFile.filter(tracked_files)
         concept_plugins = PluginManager.get_concept_plugins()
         file_type_plugins = PluginManager.get_file_type_plugins()
@@ -311,47 +438,48 @@ class Network:
 
             abs_file_path = os.path.join(cfg.project_root_abs, file)
 
-            concept_plugin = PluginManager.get_responsible_plugin(
+            plugin = PluginManager.get_responsible_plugin(
                 concept_plugins, abs_file_path
             )
 
-            if concept_plugin:
-                try:
-                    concept_plugin.parse_file(
-                        abs_file_path=abs_file_path,
-                        rel_file_path=file,
-                        root=root,
-                    )
-                except UnicodeDecodeError as error:
-                    logging.warning(
-                        "%s: %s (%s)",
-                        concept_plugin.__class__.__name__,
-                        error.reason,
-                        file,
-                    )
-                continue
-
-            if cfg.enable_file_type_plugins:
-                file_type_plugin = PluginManager.get_responsible_plugin(
+            if not plugin and cfg.enable_file_type_plugins:
+                plugin = PluginManager.get_responsible_plugin(
                     file_type_plugins, abs_file_path
                 )
 
-                if file_type_plugin:
-                    try:
-                        file_type_plugin.parse_file(
-                            abs_file_path=abs_file_path,
-                            rel_file_path=file,
-                            root=root,
-                        )
-                    except UnicodeDecodeError as error:
-                        logging.warning(
-                            "%s: %s (%s)",
-                            file_type_plugin.__class__.__name__,
-                            error.reason,
-                            file,
-                        )
+            if not plugin:
+                continue
+
+            try:
+                # artifacts that were referenced before are not read again
+                if source is not None and source.contains(abs_file_path):
+                    content = source.read(abs_file_path)
+                elif working_tree.contains(abs_file_path):
+                    content = working_tree.read(abs_file_path)
+                else:
+                    # system files may reference other system files
+                    content = FileContent.from_file(abs_file_path)
+
+                # configured files may be missing at the commit
+                if content is None:
                     continue
 
+                plugin.parse_content(
+                    content, rel_file_path=file, root=root, infer_types=False
+                )
+            except UnicodeDecodeError as error:
+                logging.warning(
+                    "%s: %s (%s)",
+                    plugin.__class__.__name__,
+                    error.reason,
+                    file,
+                )
+
+        network.dependencies = (source or working_tree).dependencies
+
+        if cfg.infer_types:
+            INFERER.infer_value_types(network.get_nodes(node_type=ValueNode))
+
         LinkerManager.apply_linkers(network)
 
         return network
@@ -1,7 +1,7 @@
 import os
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 
 
 @dataclass()
@@ -15,9 +15,21 @@ class NetworkConfiguration:
     system_level: bool
     # Path to CfgNet data directory relative to project_root
     cfgnet_path_rel: str = ".cfgnet"
-    # List of names of enabled linkers
-    enabled_linkers: List[str] = field(default_factory=list)
+    # List of names of enabled linkers, None enables all linkers
+    enabled_linkers: Optional[List[str]] = None
     config_files: List[str] = field(default_factory=list)
+    # Infer the types of all values after parsing
+    infer_types: bool = True
+    # Suppress values that are too frequent to be meaningful links
+    enable_stop_values: bool = False
+    # Maximum number of value nodes with the same value
+    stop_value_max_nodes: int = 100
+    # Maximum share of artifacts that contain the same value
+    stop_value_max_artifact_share: float = 0.5
+    # Link the first nodes of stop values instead of dropping them
+    cap_stop_values: bool = False
+    # Persist stop values for later runs
+    save_stop_values: bool = False
 
     def data_dir_path(self):
         return os.path.join(self.project_root_abs, self.cfgnet_path_rel)
@@ -31,6 +43,9 @@ class NetworkConfiguration:
     def ignorefile_path(self):
         return os.path.join(self.data_dir_path(), "ignore")
 
+    def stopvalues_path(self):
+        return os.path.join(self.data_dir_path(), "stopvalues")
+
     def project_name(self):
         return os.path.basename(self.project_root_abs)
 
@@ -18,7 +18,6 @@
 from __future__ import annotations
 from typing import List, Any, Optional, Union, TYPE_CHECKING
 from cfgnet.config_types.config_types import ConfigType
-from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
 from cfgnet.exceptions.exceptions import NetworkConstructionException
 
 if TYPE_CHECKING:
@@ -239,10 +238,6 @@ class OptionNode(Node):
 
         if isinstance(node, ValueNode):
             self.is_prevalue_node = True
-            if node.config_type == ConfigType.UNKNOWN:
-                node.config_type = ConfigTypeInferer().get_config_type(
-                    option_name=self.name, value=node.name
-                )
 
         super().add_child(node)
 
@@ -14,10 +14,89 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import os
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 
 
 class AlluxioPlugin(ConfigParserPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.BOOLEAN, suffixes=(".enabled", ".used")),
+            TypeRule(ConfigType.VERSION_NUMBER, suffixes=(".version",)),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=(
+                    ".threshold",
+                    ".interval",
+                    ".timeout",
+                    ".time",
+                    ".frequency",
+                    ".delay",
+                    ".age",
+                    ".sleep",
+                    ".duration",
+                    ".wait",
+                    ".period",
+                    ".seconds",
+                ),
+            ),
+            TypeRule(
+                ConfigType.NAME,
+                suffixes=(
+                    ".name",
+                    ".hostname",
+                    ".home",
+                    ".classname",
+                    ".namespace",
+                    ".alias",
+                    ".class",
+                ),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(
+                    ".path",
+                    ".dir",
+                    ".file",
+                    ".dirs",
+                    ".keyfile",
+                    ".keyring",
+                    ".directory",
+                    ".tmp",
+                ),
+            ),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    ".max",
+                    ".threads",
+                    ".count",
+                    ".capacity",
+                    ".number",
+                    ".length",
+                    ".retry",
+                    ".entries",
+                    ".ratio",
+                    ".factor",
+                    ".range",
+                ),
+            ),
+            TypeRule(ConfigType.TYPE, suffixes=(".level", ".mode", ".type")),
+            TypeRule(ConfigType.PORT, suffixes=(".port",)),
+            TypeRule(ConfigType.IP_ADDRESS, suffixes=(".host",)),
+            TypeRule(
+                ConfigType.SIZE, suffixes=(".size", ".limit", ".bytes", ".mem")
+            ),
+            TypeRule(
+                ConfigType.ID,
+                suffixes=(".auth.id", ".uid", ".client.id", ".app.id"),
+            ),
+            TypeRule(ConfigType.PASSWORD, suffixes=(".password",)),
+            TypeRule(ConfigType.USERNAME, suffixes=(".user", ".username")),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("alluxio")
 
@@ -25,98 +104,3 @@ class AlluxioPlugin(ConfigParserPlugin):
         #  typical location: ${ALLUXIO_HOME}/conf/alluxio-site.properties
         file_name = os.path.basename(abs_file_path)
         return file_name == "alluxio-site.properties"
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name.endswith((".enabled", ".used")):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith((".version")):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith(
-            (
-                ".threshold",
-                ".interval",
-                ".timeout",
-                ".time",
-                ".frequency",
-                ".delay",
-                ".age",
-                ".sleep",
-                ".duration",
-                ".wait",
-                ".period",
-                ".seconds",
-            )
-        ):
-            return ConfigType.TIME
-
-        if option_name.endswith(
-            (
-                ".name",
-                ".hostname",
-                ".home",
-                ".classname",
-                ".namespace",
-                ".alias",
-                ".class",
-            )
-        ):
-            return ConfigType.NAME
-
-        if option_name.endswith(
-            (
-                ".path",
-                ".dir",
-                ".file",
-                ".dirs",
-                ".keyfile",
-                ".keyring",
-                ".directory",
-                ".tmp",
-            )
-        ):
-            return ConfigType.PATH
-
-        if option_name.endswith(
-            (
-                ".max",
-                ".threads",
-                ".count",
-                ".capacity",
-                ".number",
-                ".length",
-                ".retry",
-                ".entries",
-                ".ratio",
-                ".factor",
-                ".range",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith((".level", ".mode", ".type")):
-            return ConfigType.TYPE
-
-        if option_name.endswith((".port")):
-            return ConfigType.PORT
-
-        if option_name.endswith((".host")):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith((".size", ".limit", ".bytes", ".mem")):
-            return ConfigType.SIZE
-
-        if option_name.endswith((".auth.id", ".uid", ".client.id", ".app.id")):
-            return ConfigType.ID
-
-        if option_name.endswith((".password")):
-            return ConfigType.PASSWORD
-
-        if option_name.endswith((".user", ".username")):
-            return ConfigType.USERNAME
-
-        return super().get_config_type(option_name, value)
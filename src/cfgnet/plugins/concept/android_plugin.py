@@ -16,11 +16,12 @@
 import logging
 import os
 
-from typing import Optional
+from typing import List, Optional
 from lxml import etree as ET
-from lxml.etree import _Element, _Comment
+from lxml.etree import _Element
 
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.network.nodes import (
     ArtifactNode,
     Node,
@@ -29,9 +30,47 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.file_type.xml_parser import (
+    XmlEvent,
+    iter_xml_events,
+    local_name,
+)
 
 
 class AndroidPlugin(Plugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.NUMBER,
+                names=("maxrecents", "maxaspectratio", "priority"),
+            ),
+            TypeRule(
+                ConfigType.VERSION_NUMBER, suffixes=("version", "versioncode")
+            ),
+            TypeRule(
+                ConfigType.NAME,
+                suffixes=("package", "name", "label", "description"),
+            ),
+            TypeRule(ConfigType.TYPE, suffixes=("mode",)),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                suffixes=("enabled", "exported", "required"),
+                prefixes=("allow",),
+            ),
+            TypeRule(ConfigType.SIZE, suffixes=("size", "height", "width")),
+            TypeRule(ConfigType.IP_ADDRESS, suffixes=("host",)),
+            TypeRule(ConfigType.PORT, suffixes=("port",)),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=("path", "location"),
+                prefixes=("path",),
+            ),
+            TypeRule(ConfigType.TYPE, suffixes=("type", "level")),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("android")
         self.lines = None
@@ -45,6 +84,7 @@ class AndroidPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         artifact = ArtifactNode(
             file_path=abs_file_path,
@@ -53,14 +93,16 @@ class AndroidPlugin(Plugin):
             project_root=root,
         )
 
-        with open(abs_file_path, "r", encoding="utf-8") as src:
-            self.lines = src.readlines()
+        self.lines = content.lines
 
         try:
-            tree = ET.parse(abs_file_path)
-            root = tree.getroot()
-
-            self.parse_tree(root, parent_node=artifact)
+            stack: List[OptionNode] = []
+            for event, element in iter_xml_events(content.data):
+                if event == XmlEvent.START:
+                    parent_node = stack[-1] if stack else artifact
+                    stack.append(self.parse_element(element, parent_node))
+                else:
+                    stack.pop()
 
         except ET.Error as error:
             logging.warning(
@@ -69,7 +111,10 @@ class AndroidPlugin(Plugin):
 
         return artifact
 
-    def parse_tree(self, element: _Element, parent_node: Node):
+    def parse_element(
+        self, element: _Element, parent_node: Node
+    ) -> OptionNode:
+        """Add the option of an element and options of its attributes."""
         option_name = element.tag
         config_type = self.get_config_type(option_name=option_name)
         parent_option = OptionNode(
@@ -77,10 +122,19 @@ class AndroidPlugin(Plugin):
         )
         parent_node.add_child(parent_option)
 
+        # lxml reports the line on which the start tag ends
+        start = element.sourceline - 1
+        while start > 0 and not (
+            "<" in self.lines[start] and option_name in self.lines[start]
+        ):
+            start -= 1
+
         for attr_name, attr_value in element.attrib.items():
-            key = attr_name.split("}")[-1]
+            key = local_name(attr_name)
             config_type = self.get_config_type(key)
-            line_number = self.find_attribute_line(key, attr_value, self.lines)
+            line_number = self.find_attribute_line(
+                key, attr_value, self.lines, start=start
+            )
 
             if not line_number:
                 line_number = str(element.sourceline)
@@ -90,56 +144,21 @@ class AndroidPlugin(Plugin):
             value_node = ValueNode(attr_value)
             option.add_child(value_node)
 
-        for child in element:
-            if not isinstance(child, _Comment):
-                self.parse_tree(child, parent_option)
+        return parent_option
 
     def find_attribute_line(
-        self, attr_name, attr_value, lines
+        self, attr_name, attr_value, lines, start=0
     ) -> Optional[str]:
-        for i in range(len(lines) - 1):
+        """
+        Find the line of an attribute, starting at the line of its element.
+
+        :param attr_name: name of the attribute
+        :param attr_value: value of the attribute
+        :param lines: lines of the file
+        :param start: index of the line at which the search starts
+        :return: line number as string or None if not found
+        """
+        for i in range(start, len(lines)):
             if attr_name in lines[i] and attr_value in lines[i]:
                 return str(i + 1)
         return None
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name in ("maxrecents", "maxaspectratio", "priority"):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(("version", "versioncode")):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith(("package", "name", "label", "description")):
-            return ConfigType.NAME
-
-        if option_name.endswith(("mode")):
-            return ConfigType.TYPE
-
-        if option_name.endswith(("enabled", "exported", "required")):
-            return ConfigType.BOOLEAN
-
-        if option_name.startswith(("allow")):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith(("size", "height", "width")):
-            return ConfigType.SIZE
-
-        if option_name.endswith(("host")):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith(("port")):
-            return ConfigType.PORT
-
-        if option_name.endswith(("path", "location")):
-            return ConfigType.PATH
-
-        if option_name.startswith(("path")):
-            return ConfigType.PATH
-
-        if option_name.endswith(("type", "level")):
-            return ConfigType.TYPE
-
-        return super().get_config_type(option_name, value)
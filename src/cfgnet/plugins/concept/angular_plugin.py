@@ -15,9 +15,48 @@
 import os
 from cfgnet.plugins.file_type.json_plugin import JsonPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class AngularPlugin(JsonPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.VERSION_NUMBER, names=("version",)),
+            TypeRule(
+                ConfigType.PATH,
+                names=(
+                    "main",
+                    "sourceRoot",
+                    "replace",
+                    "with",
+                    "root",
+                    "$schema",
+                    "path",
+                    "outputPath",
+                    "baseUrl",
+                ),
+            ),
+            TypeRule(ConfigType.COMMAND, names=("bin",)),
+            TypeRule(
+                ConfigType.NAME,
+                names=(
+                    "name",
+                    "bundledDependencies",
+                    "newProjectRoot",
+                    "projectType",
+                    "packageManager",
+                    "environement",
+                ),
+            ),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=("enabled", "scripts", "styles", "hidden", "vendor"),
+                prefixes=("disable", "enable"),
+            ),
+            TypeRule(ConfigType.ID, names=("flatModuleID",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("angular")
         self.excluded_keys = [
@@ -30,45 +69,3 @@ class AngularPlugin(JsonPlugin):
     def is_responsible(self, abs_file_path: str) -> bool:
         file_name = os.path.basename(abs_file_path)
         return file_name == "angular.json"
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in ("version"):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name in (
-            "main",
-            "sourceRoot",
-            "replace",
-            "with",
-            "root",
-            "$schema",
-            "path",
-            "outputPath",
-            "baseUrl",
-        ):
-            return ConfigType.PATH
-
-        if option_name in ("bin"):
-            return ConfigType.COMMAND
-
-        if option_name in (
-            "name",
-            "bundledDependencies",
-            "newProjectRoot",
-            "projectType",
-            "packageManager",
-            "environement",
-        ):
-            return ConfigType.NAME
-
-        if option_name in ("enabled", "scripts", "styles", "hidden", "vendor"):
-            return ConfigType.BOOLEAN
-
-        if option_name.startswith(("disable", "enable")):
-            return ConfigType.BOOLEAN
-
-        if option_name in ("flatModuleID"):
-            return ConfigType.ID
-
-        return super().get_config_type(option_name, value)
@@ -14,9 +14,26 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class AnsiblePlaybookPlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.USERNAME, suffixes=("user",)),
+            TypeRule(ConfigType.PASSWORD, suffixes=("password",)),
+            TypeRule(
+                ConfigType.NAME,
+                suffixes=("register", "group", "master", "hosts", "name"),
+            ),
+            TypeRule(ConfigType.COMMAND, suffixes=("local_action",)),
+            TypeRule(ConfigType.PATH, suffixes=("src", "dest", "path")),
+            TypeRule(
+                ConfigType.IP_ADDRESS, suffixes=("network", "gateway", "dns4")
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("ansible-playbook")
 
@@ -32,28 +49,3 @@ class AnsiblePlaybookPlugin(YAMLPlugin):
             return True
 
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-
-        if option_name.endswith("user"):
-            return ConfigType.USERNAME
-
-        if option_name.endswith("password"):
-            return ConfigType.PASSWORD
-
-        if option_name.endswith(
-            ("register", "group", "master", "hosts", "name")
-        ):
-            return ConfigType.NAME
-
-        if option_name.endswith(("local_action")):
-            return ConfigType.COMMAND
-
-        if option_name.endswith(("src", "dest", "path")):
-            return ConfigType.PATH
-
-        if option_name.endswith(("network", "gateway", "dns4")):
-            return ConfigType.IP_ADDRESS
-
-        return super().get_config_type(option_name, value)
@@ -13,10 +13,39 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 
 
 class AnsiblePlugin(ConfigParserPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(
+                    "_path",
+                    "_home",
+                    "_file",
+                    "_paths",
+                    "_output",
+                    "_local_tmp",
+                    "_dir",
+                    "_root",
+                ),
+            ),
+            TypeRule(ConfigType.TIME, suffixes=("_interval", "_timeout")),
+            TypeRule(ConfigType.COMMAND, suffixes=("_executable",)),
+            TypeRule(ConfigType.NAME, suffixes=("_name",)),
+            TypeRule(ConfigType.PORT, suffixes=("_port",)),
+            TypeRule(ConfigType.USERNAME, suffixes=("_user",)),
+            TypeRule(ConfigType.ID, suffixes=("_identity",)),
+            TypeRule(ConfigType.URL, suffixes=("_url",)),
+            TypeRule(ConfigType.NUMBER, suffixes=("_count",)),
+            TypeRule(ConfigType.BOOLEAN, suffixes=("_enabled",)),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("ansible")
 
@@ -24,50 +53,3 @@ class AnsiblePlugin(ConfigParserPlugin):
         if abs_file_path.endswith("ansible.cfg"):
             return True
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name.endswith(
-            (
-                "_path",
-                "_home",
-                "_file",
-                "_paths",
-                "_output",
-                "_local_tmp",
-                "_dir",
-                "_root",
-            )
-        ):
-            return ConfigType.PATH
-
-        if option_name.endswith(("_interval", "_timeout")):
-            return ConfigType.TIME
-
-        if option_name.endswith(("_executable")):
-            return ConfigType.COMMAND
-
-        if option_name.endswith(("_name")):
-            return ConfigType.NAME
-
-        if option_name.endswith(("_port")):
-            return ConfigType.PORT
-
-        if option_name.endswith(("_user")):
-            return ConfigType.USERNAME
-
-        if option_name.endswith(("_identity")):
-            return ConfigType.ID
-
-        if option_name.endswith(("_url")):
-            return ConfigType.URL
-
-        if option_name.endswith(("_count")):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(("_enabled")):
-            return ConfigType.BOOLEAN
-
-        return super().get_config_type(option_name, value)
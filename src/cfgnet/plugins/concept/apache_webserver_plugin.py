@@ -14,22 +14,165 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-from typing import Optional
-import apacheconfig
+import re
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
 
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.include_resolver import IncludeContext, IncludeResolver
 from cfgnet.network.nodes import (
     ArtifactNode,
+    Node,
     OptionNode,
     ProjectNode,
     ValueNode,
 )
 
+INCLUDE_DIRECTIVES = frozenset(("include", "includeoptional"))
+
+BLOCK_START_REGEX = re.compile(r"<\s*(?P<name>[^\s>/]+)(?P<args>[^>]*)>")
+BLOCK_END_REGEX = re.compile(r"</\s*(?P<name>[^\s>]+)\s*>")
+DIRECTIVE_REGEX = re.compile(r"(?P<name>\S+)(?:\s+(?P<args>.*))?")
+
+
+@dataclass
+class ApacheDirective:
+    """
+    Directive of an Apache httpd configuration.
+
+    Parameters
+    ----------
+    name: str
+        Name of the directive.
+    args: str
+        Arguments of the directive, without enclosing quotes.
+    line: int
+        Line on which the directive starts.
+    block: Optional[List[ApacheDirective]]
+        Directives of the section, if the directive opens a section.
+
+    """
+
+    name: str
+    args: str
+    line: int
+    block: Optional[List["ApacheDirective"]] = field(default=None)
+
 
 class ApacheWebserverPlugin(Plugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.PATH,
+                names=(
+                    "AccessFileName",
+                    "ErrorLog",
+                    "DocumentRoot",
+                    "Include",
+                    "IncludeOptional",
+                    "Options",
+                    "ServerRoot",
+                    "TransferLog",
+                    "DefaultIcon",
+                    "ReadmeName",
+                    "Files",
+                    "Alias",
+                    "AuthLDAPCharsetConfig",
+                    "DavGenericLockDB",
+                    "DavLockDB",
+                    "HeartbeatStorage",
+                    "MMapFile",
+                    "ScriptAlias",
+                    "ScriptLog",
+                    "ScriptSock",
+                    "TypesConfig",
+                    "RewriteBase",
+                    "SessionInclude",
+                    "SessionExclude",
+                ),
+            ),
+            TypeRule(ConfigType.TYPE, names=("ErrorLogFormat", "AddType")),
+            TypeRule(
+                ConfigType.NUMBER,
+                names=(
+                    "FlushMaxPipelined",
+                    "LimitInternalRecursion",
+                    "LimitRequestFields",
+                    "MaxKeepAliveRequests",
+                    "RLimitNPROC",
+                    "ServerLimit",
+                    "MaxSpareServers",
+                    "MinSpareServers",
+                    "StartServers",
+                    "HeartbeatMaxServers",
+                ),
+            ),
+            TypeRule(
+                ConfigType.SIZE,
+                names=(
+                    "FlushMaxThreshold",
+                    "LimitRequestBody",
+                    "LimitRequestFieldSize",
+                    "LimitRequestLine",
+                    "LimitXMLRequestBody",
+                    "ReadBufferSize",
+                    "RLimitMEM",
+                ),
+            ),
+            TypeRule(
+                ConfigType.NAME,
+                names=(
+                    "ServerAlias",
+                    "ServerName",
+                    "UnDefine",
+                    "HeaderName",
+                    "Group",
+                ),
+            ),
+            TypeRule(
+                ConfigType.URL,
+                names=(
+                    "Location",
+                    "ServerPath",
+                    "AuthFormLoginRequiredLocation",
+                    "AuthFormLoginSuccessLocation",
+                    "AuthFormLogoutLocation",
+                    "AuthLDAPURL",
+                    "CacheKeyBaseURL",
+                    "MDCertificateAuthority",
+                    "MDHttpProxy",
+                    "RedirectPermanent",
+                    "RedirectTemp",
+                    "SSLOCSPProxyURL",
+                    "SSLStaplingForceURL",
+                ),
+            ),
+            TypeRule(
+                ConfigType.IP_ADDRESS, names=("NameVirtualHost", "VirtualHost")
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                names=(
+                    "KeepAliveTimeout",
+                    "RLimitCPU",
+                    "TimeOut",
+                    "CGIDScriptTimeout",
+                ),
+            ),
+            TypeRule(ConfigType.EMAIL, names=("ServerAdmin",)),
+            TypeRule(ConfigType.USERNAME, names=("User",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("apache")
+        self.includes: IncludeResolver[List[ApacheDirective]] = (
+            IncludeResolver(self.parse_directives)
+        )
 
     def is_responsible(self, abs_file_path: str) -> bool:
         file_name = os.path.basename(abs_file_path)
@@ -42,6 +185,7 @@ class ApacheWebserverPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         artifact = ArtifactNode(
             file_path=abs_file_path,
@@ -50,263 +194,197 @@ class ApacheWebserverPlugin(Plugin):
             project_root=root,
         )
 
-        with apacheconfig.make_loader() as loader:
-            conf_dict = loader.load(abs_file_path)
-
-        self.parse_conf_file(abs_file_path, conf_dict, artifact)
-        return artifact
-
-    def parse_conf_file(self, abs_file_path, conf_dict, artifact):
-        multiple_options = {}
-        nested_options = []
-
-        for conf in conf_dict:
-            if isinstance(conf_dict[conf], list):
-                for value in conf_dict[conf]:
-                    if isinstance(value, str):
-                        multiple_options[conf] = conf_dict[conf]
-                    else:
-                        nested_options.append(
-                            {
-                                "conf": conf,
-                                "block": list(value.keys())[0],
-                                "options": list(value.values())[0],
-                            }
-                        )
-            elif isinstance(conf_dict[conf], dict):
-                nested_options.append(
-                    {
-                        "conf": conf,
-                        "block": list(conf_dict[conf])[0],
-                        "options": list(conf_dict[conf].values())[0],
-                    }
-                )
-
-        unique_options = {}
-        for conf in conf_dict:
-            if type(conf_dict[conf]) not in (list, dict):
-                unique_options[conf] = conf_dict[conf]
-
-        self.parse_artifact(
-            artifact,
-            abs_file_path,
-            unique_options,
-            multiple_options,
-            nested_options,
+        # relative includes are resolved against the server root, which
+        # usually is the parent of the configuration directory
+        project_root = IncludeResolver.get_project_root(
+            abs_file_path, rel_file_path
+        )
+        conf_dir = os.path.dirname(abs_file_path)
+        context = IncludeContext(
+            content=content,
+            artifact_path=abs_file_path,
+            project_root=project_root,
+            base_dirs=[conf_dir, os.path.dirname(conf_dir), project_root],
         )
-        return artifact
 
-    def parse_artifact(
-        self,
-        artifact,
-        abs_file_path,
-        unique_options,
-        multiple_options,
-        nested_options,
-    ):
-        with open(abs_file_path, "r", encoding="utf-8") as conffile:
-            lines = conffile.readlines()
-            self.parse_unique_options(artifact, lines, unique_options)
-            self.parse_multiple_options(artifact, lines, multiple_options)
-            self.parse_nested_options(artifact, lines, nested_options)
-
-    def get_conf_value(self, values, parent, lineno):
-        for value in values:
-            if isinstance(values[value], dict):
-                lineno += 1
-                parent = self.parse_tree(parent, value, None, lineno)
-                self.get_conf_value(list(values.values())[0], parent, lineno)
-            else:
-                lineno += 1
-                self.parse_tree(parent, value, values[value], lineno)
-
-    def parse_tree(self, artifact, option, value, lineno):
-        config_type = self.get_config_type(option)
-        option_node = OptionNode(
-            name=option,
-            location=lineno,
-            config_type=config_type,
+        self._add_directives(
+            self.parse_directives(content), artifact, {}, context
         )
-        artifact.add_child(option_node)
-        if value is not None:
-            value_node = ValueNode(name=value)
-            option_node.add_child(value_node)
-        return option_node
 
-    def parse_unique_options(self, artifact, lines, unique_options):
-        start = 0
-        for option in unique_options:
-            for line in lines[start:]:
-                if line[0] not in ("#", "\n"):
-                    if line.startswith(option):
-                        lineno = lines.index(line) + 1
-                        value = unique_options[option]
-                        self.parse_tree(artifact, option, value, lineno)
-                        start = lineno
-                        break
-
-    def parse_multiple_options(self, artifact, lines, multiple_options):
-        for option in multiple_options:
-            start = 0
-            for value in multiple_options[option]:
-                for line in lines[start:]:
-                    if line[0] not in ("#", "\n"):
-                        if line.startswith(option):
-                            lineno = lines.index(line) + 1
-                            self.parse_tree(artifact, option, value, lineno)
-                            start = lineno
-                            break
+        return artifact
 
-    def parse_nested_options(self, artifact, lines, nested_options):
-        block_type = False
-        nested_conf = False
-        lineno = 0
-
-        for line in lines:
-            if not block_type:
-                if line[0] == "<":
-                    for nested in nested_options:
-                        if line.startswith("<" + nested["conf"]):
-                            lineno = lines.index(line, lineno) + 1
-                            parent = self.parse_tree(
-                                artifact, nested["conf"], None, lineno
-                            )
-                            parent = self.parse_tree(
-                                parent, nested["block"], None, lineno
-                            )
-                            block_type = True
-                            break
+    @staticmethod
+    def parse_directives(content: FileContent) -> List[ApacheDirective]:
+        """
+        Parse the directives of an Apache httpd configuration in one pass.
+
+        Lines ending with a backslash are continued on the next line.
+        Sections such as `<VirtualHost *:80>` become directives with nested
+        blocks. Section names are compared case-insensitively, and sections
+        that are not closed are closed at the end of the file.
+
+        :param content: Content of the configuration file
+        :return: Directives on the top level, with nested blocks
+        """
+        directives: List[ApacheDirective] = []
+        # directive lists and names of all open sections
+        stack: List[List[ApacheDirective]] = []
+        names: List[str] = []
+
+        statement = ""
+        start = 0
+        for line_number, line in enumerate(content.lines, start=1):
+            line = line.strip()
+            if line.endswith("\\"):
+                if not statement:
+                    start = line_number
+                statement += line[:-1].rstrip() + " "
+                continue
+            if statement:
+                line = statement + line
+                statement = ""
             else:
-                line_edit = line.replace(" ", "")
-                if not nested_conf:
-                    for option in nested["options"]:
-                        if line_edit.startswith(
-                            option
-                        ) or line_edit.startswith("<" + option):
-                            lineno = lines.index(line, lineno) + 1
-
-                            if isinstance(nested_options[0]["options"], dict):
-                                self.get_conf_value(
-                                    nested_options[0]["options"],
-                                    parent,
-                                    lineno,
-                                )
-                                block_type = False
-                                nested_options.remove(nested)
-                                break
-
-                            self.parse_tree(
-                                parent,
-                                option,
-                                nested_options[0]["options"],
-                                lineno,
-                            )
-
-                            if option == list(nested["options"])[-1]:
-                                block_type = False
-                                nested_options.remove(nested)
+                start = line_number
+
+            if not line or line.startswith("#"):
+                continue
+
+            end = BLOCK_END_REGEX.fullmatch(line)
+            if end:
+                name = end.group("name").lower()
+                if name in names:
+                    # close sections that were left open inside this one
+                    while names:
+                        directives = stack.pop()
+                        if names.pop() == name:
                             break
+                continue
+
+            block = BLOCK_START_REGEX.fullmatch(line)
+            if block:
+                directive = ApacheDirective(
+                    name=block.group("name"),
+                    args=ApacheWebserverPlugin._unquote(block.group("args")),
+                    line=start,
+                    block=[],
+                )
+                directives.append(directive)
+                stack.append(directives)
+                names.append(directive.name.lower())
+                directives = directive.block
+                continue
+
+            match = DIRECTIVE_REGEX.fullmatch(line)
+            if match:
+                directives.append(
+                    ApacheDirective(
+                        name=match.group("name"),
+                        args=ApacheWebserverPlugin._unquote(
+                            match.group("args") or ""
+                        ),
+                        line=start,
+                    )
+                )
 
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in (
-            "AccessFileName",
-            "ErrorLog",
-            "DocumentRoot",
-            "Include",
-            "IncludeOptional",
-            "Options",
-            "ServerRoot",
-            "TransferLog",
-            "DefaultIcon",
-            "ReadmeName",
-            "Files",
-            "Alias",
-            "AuthLDAPCharsetConfig",
-            "DavGenericLockDB",
-            "DavLockDB",
-            "HeartbeatStorage",
-            "MMapFile",
-            "ScriptAlias",
-            "ScriptLog",
-            "ScriptSock",
-            "TypesConfig",
-            "DefaultIcon",
-            "RewriteBase",
-            "SessionInclude",
-            "SessionExclude",
-        ):
-            return ConfigType.PATH
-
-        if option_name in ("ErrorLogFormat", "AddType"):
-            return ConfigType.TYPE
-
-        if option_name in (
-            "FlushMaxPipelined",
-            "LimitInternalRecursion",
-            "LimitRequestFields",
-            "MaxKeepAliveRequests",
-            "RLimitNPROC",
-            "ServerLimit",
-            "MaxSpareServers",
-            "MinSpareServers",
-            "StartServers",
-            "HeartbeatMaxServers",
-        ):
-            return ConfigType.NUMBER
-
-        if option_name in (
-            "FlushMaxThreshold",
-            "LimitRequestBody",
-            "LimitRequestFieldSize",
-            "LimitRequestLine",
-            "LimitXMLRequestBody",
-            "ReadBufferSize",
-            "RLimitMEM",
-        ):
-            return ConfigType.SIZE
-
-        if option_name in (
-            "ServerAlias",
-            "ServerName",
-            "UnDefine",
-            "HeaderName",
-            "Group",
-        ):
-            return ConfigType.NAME
-
-        if option_name in (
-            "Location",
-            "ServerPath",
-            "AuthFormLoginRequiredLocation",
-            "AuthFormLoginSuccessLocation",
-            "AuthFormLogoutLocation",
-            "AuthLDAPURL",
-            "CacheKeyBaseURL",
-            "MDCertificateAuthority",
-            "MDHttpProxy",
-            "RedirectPermanent",
-            "RedirectTemp",
-            "SSLOCSPProxyURL",
-            "SSLStaplingForceURL",
-        ):
-            return ConfigType.URL
-
-        if option_name in ("NameVirtualHost", "VirtualHost"):
-            return ConfigType.IP_ADDRESS
-
-        if option_name in (
-            "KeepAliveTimeout",
-            "RLimitCPU",
-            "TimeOut",
-            "CGIDScriptTimeout",
+        return stack[0] if stack else directives
+
+    @staticmethod
+    def _unquote(args: str) -> str:
+        """Remove the quotes around arguments that form a single string."""
+        args = args.strip()
+        if (
+            len(args) >= 2
+            and args[0] == args[-1]
+            and args[0] in "\"'"
+            and args[0] not in args[1:-1]
         ):
-            return ConfigType.TIME
-
-        if option_name in ("ServerAdmin"):
-            return ConfigType.EMAIL
-
-        if option_name in ("User"):
-            return ConfigType.USERNAME
+            return args[1:-1]
+        return args
 
-        return super().get_config_type(option_name, value)
+    def _add_directives(
+        self,
+        directives: List[ApacheDirective],
+        parent: Node,
+        blocks: Dict[str, OptionNode],
+        context: IncludeContext,
+    ) -> None:
+        """
+        Add option nodes for directives to a parent node.
+
+        A section becomes an option node for its name with a child for its
+        arguments. Sections with the same name and arguments share their
+        nodes. The directives of included files are added in place of the
+        include directive.
+
+        :param directives: Directives to add
+        :param parent: Node of the enclosing section or the artifact
+        :param blocks: Option nodes of all sections by their id
+        :param context: File that defines the directives
+        """
+        for directive in directives:
+            location = context.get_location(directive.line)
+
+            if directive.block is not None:
+                if not self._has_values(directive.block):
+                    continue
+                block_node = self._get_block_node(
+                    parent, directive.name, location, blocks
+                )
+                if directive.args:
+                    block_node = self._get_block_node(
+                        block_node, directive.args, location, blocks
+                    )
+                self._add_directives(
+                    directive.block, block_node, blocks, context
+                )
+                continue
+
+            if not directive.args:
+                continue
+
+            option_node = OptionNode(
+                name=directive.name,
+                location=location,
+                config_type=self.get_config_type(directive.name),
+            )
+            parent.add_child(option_node)
+            option_node.add_child(ValueNode(name=directive.args))
+
+            if directive.name.lower() in INCLUDE_DIRECTIVES:
+                for fragment_context, fragment in self.includes.resolve(
+                    directive.args, context
+                ):
+                    self._add_directives(
+                        fragment, parent, blocks, fragment_context
+                    )
+
+    def _get_block_node(
+        self,
+        parent: Node,
+        name: str,
+        location: Union[int, str],
+        blocks: Dict[str, OptionNode],
+    ) -> OptionNode:
+        """Return the option node of a section, adding it on first use."""
+        block_id = f"{parent.id}::::{name}"
+        block_node = blocks.get(block_id)
+        if block_node is None:
+            block_node = OptionNode(
+                name=name,
+                location=location,
+                config_type=self.get_config_type(name),
+            )
+            parent.add_child(block_node)
+            blocks[block_node.id] = block_node
+        return block_node
+
+    @staticmethod
+    def _has_values(directives: List[ApacheDirective]) -> bool:
+        """Return true if a directive with arguments occurs in a section."""
+        for directive in directives:
+            if directive.block is None:
+                if directive.args:
+                    return True
+            elif ApacheWebserverPlugin._has_values(directive.block):
+                return True
+        return False
@@ -14,9 +14,46 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.plugins.file_type.toml_plugin import TomlPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class CargoPlugin(TomlPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.URL,
+                names=(
+                    "homepage",
+                    "repository",
+                    "documentation",
+                    "urls",
+                    "url",
+                    "git",
+                ),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                names=(
+                    "include",
+                    "exclude",
+                    "license-file",
+                    "workspace",
+                    "build",
+                    "path",
+                ),
+            ),
+            TypeRule(
+                ConfigType.VERSION_NUMBER,
+                names=("version", "dependencies", "dev-dependencies"),
+            ),
+            TypeRule(ConfigType.LICENSE, names=("license",)),
+            TypeRule(ConfigType.NAME, names=("name", "branch", "registry")),
+            TypeRule(
+                ConfigType.VERSION_NUMBER, names=("version", "rust-version")
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("cargo")
         self.excluded_keys = [
@@ -32,39 +69,3 @@ class CargoPlugin(TomlPlugin):
         if abs_file_path.endswith("Cargo.toml"):
             return True
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in (
-            "homepage",
-            "repository",
-            "documentation",
-            "urls",
-            "url",
-            "git",
-        ):
-            return ConfigType.URL
-
-        if option_name in (
-            "include",
-            "exclude",
-            "license-file",
-            "workspace",
-            "build",
-            "path",
-        ):
-            return ConfigType.PATH
-
-        if option_name in ("version", "dependencies", "dev-dependencies"):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name in ("license"):
-            return ConfigType.LICENSE
-
-        if option_name in ("name", "branch", "registry"):
-            return ConfigType.NAME
-
-        if option_name in ("version", "rust-version"):
-            return ConfigType.VERSION_NUMBER
-
-        return super().get_config_type(option_name, value)
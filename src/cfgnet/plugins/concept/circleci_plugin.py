@@ -14,51 +14,42 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class CircleCiPlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.COMMAND,
+                names=("command", "run", "shell", "entrypoint"),
+            ),
+            TypeRule(ConfigType.IMAGE, names=("image",)),
+            TypeRule(ConfigType.NUMBER, names=("parallelism",)),
+            TypeRule(
+                ConfigType.PATH,
+                names=(
+                    "at",
+                    "working_directory",
+                    "path",
+                    "paths",
+                    "destination",
+                ),
+            ),
+            TypeRule(ConfigType.NAME, names=("name", "resource_class")),
+            TypeRule(ConfigType.USERNAME, names=("user",)),
+            TypeRule(ConfigType.ENVIRONMENT, names=("environment",)),
+            TypeRule(ConfigType.VERSION_NUMBER, names=("xcode", "version")),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=("docker_layer_caching", "background"),
+            ),
+            TypeRule(ConfigType.TIME, names=("no_output_timeout",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("circleci")
 
     def is_responsible(self, abs_file_path):
         return abs_file_path.endswith(".circleci/config.yml")
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in ("command", "run", "shell", "entrypoint"):
-            return ConfigType.COMMAND
-
-        if option_name == "image":
-            return ConfigType.IMAGE
-
-        if option_name in ("parallelism"):
-            return ConfigType.NUMBER
-
-        if option_name in (
-            "at",
-            "working_directory",
-            "path",
-            "paths",
-            "destination",
-        ):
-            return ConfigType.PATH
-
-        if option_name in ("name", "resource_class"):
-            return ConfigType.NAME
-
-        if option_name == "user":
-            return ConfigType.USERNAME
-
-        if option_name == "environment":
-            return ConfigType.ENVIRONMENT
-
-        if option_name in ("xcode", "version"):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name in ("docker_layer_caching", "background"):
-            return ConfigType.BOOLEAN
-
-        if option_name in ("no_output_timeout"):
-            return ConfigType.TIME
-
-        return super().get_config_type(option_name, value)
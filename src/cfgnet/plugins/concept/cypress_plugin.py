@@ -15,9 +15,55 @@
 from typing import List
 from cfgnet.plugins.file_type.json_plugin import JsonPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class CypressPlugin(JsonPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.ID, names=("projectId",)),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=(
+                    "includeShadowDom",
+                    "watchForFileChanges",
+                    "screenshotOnRunFailure",
+                    "trashAssetsBeforeRuns",
+                    "video",
+                    "videoUploadOnPasses",
+                    "chromeWebSecurity",
+                    "waitForAnimations",
+                    "toConsole",
+                ),
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                names=(
+                    "defaultCommandTimeout",
+                    "execTimeout",
+                    "taskTimeout",
+                    "pageLoadTimeout",
+                    "requestTimeout",
+                    "responseTimeout",
+                    "slowTestThreshold",
+                ),
+            ),
+            TypeRule(
+                ConfigType.NUMBER,
+                names=(
+                    "numTestsKeptInMemory",
+                    "redirectionLimit",
+                    "videoCompression",
+                    "animationDistanceThreshold",
+                ),
+            ),
+            TypeRule(ConfigType.NAME, names=("reporter", "devServer")),
+            TypeRule(
+                ConfigType.SIZE, names=("viewportHeight", "viewportWidth")
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("cypress")
         self.excluded_keys: List[str] = []
@@ -26,49 +72,3 @@ class CypressPlugin(JsonPlugin):
         if abs_file_path.endswith("cypress.json"):
             return True
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name == "projectId":
-            return ConfigType.ID
-        if option_name in (
-            "includeShadowDom",
-            "watchForFileChanges",
-            "screenshotOnRunFailure",
-            "trashAssetsBeforeRuns",
-            "trashAssetsBeforeRuns",
-            "video",
-            "videoUploadOnPasses",
-            "trashAssetsBeforeRuns",
-            "chromeWebSecurity",
-            "waitForAnimations",
-            "toConsole",
-        ):
-            return ConfigType.BOOLEAN
-
-        if option_name in (
-            "defaultCommandTimeout",
-            "execTimeout",
-            "taskTimeout",
-            "pageLoadTimeout",
-            "requestTimeout",
-            "responseTimeout",
-            "slowTestThreshold",
-        ):
-            return ConfigType.TIME
-
-        if option_name in (
-            "numTestsKeptInMemory",
-            "redirectionLimit",
-            "videoCompression",
-            "animationDistanceThreshold",
-        ):
-            return ConfigType.NUMBER
-
-        if option_name in ("reporter", "devServer"):
-            return ConfigType.NAME
-
-        if option_name in ("viewportHeight", "viewportWidth"):
-            return ConfigType.SIZE
-
-        return super().get_config_type(option_name, value)
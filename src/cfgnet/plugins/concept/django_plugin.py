@@ -15,6 +15,7 @@
 import ast
 from typing import Optional
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
 from cfgnet.network.nodes import (
     ProjectNode,
     ArtifactNode,
@@ -22,9 +23,33 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class DjangoPlugin(Plugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.PATH, suffixes=("location",)),
+            TypeRule(
+                ConfigType.SIZE, suffixes=("file_upload_max_memory_size",)
+            ),
+            TypeRule(ConfigType.TIME, suffixes=("timeout", "seconds")),
+            TypeRule(ConfigType.NAME, suffixes=("name", "time_zone")),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    "age",
+                    "max_number_fields",
+                    "max_number_files",
+                    "day_of_week",
+                    "number_grouping",
+                ),
+            ),
+            TypeRule(ConfigType.TYPE, suffixes=("format",)),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("django")
 
@@ -39,6 +64,7 @@ class DjangoPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         """
         Parse the file to extract configuration options and values.
@@ -46,6 +72,7 @@ class DjangoPlugin(Plugin):
         :param abs_file_path: Absolute path to the file
         :param rel_file_path: Relative path to the file
         :param root: The ArtifactNode will be appended to this ProjectNode
+        :param content: Content of the file
         :return: ArtifactNode that will be added to the configuration network
         """
         artifact = ArtifactNode(
@@ -55,10 +82,7 @@ class DjangoPlugin(Plugin):
             project_root=root,
         )
 
-        with open(abs_file_path, "r", encoding="utf-8") as file:
-            content = file.read()
-
-        tree = ast.parse(content, filename=abs_file_path)
+        tree = ast.parse(content.text, filename=abs_file_path)
 
         settings = {}
 
@@ -112,35 +136,3 @@ class DjangoPlugin(Plugin):
                 self.__parse_dict(option_node, option, option_value)
             else:
                 self.__parse(option_node, option, option_value)
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name.endswith(("location")):
-            return ConfigType.PATH
-
-        if option_name.endswith("file_upload_max_memory_size"):
-            return ConfigType.SIZE
-
-        if option_name.endswith(("timeout", "seconds")):
-            return ConfigType.TIME
-
-        if option_name.endswith(("name", "time_zone")):
-            return ConfigType.NAME
-
-        if option_name.endswith(
-            (
-                "age",
-                "max_number_fields",
-                "max_number_files",
-                "day_of_week",
-                "number_grouping",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(("format")):
-            return ConfigType.TYPE
-
-        return super().get_config_type(option_name, value)
@@ -15,12 +15,84 @@
 import re
 from yaml.nodes import ScalarNode
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 
 
 class DockerComposePlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.SIZE, suffixes=("size", "weight", "height")),
+            TypeRule(ConfigType.PATH, names=("env_file",)),
+            TypeRule(
+                ConfigType.NAME,
+                suffixes=(
+                    "name",
+                    "driver",
+                    "labels",
+                    "hostname",
+                    "cap_add",
+                    "cap_drop",
+                    "cgroup_parent",
+                    "source",
+                    "container_name",
+                    "depends_on",
+                    "registry",
+                    "service",
+                    "external_links",
+                    "build",
+                ),
+            ),
+            TypeRule(ConfigType.SPEED, names=("rate",)),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=(
+                    "cpu_rt_runtime",
+                    "cpu_rt_period",
+                    "start_period",
+                    "interval",
+                    "timeout",
+                    "stop_grace_period",
+                ),
+            ),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    "cpu_shares",
+                    "uid",
+                    "gid",
+                    "retries",
+                    "priority",
+                    "pids_limit",
+                    "sysctls",
+                ),
+            ),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                suffixes=("external", "disable", "init", "attachable"),
+            ),
+            TypeRule(ConfigType.COMMAND, names=("test",)),
+            TypeRule(
+                ConfigType.IP_ADDRESS,
+                suffixes=(
+                    "dns",
+                    "ipv4_address",
+                    "ipv6_address",
+                    "subnet",
+                    "link_local_ips",
+                    "host_ip",
+                    "ip_range",
+                    "gateway",
+                    "aux_addresses",
+                ),
+            ),
+            TypeRule(ConfigType.URL, suffixes=("dns_search", "extra_hosts")),
+        ],
+        ignore_case=True,
+    )
+
     file_name = re.compile(r"docker-compose(.\w+)?.yml")
     ports = re.compile(r"(?P<host>[0-9]{4}):(?P<container>[0-9]{4})")
 
@@ -81,87 +153,3 @@ class DockerComposePlugin(YAMLPlugin):
         parent.add_child(variable)
         value = ValueNode(name=value_parts[1])
         variable.add_child(value)
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name.endswith(("size", "weight", "height")):
-            return ConfigType.SIZE
-
-        if option_name == "env_file":
-            return ConfigType.PATH
-
-        if option_name.endswith(
-            (
-                "name",
-                "driver",
-                "labels",
-                "hostname",
-                "cap_add",
-                "cap_drop",
-                "cgroup_parent",
-                "source",
-                "container_name",
-                "depends_on",
-                "registry",
-                "service",
-                "external_links",
-                "build",
-            )
-        ):
-            return ConfigType.NAME
-
-        if option_name == "rate":
-            return ConfigType.SPEED
-
-        if option_name.endswith(
-            (
-                "cpu_rt_runtime",
-                "cpu_rt_period",
-                "start_period",
-                "interval",
-                "timeout",
-                "stop_grace_period",
-            )
-        ):
-            return ConfigType.TIME
-
-        if option_name.endswith(
-            (
-                "cpu_shares",
-                "uid",
-                "gid",
-                "retries",
-                "priority",
-                "pids_limit",
-                "sysctls",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(("external", "disable", "init", "attachable")):
-            return ConfigType.BOOLEAN
-
-        if option_name == "test":
-            return ConfigType.COMMAND
-
-        if option_name.endswith(
-            (
-                "dns",
-                "ipv4_address",
-                "ipv6_address",
-                "subnet",
-                "link_local_ips",
-                "host_ip",
-                "ip_range",
-                "gateway",
-                "aux_addresses",
-            )
-        ):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith(("dns_search", "extra_hosts")):
-            return ConfigType.URL
-
-        return super().get_config_type(option_name, value)
@@ -27,6 +27,7 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
 
 
 def parse_env(line: str) -> List[str]:
@@ -59,6 +60,7 @@ class DockerPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         artifact = ArtifactNode(
             file_path=abs_file_path,
@@ -70,7 +72,7 @@ class DockerPlugin(Plugin):
         self.env_vars.clear()
 
         try:
-            data = dockerfile.parse_file(abs_file_path)
+            data = dockerfile.parse_string(content.text)
         except dockerfile.GoParseError as error:
             logging.warning("Invalid Dockerfile %s: %s", abs_file_path, error)
             return artifact
@@ -106,7 +108,13 @@ class DockerPlugin(Plugin):
             if cmd.cmd == "ARG":
                 parts = cmd.value[0].split("=")
                 if len(parts) == 2:
-                    self.env_vars[parts[0]] = parts[1]
+                    arg_option = OptionNode(
+                        name=parts[0], location=cmd.start_line
+                    )
+                    option.add_child(arg_option)
+                    value_name = self.check_value_name(parts[1])
+                    arg_option.add_child(ValueNode(value_name))
+                    self.env_vars[parts[0]] = value_name
 
             if cmd.cmd == "ENV":
                 values = parse_env(cmd.original)
@@ -233,7 +241,7 @@ class DockerPlugin(Plugin):
 
         :return: OptionNode
         """
-        if name == "ENV":
+        if name in ("ENV", "ARG"):
             option = OptionNode(
                 name=name,
                 location=location,
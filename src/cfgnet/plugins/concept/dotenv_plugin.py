@@ -0,0 +1,91 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import os
+import re
+from typing import Optional
+from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+class DotenvPlugin(Plugin):
+    """Plugin for parsing `.env` files with environment variables."""
+
+    assignment = re.compile(
+        r"(export\s+)?(?P<name>[A-Za-z_][A-Za-z0-9_.]*)\s*=\s*(?P<value>.*)"
+    )
+
+    def __init__(self):
+        super().__init__("dotenv")
+
+    def is_responsible(self, abs_file_path: str) -> bool:
+        """Check if the plugin is responsible for the given file."""
+        file_name = os.path.basename(abs_file_path)
+        return (
+            file_name == ".env"
+            or file_name.startswith(".env.")
+            or file_name.endswith(".env")
+        )
+
+    def _parse_config_file(
+        self,
+        abs_file_path: str,
+        rel_file_path: str,
+        root: Optional[ProjectNode],
+        content: FileContent,
+    ) -> ArtifactNode:
+        """Parse the variable assignments of a `.env` file."""
+        artifact = ArtifactNode(
+            file_path=abs_file_path,
+            rel_file_path=rel_file_path,
+            concept_name=self.concept_name,
+            project_root=root,
+        )
+
+        for line_number, line in enumerate(content.lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            match = self.assignment.fullmatch(line)
+            if match is None:
+                continue
+
+            option_name = match.group("name")
+            value = self._unquote(match.group("value"))
+            if not value:
+                continue
+
+            option_node = OptionNode(
+                name=option_name,
+                location=line_number,
+                config_type=self.get_config_type(option_name, value),
+            )
+            artifact.add_child(option_node)
+            option_node.add_child(ValueNode(name=value))
+
+        return artifact
+
+    @staticmethod
+    def _unquote(value: str) -> str:
+        """Remove quotes or a trailing comment from a value."""
+        if len(value) > 1 and value[0] in "\"'" and value[0] in value[1:]:
+            return value[1 : value.index(value[0], 1)]
+        return value.split(" #", 1)[0].strip()
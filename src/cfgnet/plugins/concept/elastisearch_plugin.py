@@ -16,10 +16,34 @@ import os
 from yaml.nodes import MappingNode
 from cfgnet.network.nodes import OptionNode, ValueNode
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 
 
 class ElasticsearchPlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.PATH, names=("path",)),
+            TypeRule(ConfigType.IP_ADDRESS, suffixes=("seed_hosts", "host")),
+            TypeRule(
+                ConfigType.NAME, suffixes=("name", "initial_master_nodes")
+            ),
+            TypeRule(ConfigType.BOOLEAN, suffixes=("enabled",)),
+            TypeRule(ConfigType.ID, suffixes=("id",)),
+            TypeRule(ConfigType.USERNAME, suffixes=("user", "users")),
+            TypeRule(ConfigType.SIZE, suffixes=("limit", "max_headroom")),
+            TypeRule(ConfigType.TYPE, suffixes=("type",)),
+            TypeRule(ConfigType.PORT, suffixes=("port",)),
+            TypeRule(ConfigType.PASSWORD, suffixes=("password",)),
+            TypeRule(ConfigType.NUMBER, suffixes=("threshold", "count")),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=("interval", "timeout", "time", "age"),
+            ),
+            TypeRule(ConfigType.SIZE, suffixes=("size",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("elasticsearch")
 
@@ -51,47 +75,3 @@ class ElasticsearchPlugin(YAMLPlugin):
                     index += 1
                 else:
                     self._iter_tree(child, parent)
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-
-        if option_name in ("path"):
-            return ConfigType.PATH
-
-        if option_name.endswith(("seed_hosts", "host")):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith(("name", "initial_master_nodes")):
-            return ConfigType.NAME
-
-        if option_name.endswith(("enabled")):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith(("id")):
-            return ConfigType.ID
-
-        if option_name.endswith(("user", "users")):
-            return ConfigType.USERNAME
-
-        if option_name.endswith(("limit", "max_headroom")):
-            return ConfigType.SIZE
-
-        if option_name.endswith(("type")):
-            return ConfigType.TYPE
-
-        if option_name.endswith(("port")):
-            return ConfigType.PORT
-
-        if option_name.endswith(("password")):
-            return ConfigType.PASSWORD
-
-        if option_name.endswith(("threshold", "count")):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(("interval", "timeout", "time", "age")):
-            return ConfigType.TIME
-
-        if option_name.endswith(("size")):
-            return ConfigType.SIZE
-
-        return super().get_config_type(option_name, value)
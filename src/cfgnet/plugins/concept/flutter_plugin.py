@@ -15,41 +15,45 @@
 import os
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class FlutterPlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.NAME, suffixes=("name", "description", "ref")),
+            TypeRule(
+                ConfigType.VERSION_NUMBER,
+                suffixes=(
+                    "version",
+                    "dependencies",
+                    "dev-dependencies",
+                    "environment",
+                ),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=("exectuables", "false_secrets", "path"),
+            ),
+            TypeRule(
+                ConfigType.URL,
+                suffixes=(
+                    "homepage",
+                    "issue_tracker",
+                    "documentation",
+                    "repository",
+                    "hosted",
+                    "url",
+                    "git",
+                    "funding",
+                ),
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("flutter")
 
     def is_responsible(self, abs_file_path) -> bool:
         file_name = os.path.basename(abs_file_path)
         return file_name == "pubspec.yaml"
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name.endswith(("name", "description", "ref")):
-            return ConfigType.NAME
-
-        if option_name.endswith(
-            ("version", "dependencies", "dev-dependencies", "environment")
-        ):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith(("exectuables", "false_secrets", "path")):
-            return ConfigType.PATH
-
-        if option_name.endswith(
-            (
-                "homepage",
-                "issue_tracker",
-                "documentation",
-                "repository",
-                "hosted",
-                "url",
-                "git",
-                "funding",
-            )
-        ):
-            return ConfigType.URL
-
-        return super().get_config_type(option_name, value)
@@ -15,9 +15,18 @@
 import re
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class GitHubActionPlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.COMMAND, names=("run",)),
+            TypeRule(ConfigType.NAME, names=("name", "uses")),
+            TypeRule(ConfigType.VERSION_NUMBER, names=("python-version",)),
+        ],
+    )
+
     file_name = re.compile(r".*?\.github\/workflows\/[^\/]*\.yml$")
 
     def __init__(self):
@@ -27,15 +36,3 @@ class GitHubActionPlugin(YAMLPlugin):
         if self.file_name.search(abs_file_path):
             return True
         return False
-
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in ("run"):
-            return ConfigType.COMMAND
-
-        if option_name in ("name", "uses"):
-            return ConfigType.NAME
-
-        if option_name in ("python-version"):
-            return ConfigType.VERSION_NUMBER
-
-        return super().get_config_type(option_name, value)
@@ -14,47 +14,40 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import os
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 
 
 class GradlePlugin(ConfigParserPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.PATH, suffixes=(".home", ".projectcachedir")),
+            TypeRule(ConfigType.NUMBER, suffixes=("max",)),
+            TypeRule(ConfigType.TIME, suffixes=(".idletimeout",)),
+            TypeRule(ConfigType.NUMBER, suffixes=(".worker.max",)),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                suffixes=(
+                    ".caching",
+                    ".debug",
+                    ".configuration-cache",
+                    "configureondemand",
+                    ".daemon",
+                    ".isolated-projects",
+                    ".verbose",
+                    ".watch",
+                ),
+            ),
+            TypeRule(
+                ConfigType.TYPE,
+                suffixes=(".console", ".level", ".priority", ".mode"),
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("gradle")
 
     def is_responsible(self, abs_file_path):
         file_name = os.path.basename(abs_file_path)
         return file_name == "gradle.properties"
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-
-        if option_name.endswith((".home", ".projectcachedir")):
-            return ConfigType.PATH
-
-        if option_name.endswith(("max")):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(".idletimeout"):
-            return ConfigType.TIME
-
-        if option_name.endswith(".worker.max"):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(
-            (
-                ".caching",
-                ".debug",
-                ".configuration-cache",
-                "configureondemand",
-                ".daemon",
-                ".isolated-projects",
-                ".verbose",
-                ".watch",
-            )
-        ):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith((".console", ".level", ".priority", ".mode")):
-            return ConfigType.TYPE
-
-        return super().get_config_type(option_name, value)
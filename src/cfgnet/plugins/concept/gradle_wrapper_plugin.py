@@ -15,11 +15,21 @@
 
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class GradleWrapperPlugin(ConfigParserPlugin):
     """Plugin for parsing Gradle wrapper properties files."""
 
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.URL, suffixes=("url",)),
+            TypeRule(
+                ConfigType.PATH, suffixes=("path", "base", "store", "zip")
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("gradle-wrapper")
 
@@ -31,16 +41,3 @@ class GradleWrapperPlugin(ConfigParserPlugin):
         :return bool: True if the plugin is responsible for the file
         """
         return abs_file_path.endswith("gradle-wrapper.properties")
-
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        """
-        Get the configuration type for a given option name and value.
-
-        :param option_name: Name of the option
-        :param value: Value of the option
-        """
-        if option_name.endswith("url"):
-            return ConfigType.URL
-        if option_name.endswith(("path", "base", "store", "zip")):
-            return ConfigType.PATH
-        return super().get_config_type(option_name, value)
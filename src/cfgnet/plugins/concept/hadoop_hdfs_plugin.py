@@ -1,9 +1,88 @@
 import os
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.hadoop_plugin import HadoopPlugin
 
 
 class HadoopHdfsPlugin(HadoopPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.NAME,
+                suffixes=("name", ".nameservices", ".hostname", ".interfaces"),
+            ),
+            TypeRule(ConfigType.VERSION_NUMBER, suffixes=(".version",)),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=(
+                    "ms",
+                    ".seconds",
+                    ".timeout",
+                    ".interval",
+                    ".duration",
+                    ".lifetime",
+                    ".millis",
+                    ".time",
+                ),
+            ),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    ".max",
+                    ".min",
+                    ".retries",
+                    ".threshold",
+                    ".count",
+                    ".ratio",
+                    ".threads",
+                    ".attempts",
+                    ".volume",
+                    ".weight",
+                    ".capacity",
+                ),
+            ),
+            TypeRule(ConfigType.URL, suffixes=(".url",)),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(
+                    ".keystore",
+                    ".file",
+                    ".path",
+                    ".truststore",
+                    ".dir",
+                    ".directories",
+                    ".resource",
+                    ".volumes",
+                ),
+            ),
+            TypeRule(ConfigType.PASSWORD, suffixes=(".password",)),
+            TypeRule(
+                ConfigType.USERNAME,
+                suffixes=(".users", ".username", ".staticuser.user"),
+            ),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                suffixes=(".enabled", ".enable", ".required"),
+            ),
+            TypeRule(
+                ConfigType.IP_ADDRESS,
+                suffixes=(
+                    ".host",
+                    ".http-address",
+                    ".http-addresses",
+                    "address",
+                ),
+            ),
+            TypeRule(ConfigType.PORT, suffixes=(".port",)),
+            TypeRule(ConfigType.TYPE, suffixes=(".mode",)),
+            TypeRule(
+                ConfigType.SIZE,
+                suffixes=(".buffer", ".blocksize", "size", ".mb", ".bytes"),
+            ),
+            TypeRule(ConfigType.ID, suffixes=(".id",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("hadoop-hdfs")
 
@@ -12,92 +91,3 @@ class HadoopHdfsPlugin(HadoopPlugin):
         return any(
             file_name == name for name in ["hdfs-site.xml", "hdfs-default.xml"]
         )
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-
-        if option_name.endswith(
-            ("name", ".nameservices", ".hostname", ".interfaces")
-        ):
-            return ConfigType.NAME
-
-        if option_name.endswith((".version")):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith(
-            (
-                "ms",
-                ".seconds",
-                ".timeout",
-                ".interval",
-                ".duration",
-                ".lifetime",
-                ".millis",
-                ".time",
-            )
-        ):
-            return ConfigType.TIME
-
-        if option_name.endswith(
-            (
-                ".max",
-                ".min",
-                ".retries",
-                ".threshold",
-                ".count",
-                ".ratio",
-                ".threads",
-                ".attempts",
-                ".volume",
-                ".weight",
-                ".capacity",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith((".url")):
-            return ConfigType.URL
-
-        if option_name.endswith(
-            (
-                ".keystore",
-                ".file",
-                ".path",
-                ".truststore",
-                ".dir",
-                ".directories",
-                ".resource",
-                ".volumes",
-            )
-        ):
-            return ConfigType.PATH
-
-        if option_name.endswith((".password")):
-            return ConfigType.PASSWORD
-
-        if option_name.endswith((".users", ".username", ".staticuser.user")):
-            return ConfigType.USERNAME
-
-        if option_name.endswith((".enabled", ".enable", ".required")):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith(
-            (".host", ".http-address", ".http-addresses", "address")
-        ):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith((".port")):
-            return ConfigType.PORT
-
-        if option_name.endswith((".mode")):
-            return ConfigType.TYPE
-
-        if option_name.endswith(
-            (".buffer", ".blocksize", "size", ".mb", ".bytes")
-        ):
-            return ConfigType.SIZE
-
-        if option_name.endswith((".id")):
-            return ConfigType.ID
-
-        return super().get_config_type(option_name, value)
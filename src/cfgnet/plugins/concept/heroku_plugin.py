@@ -15,11 +15,19 @@
 
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class HerokuPlugin(YAMLPlugin):
     """Plugin for parsing Heroku configuration files."""
 
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.COMMAND, names=("command", "web")),
+            TypeRule(ConfigType.IMAGE, names=("image",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("heroku")
 
@@ -31,19 +39,3 @@ class HerokuPlugin(YAMLPlugin):
         :return bool: True if the plugin is responsible for the file
         """
         return abs_file_path.endswith("heroku.yml")
-
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        """
-        Get the configuration type for a given option name and value.
-
-        :param option_name: Name of the option
-        :param value: Value of the option
-        :return: ConfigType for the option
-        """
-        if option_name in ("command", "web"):
-            return ConfigType.COMMAND
-
-        if option_name in ("image"):
-            return ConfigType.IMAGE
-
-        return super().get_config_type(option_name, value)
@@ -14,72 +14,54 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import os
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 
 
 class KafkaPlugin(ConfigParserPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.ID, suffixes=("broker.id", "client.id")),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(".dirs", ".dir", ".path", ".location"),
+            ),
+            TypeRule(ConfigType.TYPE, suffixes=(".type", ".level")),
+            TypeRule(ConfigType.NAME, suffixes=(".name", ".names")),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    ".threads",
+                    ".partitions",
+                    ".factor",
+                    ".requests",
+                    ".retries",
+                    ".ratio",
+                    ".rate",
+                    ".connections",
+                    ".limit",
+                    ".num",
+                    ".iterations",
+                ),
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=(".ms", ".second", ".hour", ".minute"),
+            ),
+            TypeRule(ConfigType.BOOLEAN, suffixes=(".enable",)),
+            TypeRule(ConfigType.URL, suffixes=("listeners",)),
+            TypeRule(ConfigType.SIZE, suffixes=(".bytes", ".size")),
+            TypeRule(ConfigType.VERSION_NUMBER, suffixes=(".version",)),
+            TypeRule(ConfigType.COMMAND, suffixes=(".cmd",)),
+            TypeRule(ConfigType.PASSWORD, suffixes=(".password",)),
+            TypeRule(ConfigType.USERNAME, suffixes=(".username",)),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("kafka")
 
     def is_responsible(self, abs_file_path: str) -> bool:
         file_name = os.path.basename(abs_file_path)
         return file_name == "server.properties"
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name.endswith(("broker.id", "client.id")):
-            return ConfigType.ID
-
-        if option_name.endswith((".dirs", ".dir", ".path", ".location")):
-            return ConfigType.PATH
-
-        if option_name.endswith((".type", ".level")):
-            return ConfigType.TYPE
-
-        if option_name.endswith((".name", ".names")):
-            return ConfigType.NAME
-
-        if option_name.endswith(
-            (
-                ".threads",
-                ".partitions",
-                ".factor",
-                ".requests",
-                ".retries",
-                ".ratio",
-                ".rate",
-                ".connections",
-                ".limit",
-                ".num",
-                ".iterations",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith((".ms", ".second", ".hour", ".minute")):
-            return ConfigType.TIME
-
-        if option_name.endswith((".enable")):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith(("listeners")):
-            return ConfigType.URL
-
-        if option_name.endswith((".bytes", ".size")):
-            return ConfigType.SIZE
-
-        if option_name.endswith((".version")):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith((".cmd")):
-            return ConfigType.COMMAND
-
-        if option_name.endswith((".password")):
-            return ConfigType.PASSWORD
-
-        if option_name.endswith((".username")):
-            return ConfigType.USERNAME
-
-        return super().get_config_type(option_name, value)
@@ -14,10 +14,47 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import os
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.hadoop_plugin import HadoopPlugin
 
 
 class MapReducePlugin(HadoopPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.NAME,
+                suffixes=("name", ".nameservices", ".hostname", ".interfaces"),
+            ),
+            TypeRule(ConfigType.VERSION_NUMBER, suffixes=(".version",)),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=("ms", ".sec", ".timeout", ".interval", ".hours"),
+            ),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    ".factor",
+                    ".threshold",
+                    ".count",
+                    ".limit",
+                    ".attempts",
+                ),
+            ),
+            TypeRule(ConfigType.URL, suffixes=(".url",)),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(".path", ".dir", ".location", ".filename"),
+            ),
+            TypeRule(ConfigType.PASSWORD, suffixes=(".password",)),
+            TypeRule(ConfigType.BOOLEAN, suffixes=(".enabled", ".needed")),
+            TypeRule(ConfigType.IP_ADDRESS, suffixes=(".address",)),
+            TypeRule(ConfigType.PORT, suffixes=(".port",)),
+            TypeRule(ConfigType.TYPE, suffixes=(".mode", ".level", ".type")),
+            TypeRule(ConfigType.SIZE, suffixes=(".size", ".mb", ".bytes")),
+            TypeRule(ConfigType.ID, suffixes=(".id",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("mapreduce")
 
@@ -27,52 +64,3 @@ class MapReducePlugin(HadoopPlugin):
             file_name == name
             for name in ["mapred-site.xml", "mapred-default.xml"]
         )
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name.endswith(
-            ("name", ".nameservices", ".hostname", ".interfaces")
-        ):
-            return ConfigType.NAME
-
-        if option_name.endswith((".version")):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith(
-            ("ms", ".sec", ".timeout", ".interval", ".hours")
-        ):
-            return ConfigType.TIME
-
-        if option_name.endswith(
-            (".factor", ".threshold", ".count", ".limit", ".attempts")
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith((".url")):
-            return ConfigType.URL
-
-        if option_name.endswith((".path", ".dir", ".location", ".filename")):
-            return ConfigType.PATH
-
-        if option_name.endswith((".password")):
-            return ConfigType.PASSWORD
-
-        if option_name.endswith((".enabled", ".needed")):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith((".address")):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith((".port")):
-            return ConfigType.PORT
-
-        if option_name.endswith((".mode", ".level", ".type")):
-            return ConfigType.TYPE
-
-        if option_name.endswith((".size", ".mb", ".bytes")):
-            return ConfigType.SIZE
-
-        if option_name.endswith((".id")):
-            return ConfigType.ID
-
-        return super().get_config_type(option_name, value)
@@ -16,11 +16,12 @@
 import logging
 import os
 
-from typing import Optional, Tuple, List
+from typing import Dict, Iterator, Optional, Tuple, List
 from lxml import etree as ET
-from lxml.etree import _Element, _Comment
+from lxml.etree import _Element
 
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.network.nodes import (
     ArtifactNode,
     Node,
@@ -29,6 +30,12 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.concept.maven_pom import PomCache, interpolate
+from cfgnet.plugins.file_type.xml_parser import XmlEvent, iter_xml_events
+
+# elements that are identified by their group, artifact id and version
+QUALIFIED_TAGS = frozenset(("dependency", "plugin"))
 
 TAGS_CONTAINING_LISTS = {
     "goal",
@@ -43,14 +50,76 @@ TAGS_CONTAINING_LISTS = {
 
 
 class MavenPlugin(Plugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.VERSION_NUMBER,
+                names=("modelVersion", "version", "source", "target", "maven"),
+            ),
+            TypeRule(
+                ConfigType.NAME,
+                names=(
+                    "groupId",
+                    "artifactId",
+                    "module",
+                    "name",
+                    "finalName",
+                    "organization",
+                    "role",
+                    "system",
+                ),
+            ),
+            TypeRule(ConfigType.TYPE, names=("packaging", "type")),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=(
+                    "uniqueVersion",
+                    "optional",
+                    "enabled",
+                    "filtering",
+                    "extensions",
+                    "inherited",
+                    "sendOnError",
+                    "sendOnFailure",
+                    "sendOnSuccess",
+                    "sendOnWarning",
+                ),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                names=("includes", "excludes", "filter", "file"),
+            ),
+            TypeRule(
+                ConfigType.PATH, names=("directory", "Directory", "Path")
+            ),
+            TypeRule(
+                ConfigType.URL,
+                names=("url", "organizationUrl", "picUrl", "downloadUrl"),
+            ),
+            TypeRule(
+                ConfigType.IP_ADDRESS,
+                names=(
+                    "address",
+                    "subscribe",
+                    "unsubscribe",
+                    "post",
+                    "archive",
+                ),
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("maven")
+        # models of parent and module POMs shared by all parsed files
+        self.pom_cache = PomCache()
 
     def _parse_config_file(
         self,
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         artifact = ArtifactNode(
             file_path=abs_file_path,
@@ -59,37 +128,25 @@ class MavenPlugin(Plugin):
             project_root=root,
         )
 
+        model = self.pom_cache.get_model(content)
+        self.pom_cache.get_modules(model, content)
+        properties = self.pom_cache.get_properties(model, content)
+
         try:
-            maven_tree = ET.parse(abs_file_path)
-            tree_root = maven_tree.getroot()
-
-            # Remove namespace prefixes and comments
-            for elem in tree_root.getiterator():
-                if elem.tag is not ET.Comment:
-                    elem.tag = ET.QName(elem).localname
-                for child in list(elem):
-                    if isinstance(child, _Comment):
-                        elem.remove(child)
-
-            # Remove unused namespace declarations
-            ET.cleanup_namespaces(tree_root)
-
-            option_root = OptionNode(
-                tree_root.tag,
-                tree_root.sourceline,
-                self.get_config_type(tree_root.tag),
+            self._parse_events(
+                iter_xml_events(content.data, subtree_tags=QUALIFIED_TAGS),
+                artifact,
+                properties,
             )
-            artifact.add_child(option_root)
-            for child in tree_root:
-                if child.tag is not ET.Comment:
-                    self.parse_tree(child, parent_node=option_root)
 
         except ET.Error as error:
             logging.warning(
                 'Failed to parse xml file "%s" due to %s', rel_file_path, error
             )
 
-        self._add_executable_name(artifact)
+        self._add_executable_name(
+            artifact, inherited_version=properties.get("project.version")
+        )
 
         return artifact
 
@@ -101,7 +158,51 @@ class MavenPlugin(Plugin):
 
         return False
 
-    def parse_tree(self, subtree_root: _Element, parent_node: Node):
+    def _parse_events(
+        self,
+        events: Iterator[Tuple[XmlEvent, _Element]],
+        artifact: ArtifactNode,
+        properties: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Build option and value nodes from a stream of XML events.
+
+        References to properties in values are replaced by their values.
+        """
+        stack: List[Tuple[Node, OptionNode]] = []
+        for event, element in events:
+            parent_node = stack[-1][1] if stack else artifact
+
+            if event == XmlEvent.SUBTREE:
+                self.parse_tree(element, parent_node, properties)
+
+            elif event == XmlEvent.START:
+                name = element.tag
+                option = OptionNode(
+                    name, element.sourceline, self.get_config_type(name)
+                )
+                parent_node.add_child(option)
+                stack.append((parent_node, option))
+
+            else:
+                parent_node, option = stack.pop()
+
+                text = element.text.strip() if element.text else None
+                if text:
+                    option.add_child(
+                        ValueNode(name=self._interpolate(text, properties))
+                    )
+
+                # remove option nodes without children except the root
+                if stack and not option.children:
+                    parent_node.children.remove(option)
+
+    def parse_tree(
+        self,
+        subtree_root: _Element,
+        parent_node: Node,
+        properties: Optional[Dict[str, str]] = None,
+    ):
         # Ensure the tag is a string before processing
         if not isinstance(subtree_root.tag, str):
             return  # Skip non-element nodes (like ProcessingInstructions)
@@ -116,8 +217,10 @@ class MavenPlugin(Plugin):
             parent_node.add_child(option)
 
             qualified_option = None
-            if name in ["dependency", "plugin"]:
-                qualified_name = self._get_fully_qualified_name(subtree_root)
+            if name in QUALIFIED_TAGS:
+                qualified_name = self._interpolate(
+                    self._get_fully_qualified_name(subtree_root), properties
+                )
                 config_type = self.get_config_type(qualified_name)
 
                 qualified_option = OptionNode(
@@ -132,20 +235,29 @@ class MavenPlugin(Plugin):
             if text:
                 text = text.strip()
                 if text:
-                    value_node = ValueNode(name=text)
+                    value_node = ValueNode(
+                        name=self._interpolate(text, properties)
+                    )
                     option.add_child(value_node)
 
             for child in subtree_root:
                 if child.tag is not ET.Comment:
                     if qualified_option:
-                        self.parse_tree(child, qualified_option)
+                        self.parse_tree(child, qualified_option, properties)
                     else:
-                        self.parse_tree(child, option)
+                        self.parse_tree(child, option, properties)
 
             # remove option nodes without children
             if not option.children:
                 parent_node.children.remove(option)
 
+    @staticmethod
+    def _interpolate(text: str, properties: Optional[Dict[str, str]]) -> str:
+        """Replace references to properties if properties are known."""
+        if not properties:
+            return text
+        return interpolate(text, properties)
+
     def _remove_prefix(self, name: str) -> str:
         """Remove the prefix in curly brackets."""
         return name.split("}")[-1]
@@ -172,7 +284,9 @@ class MavenPlugin(Plugin):
 
         return f"{groupID}:{artifactID}"
 
-    def _add_executable_name(self, artifact: ArtifactNode) -> None:
+    def _add_executable_name(
+        self, artifact: ArtifactNode, inherited_version: Optional[str] = None
+    ) -> None:
         try:
             option_nodes: List[OptionNode] = artifact.get_nodes(
                 node_type=OptionNode
@@ -191,7 +305,7 @@ class MavenPlugin(Plugin):
             artifactid_location = str(artifactid_node.location)
 
             version, version_location = self._get_version_for_executable_name(
-                project_option
+                project_option, inherited_version
             )
             (
                 packaging,
@@ -250,6 +364,7 @@ class MavenPlugin(Plugin):
     @staticmethod
     def _get_version_for_executable_name(
         project_option_node: OptionNode,
+        inherited_version: Optional[str] = None,
     ) -> Tuple[str, Optional[str]]:
         try:
             version_node = next(
@@ -266,6 +381,9 @@ class MavenPlugin(Plugin):
                 str(version_node.location),
             )
         except StopIteration:
+            # the version is inherited from the parent POM
+            if inherited_version:
+                return "-" + inherited_version, None
             return "", None
 
     @staticmethod
@@ -285,63 +403,3 @@ class MavenPlugin(Plugin):
             )
         except StopIteration:
             return "jar", None
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in (
-            "modelVersion",
-            "version",
-            "source",
-            "target",
-            "maven",
-        ):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name in (
-            "groupId",
-            "artifactId",
-            "module",
-            "name",
-            "finalName",
-            "organization",
-            "role",
-            "system",
-        ):
-            return ConfigType.NAME
-
-        if option_name in ("packaging", "type"):
-            return ConfigType.TYPE
-
-        if option_name in (
-            "uniqueVersion",
-            "optional",
-            "enabled",
-            "filtering",
-            "extensions",
-            "inherited",
-            "sendOnError",
-            "sendOnFailure",
-            "sendOnSuccess",
-            "sendOnWarning",
-        ):
-            return ConfigType.BOOLEAN
-
-        if option_name in ("includes", "excludes", "filter", "file"):
-            return ConfigType.PATH
-
-        if option_name in ("directory", "Directory", "Path"):
-            return ConfigType.PATH
-
-        if option_name in ("url", "organizationUrl", "picUrl", "downloadUrl"):
-            return ConfigType.URL
-
-        if option_name in (
-            "address",
-            "subscribe",
-            "unsubscribe",
-            "post",
-            "archive",
-        ):
-            return ConfigType.IP_ADDRESS
-
-        return super().get_config_type(option_name, value)
@@ -0,0 +1,366 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Inheritance and property interpolation of Maven POMs."""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from lxml import etree as ET
+
+from cfgnet.plugins.file_content import FileContent, FileSource
+from cfgnet.plugins.file_type.xml_parser import XmlEvent, iter_xml_events
+
+PROPERTY_REGEX = re.compile(r"\$\{([^}$]+)\}")
+
+# properties may refer to other properties, but not endlessly
+MAX_INTERPOLATION_DEPTH = 10
+
+# parents further up are most likely a cycle
+MAX_PARENT_DEPTH = 20
+
+# sections of a POM that never contain coordinates, properties or modules
+SKIPPED_TAGS = (
+    "dependencyManagement",
+    "dependencies",
+    "build",
+    "reporting",
+    "profiles",
+)
+
+COORDINATES = ("groupId", "artifactId", "version", "packaging")
+
+# coordinates that a POM inherits from its parent
+INHERITED_COORDINATES = ("groupId", "version")
+
+
+class PomModel:
+    """
+    Coordinates, properties, parent and modules of a POM.
+
+    Parameters
+    ----------
+    file_path: str
+        Absolute path of the POM.
+
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path: str = file_path
+        self.coordinates: Dict[str, str] = {}
+        self.parent: Optional[Dict[str, str]] = None
+        self.properties: Dict[str, str] = {}
+        self.modules: List[str] = []
+
+    @property
+    def group_id(self) -> Optional[str]:
+        """Return the group id, which may be inherited from the parent."""
+        group_id = self.coordinates.get("groupId")
+        if group_id is None and self.parent is not None:
+            return self.parent.get("groupId")
+        return group_id
+
+    @property
+    def artifact_id(self) -> Optional[str]:
+        """Return the artifact id."""
+        return self.coordinates.get("artifactId")
+
+    def observe(self, path: Sequence[str], text: str) -> None:
+        """
+        Record the text of an element of the POM.
+
+        :param path: Tags from the root element to the element
+        :param text: Stripped text of the element
+        """
+        if len(path) == 2:
+            tag = path[1]
+            if tag in COORDINATES:
+                self.coordinates[tag] = text
+            elif tag == "parent" and self.parent is None:
+                self.parent = {}
+        elif len(path) == 3:
+            section, tag = path[1], path[2]
+            if section == "parent":
+                if self.parent is None:
+                    self.parent = {}
+                self.parent[tag] = text
+            elif section == "properties":
+                self.properties[tag] = text
+            elif section == "modules" and tag == "module" and text:
+                self.modules.append(text)
+
+    def get_parent_path(self) -> Optional[str]:
+        """
+        Return the path at which the parent POM is expected.
+
+        :return: Absolute path or None if the lookup is disabled
+        """
+        if self.parent is None:
+            return None
+
+        relative_path = self.parent.get("relativePath", "../pom.xml")
+        if not relative_path:
+            return None
+
+        return self.resolve_pom_path(relative_path)
+
+    def get_module_paths(self) -> List[str]:
+        """Return the absolute paths of the POMs of all modules."""
+        return [self.resolve_pom_path(module) for module in self.modules]
+
+    def resolve_pom_path(self, relative_path: str) -> str:
+        """Resolve a path to a POM or its directory against this POM."""
+        path = os.path.normpath(
+            os.path.join(os.path.dirname(self.file_path), relative_path)
+        )
+        if not path.endswith(".xml"):
+            path = os.path.join(path, "pom.xml")
+        return path
+
+    def is_parent_of(self, model: PomModel) -> bool:
+        """Return true if the coordinates match the parent of a model."""
+        if model.parent is None:
+            return False
+        return self.group_id == model.parent.get(
+            "groupId"
+        ) and self.artifact_id == model.parent.get("artifactId")
+
+    @staticmethod
+    def from_content(content: FileContent) -> PomModel:
+        """
+        Extract the model of a POM.
+
+        Sections that cannot contribute to the model are skipped without
+        building their elements.
+
+        :param content: Content of the POM
+        :return: Model of the POM
+        """
+        model = PomModel(content.file_path)
+        path: List[str] = []
+        try:
+            for event, element in iter_xml_events(
+                content.data, subtree_tags=SKIPPED_TAGS
+            ):
+                if event == XmlEvent.START:
+                    path.append(element.tag)
+                elif event == XmlEvent.END:
+                    model.observe(path, (element.text or "").strip())
+                    path.pop()
+        except ET.Error as error:
+            logging.warning(
+                'Failed to parse xml file "%s" due to %s',
+                content.file_path,
+                error,
+            )
+        return model
+
+
+class PomCache:
+    """
+    Models of all POMs seen during a run.
+
+    Models are keyed by the path and the hash of the content of a POM, so
+    they stay valid across commits: a parent that does not change is parsed
+    once, no matter how many children refer to it and how many commits are
+    analyzed. The least recently used models are evicted once the cache is
+    full.
+
+    Models are also indexed by their coordinates to resolve parents that
+    are not at their relative path. This index is kept per file source, so
+    a parent is only resolved from the same commit or working tree, and it
+    is released together with the source.
+
+    Parameters
+    ----------
+    max_size: int
+        Maximum number of cached models.
+
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size: int = max_size
+        self._models: OrderedDict[Tuple[str, str], PomModel] = OrderedDict()
+        # most recent model of every group and artifact id per source
+        self._by_coordinates: WeakKeyDictionary[
+            FileSource, Dict[Tuple[str, str], PomModel]
+        ] = WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get_model(self, content: FileContent) -> PomModel:
+        """
+        Return the model of a POM, parsing it on first use.
+
+        :param content: Content of the POM
+        :return: Model of the POM
+        """
+        key = (content.file_path, content.digest)
+        model = self._models.get(key)
+        if model is not None:
+            self._models.move_to_end(key)
+        else:
+            model = PomModel.from_content(content)
+            self._models[key] = model
+            if len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+
+        if content.source is not None and model.group_id and model.artifact_id:
+            self._by_coordinates.setdefault(content.source, {})[
+                (model.group_id, model.artifact_id)
+            ] = model
+
+        return model
+
+    def get_parent(
+        self, model: PomModel, content: FileContent
+    ) -> Optional[PomModel]:
+        """
+        Resolve the parent of a POM.
+
+        The parent is looked up at its relative path first. Otherwise, a POM
+        with matching coordinates seen before is used, e.g. an aggregator
+        that lists the POM as module.
+
+        :param model: Model of the POM
+        :param content: Content of the POM, used to load other files
+        :return: Model of the parent or None if it cannot be resolved
+        """
+        if model.parent is None:
+            return None
+
+        parent_path = model.get_parent_path()
+        if parent_path is not None:
+            parent_content = content.load(parent_path)
+            if parent_content is not None:
+                parent = self.get_model(parent_content)
+                if parent.is_parent_of(model):
+                    return parent
+
+        if content.source is None:
+            return None
+
+        parent = self._by_coordinates.get(content.source, {}).get(
+            (
+                model.parent.get("groupId", ""),
+                model.parent.get("artifactId", ""),
+            )
+        )
+        if parent is not None and parent.file_path != model.file_path:
+            return parent
+        return None
+
+    def get_modules(
+        self, model: PomModel, content: FileContent
+    ) -> List[PomModel]:
+        """
+        Resolve the modules of an aggregator POM.
+
+        The data of the modules is kept by the source, so they are not read
+        again when they are parsed themselves.
+
+        :param model: Model of the aggregator
+        :param content: Content of the aggregator, used to load other files
+        :return: Models of all modules that exist
+        """
+        modules = []
+        for module_path in model.get_module_paths():
+            module_content = content.load(module_path)
+            if module_content is not None:
+                modules.append(self.get_model(module_content))
+        return modules
+
+    def get_properties(
+        self, model: PomModel, content: FileContent
+    ) -> Dict[str, str]:
+        """
+        Return all properties that can be referenced in a POM.
+
+        Properties are inherited along the chain of parents and can be
+        overridden by children. The coordinates of the project and its
+        parent are available as `project.*` properties.
+
+        :param model: Model of the POM
+        :param content: Content of the POM
+        :return: Properties by name
+        """
+        chain = [model]
+        visited: Set[str] = {model.file_path}
+        while len(chain) < MAX_PARENT_DEPTH:
+            parent = self.get_parent(chain[-1], content)
+            if parent is None or parent.file_path in visited:
+                break
+            visited.add(parent.file_path)
+            chain.append(parent)
+
+        properties: Dict[str, str] = {}
+        coordinates: Dict[str, str] = {}
+        for ancestor in reversed(chain):
+            properties.update(ancestor.properties)
+            coordinates = {
+                tag: value
+                for tag, value in coordinates.items()
+                if tag in INHERITED_COORDINATES
+            }
+            if ancestor.parent is not None:
+                for tag in COORDINATES:
+                    if tag in ancestor.parent:
+                        value = ancestor.parent[tag]
+                        coordinates[f"parent.{tag}"] = value
+                        if tag in INHERITED_COORDINATES:
+                            coordinates[tag] = value
+            coordinates.update(ancestor.coordinates)
+
+        for name, value in coordinates.items():
+            properties[f"project.{name}"] = value
+            properties[f"pom.{name}"] = value
+
+        return properties
+
+    def clear(self) -> None:
+        """Remove all cached models."""
+        self._models.clear()
+        self._by_coordinates.clear()
+
+
+def interpolate(text: str, properties: Dict[str, str]) -> str:
+    """
+    Replace references to properties in a text.
+
+    References to unknown properties are kept as they are.
+
+    :param text: Text that may contain references like `${name}`
+    :param properties: Properties by name
+    :return: Interpolated text
+    """
+    for _ in range(MAX_INTERPOLATION_DEPTH):
+        if "${" not in text:
+            break
+        interpolated = PROPERTY_REGEX.sub(
+            lambda match: properties.get(match.group(1), match.group(0)),
+            text,
+        )
+        if interpolated == text:
+            break
+        text = interpolated
+    return text
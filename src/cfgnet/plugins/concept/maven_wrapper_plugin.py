@@ -15,11 +15,18 @@
 
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class MavenWrapperPlugin(ConfigParserPlugin):
     """Plugin for parsing Maven wrapper properties files."""
 
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.URL, names=("distributionUrl", "wrapperUrl")),
+        ],
+    )
+
     def __init__(self):
         super().__init__("maven-wrapper")
 
@@ -31,14 +38,3 @@ class MavenWrapperPlugin(ConfigParserPlugin):
         :return bool: True if the plugin is responsible for the file
         """
         return abs_file_path.endswith("maven-wrapper.properties")
-
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        """
-        Get the configuration type for a given option name and value.
-
-        :param option_name: Name of the option
-        :param value: Value of the option
-        """
-        if option_name in ["distributionUrl", "wrapperUrl"]:
-            return ConfigType.URL
-        return super().get_config_type(option_name, value)
@@ -14,9 +14,48 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class MongoDBPlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    "verbosity",
+                    "connections",
+                    "level",
+                    "retries",
+                    "interval",
+                    "intervalms",
+                    "secs",
+                    "hours",
+                ),
+            ),
+            TypeRule(ConfigType.IP_ADDRESS, suffixes=("bindip",)),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=("thresholdss", "timeoutms", "seconds"),
+            ),
+            TypeRule(ConfigType.SIZE, suffixes=("sizemb", "sizegb")),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(
+                    "path",
+                    "destination",
+                    "timezoneinfo",
+                    "pathprefix",
+                    "file",
+                ),
+            ),
+            TypeRule(ConfigType.TYPE, suffixes=("format",)),
+            TypeRule(ConfigType.ID, suffixes=("keyidentifier",)),
+            TypeRule(ConfigType.NAME, suffixes=("name", "configdb")),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("mongodb")
 
@@ -24,56 +63,3 @@ class MongoDBPlugin(YAMLPlugin):
         if abs_file_path.endswith("mongod.conf"):
             return True
         return False
-
-    # pylint: disable=unused-argument,too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-        if option_name.endswith(
-            (
-                "verbosity",
-                "connections",
-                "level",
-                "retries",
-                "interval",
-                "intervalms",
-                "secs",
-                "hours",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith("bindip"):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith(
-            (
-                "thresholdss",
-                "timeoutms",
-                "seconds",
-            )
-        ):
-            return ConfigType.TIME
-
-        if option_name.endswith(
-            (
-                "sizemb",
-                "sizegb",
-            )
-        ):
-            return ConfigType.SIZE
-
-        if option_name.endswith(
-            ("path", "destination", "timezoneinfo", "pathprefix", "file")
-        ):
-            return ConfigType.PATH
-
-        if option_name.endswith("format"):
-            return ConfigType.TYPE
-
-        if option_name.endswith("keyidentifier"):
-            return ConfigType.ID
-
-        if option_name.endswith(("name", "configdb")):
-            return ConfigType.NAME
-
-        return super().get_config_type(option_name, value)
@@ -15,11 +15,21 @@
 
 from cfgnet.plugins.file_type.toml_plugin import TomlPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class NetlifyPlugin(TomlPlugin):
     """Plugin for parsing Netlify configuration files."""
 
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.COMMAND, suffixes=("command",)),
+            TypeRule(ConfigType.PATH, suffixes=("base", "publish", "path")),
+            TypeRule(ConfigType.URL, names=("url", "redirect")),
+            TypeRule(ConfigType.ENVIRONMENT, names=("environment",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("netlify")
 
@@ -31,25 +41,3 @@ class NetlifyPlugin(TomlPlugin):
         :return bool: True if the plugin is responsible for the file
         """
         return abs_file_path.endswith("netlify.toml")
-
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        """
-        Get the configuration type for a given option name and value.
-
-        :param option_name: Name of the option
-        :param value: Value of the option
-        :return: ConfigType for the option
-        """
-        if option_name.endswith("command"):
-            return ConfigType.COMMAND
-
-        if option_name.endswith(("base", "publish", "path")):
-            return ConfigType.PATH
-
-        if option_name in ("url", "redirect"):
-            return ConfigType.URL
-
-        if option_name in ("environment"):
-            return ConfigType.ENVIRONMENT
-
-        return super().get_config_type(option_name, value)
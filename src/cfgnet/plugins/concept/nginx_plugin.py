@@ -14,22 +14,109 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
-from typing import Optional
+import re
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.include_resolver import IncludeContext, IncludeResolver
 from cfgnet.network.nodes import (
     ArtifactNode,
+    Node,
     OptionNode,
     ProjectNode,
     ValueNode,
 )
 
+TOKEN_REGEX = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>\#[^\n]*)
+    | (?P<special>[;{}])
+    | (?P<quoted>"(?:[^"\\]|\\.)*"?|'(?:[^'\\]|\\.)*'?)
+    | (?P<word>
+        (?:\\.|\$\{[^}\s]*\}|[^\s;{}"'\\\#])
+        (?:\\.|\$\{[^}\s]*\}|[^\s;{}\\])*
+      )
+    | (?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+@dataclass
+class NginxDirective:
+    """
+    Directive of an Nginx configuration.
+
+    Parameters
+    ----------
+    name: str
+        Name of the directive.
+    args: List[str]
+        Arguments of the directive as written, including quotes.
+    line: int
+        Line on which the directive starts.
+    block: Optional[List[NginxDirective]]
+        Directives of the block, if the directive opens a block.
+
+    """
+
+    name: str
+    args: List[str]
+    line: int
+    block: Optional[List["NginxDirective"]] = field(default=None)
+
 
 class NginxPlugin(Plugin):
     """Plugin for parsing Nginx configuration files."""
 
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.PORT, names=("listen", "server_port")),
+            TypeRule(ConfigType.NAME, names=("server_name", "hostname")),
+            TypeRule(
+                ConfigType.PATH,
+                names=("root", "alias", "include", "access_log", "error_log"),
+            ),
+            TypeRule(
+                ConfigType.SIZE,
+                names=(
+                    "client_max_body_size",
+                    "proxy_buffer_size",
+                    "proxy_buffers",
+                ),
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                names=(
+                    "proxy_read_timeout",
+                    "proxy_connect_timeout",
+                    "keepalive_timeout",
+                ),
+            ),
+            TypeRule(ConfigType.URL, names=("proxy_pass", "fastcgi_pass")),
+            TypeRule(
+                ConfigType.PATH,
+                names=("ssl_certificate", "ssl_certificate_key"),
+            ),
+            TypeRule(ConfigType.TYPE, names=("ssl_protocols", "ssl_ciphers")),
+            TypeRule(
+                ConfigType.PASSWORD,
+                names=("auth_basic", "auth_basic_user_file"),
+            ),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("nginx")
+        self.includes: IncludeResolver[List[NginxDirective]] = IncludeResolver(
+            self.parse_directives
+        )
 
     def is_responsible(self, abs_file_path: str) -> bool:
         """Check if the plugin is responsible for the given file."""
@@ -41,6 +128,7 @@ class NginxPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         """Parse the Nginx configuration file."""
         artifact = ArtifactNode(
@@ -50,107 +138,160 @@ class NginxPlugin(Plugin):
             project_root=root,
         )
 
-        with open(abs_file_path, "r", encoding="utf-8") as file:
-            content = file.readlines()
+        # relative includes are resolved against the configuration directory
+        project_root = IncludeResolver.get_project_root(
+            abs_file_path, rel_file_path
+        )
+        context = IncludeContext(
+            content=content,
+            artifact_path=abs_file_path,
+            project_root=project_root,
+            base_dirs=[os.path.dirname(abs_file_path), project_root],
+        )
+
+        self._add_directives(
+            self.parse_directives(content), artifact, {}, context
+        )
+
+        return artifact
+
+    @staticmethod
+    def parse_directives(content: FileContent) -> List[NginxDirective]:
+        """
+        Parse the directives of an Nginx configuration in a single pass.
+
+        Statements may span several lines or share a line, and comments,
+        quotes and escapes are handled as by Nginx.
+
+        :param content: Content of the configuration file
+        :return: Directives on the top level, with nested blocks
+        """
+        directives: List[NginxDirective] = []
+        # directive lists of all open blocks
+        stack: List[List[NginxDirective]] = []
+        args: List[Tuple[str, int]] = []
 
-        current_block = []
-        for line_number, line in enumerate(content, 1):
-            line = line.strip()
-            if not line or line.startswith("#"):
+        for token, line, special in NginxPlugin._tokenize(content):
+            if not special:
+                args.append((token, line))
                 continue
 
-            if line.endswith("{"):
-                block_name = line[:-1].strip()
-                current_block.append(block_name)
-            elif line == "}":
-                if current_block:
-                    current_block.pop()
-            else:
-                parts = line.split(" ", 1)
-                if len(parts) == 2:
-                    option_name = parts[0]
-                    value = parts[1].rstrip(";")
-
-                    config_type = self.get_config_type(option_name, value)
-
-                    # If we're inside a block, create a block-level node
-                    if current_block:
-                        # Create nodes for each level of nesting
-                        parent = artifact
-                        for block_name in current_block:
-                            block_node = OptionNode(
-                                name=block_name,
-                                location=line_number,
-                                config_type=config_type,
-                            )
-                            parent.add_child(block_node)
-                            parent = block_node
-
-                        # Add the option node under the innermost block
-                        option_node = OptionNode(
-                            name=option_name,
-                            location=line_number,
-                            config_type=config_type,
-                        )
-                        parent.add_child(option_node)
-                        value_node = ValueNode(name=value)
-                        option_node.add_child(value_node)
-                    else:
-                        # Create regular node for non-block options
-                        option_node = OptionNode(
-                            name=option_name,
-                            location=line_number,
-                            config_type=config_type,
-                        )
-                        artifact.add_child(option_node)
-                        value_node = ValueNode(name=value)
-                        option_node.add_child(value_node)
+            if token == "}":
+                if stack:
+                    directives = stack.pop()
+                args = []
+                continue
 
-        return artifact
+            if not args:
+                continue
 
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        """Determine the configuration type based on the option name and value."""
-        option_name = option_name.lower()
+            directive = NginxDirective(
+                name=args[0][0],
+                args=[arg for arg, _ in args[1:]],
+                line=args[0][1],
+            )
+            directives.append(directive)
+            args = []
 
-        if option_name in ["listen", "server_port"]:
-            return ConfigType.PORT
+            if token == "{":
+                directive.block = []
+                stack.append(directives)
+                directives = directive.block
 
-        if option_name in ["server_name", "hostname"]:
-            return ConfigType.NAME
+        return stack[0] if stack else directives
 
-        if option_name in [
-            "root",
-            "alias",
-            "include",
-            "access_log",
-            "error_log",
-        ]:
-            return ConfigType.PATH
+    @staticmethod
+    def _tokenize(content: FileContent) -> Iterator[Tuple[str, int, bool]]:
+        """
+        Split an Nginx configuration into tokens.
 
-        if option_name in [
-            "client_max_body_size",
-            "proxy_buffer_size",
-            "proxy_buffers",
-        ]:
-            return ConfigType.SIZE
+        :param content: Content of the configuration file
+        :return: Iterator over tokens, their lines and whether they are one
+            of the special characters `;`, `{` or `}`
+        """
+        for match in TOKEN_REGEX.finditer(content.text):
+            kind = match.lastgroup
+            if kind in ("space", "comment"):
+                continue
+            yield (
+                match.group(),
+                content.get_line_number(match.start()),
+                kind == "special",
+            )
 
-        if option_name in [
-            "proxy_read_timeout",
-            "proxy_connect_timeout",
-            "keepalive_timeout",
-        ]:
-            return ConfigType.TIME
+    def _add_directives(
+        self,
+        directives: List[NginxDirective],
+        parent: Node,
+        blocks: Dict[str, OptionNode],
+        context: IncludeContext,
+    ) -> None:
+        """
+        Add option nodes for directives to a parent node.
+
+        Every block becomes one option node. Blocks with the same name and
+        parent share their node, so all their directives end up below it.
+        The directives of included files are added in place of the include
+        directive.
+
+        :param directives: Directives to add
+        :param parent: Node of the enclosing block or the artifact
+        :param blocks: Option nodes of all blocks by their id
+        :param context: File that defines the directives
+        """
+        for directive in directives:
+            name = directive.name
+            value = " ".join(directive.args)
+
+            if directive.block is not None:
+                if value:
+                    name = f"{name} {value}"
 
-        if option_name in ["proxy_pass", "fastcgi_pass"]:
-            return ConfigType.URL
+                block_id = f"{parent.id}::::{name}"
+                block_node = blocks.get(block_id)
+                if block_node is None:
+                    # only blocks with directives are added to the network
+                    if not self._has_values(directive.block):
+                        continue
+                    block_node = OptionNode(
+                        name=name,
+                        location=context.get_location(directive.line),
+                        config_type=self.get_config_type(directive.name),
+                    )
+                    parent.add_child(block_node)
+                    blocks[block_node.id] = block_node
 
-        if option_name in ["ssl_certificate", "ssl_certificate_key"]:
-            return ConfigType.PATH
+                self._add_directives(
+                    directive.block, block_node, blocks, context
+                )
+                continue
+
+            if not value:
+                continue
 
-        if option_name in ["ssl_protocols", "ssl_ciphers"]:
-            return ConfigType.TYPE
+            option_node = OptionNode(
+                name=name,
+                location=context.get_location(directive.line),
+                config_type=self.get_config_type(name, value),
+            )
+            parent.add_child(option_node)
+            option_node.add_child(ValueNode(name=value))
 
-        if option_name in ["auth_basic", "auth_basic_user_file"]:
-            return ConfigType.PASSWORD
+            if name == "include":
+                for fragment_context, fragment in self.includes.resolve(
+                    value, context
+                ):
+                    self._add_directives(
+                        fragment, parent, blocks, fragment_context
+                    )
 
-        return super().get_config_type(option_name, value)
+    @staticmethod
+    def _has_values(directives: List[NginxDirective]) -> bool:
+        """Return true if a directive with arguments occurs in a block."""
+        for directive in directives:
+            if directive.block is None:
+                if directive.args:
+                    return True
+            elif NginxPlugin._has_values(directive.block):
+                return True
+        return False
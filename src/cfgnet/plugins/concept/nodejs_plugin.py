@@ -14,9 +14,40 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.plugins.file_type.json_plugin import JsonPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class NodejsPlugin(JsonPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.VERSION_NUMBER,
+                names=(
+                    "version",
+                    "dependencies",
+                    "devDependencies",
+                    "peerDependencies",
+                    "optionalDependencies",
+                    "engines",
+                ),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                names=("main", "files", "man", "directories", "workspaces"),
+            ),
+            TypeRule(ConfigType.COMMAND, names=("scripts", "bin")),
+            TypeRule(ConfigType.NAME, names=("name", "bundledDependencies")),
+            TypeRule(ConfigType.URL, names=("url",)),
+            TypeRule(ConfigType.EMAIL, names=("email",)),
+            TypeRule(
+                ConfigType.UNKNOWN, names=("repository", "funding", "type")
+            ),
+            TypeRule(ConfigType.LICENSE, names=("license",)),
+            TypeRule(ConfigType.BOOLEAN, names=("private",)),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("nodejs")
         self.excluded_keys = [
@@ -30,40 +61,3 @@ class NodejsPlugin(JsonPlugin):
         if abs_file_path.endswith("package.json"):
             return True
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name in (
-            "version",
-            "dependencies",
-            "devDependencies",
-            "peerDependencies",
-            "optionalDependencies",
-            "engines",
-        ):
-            return ConfigType.VERSION_NUMBER
-        if option_name in (
-            "main",
-            "files",
-            "man",
-            "directories",
-            "workspaces",
-        ):
-            return ConfigType.PATH
-        if option_name in ("scripts", "bin"):
-            return ConfigType.COMMAND
-        if option_name in ("name", "bundledDependencies"):
-            return ConfigType.NAME
-        if option_name == "url":
-            return ConfigType.URL
-        if option_name == "email":
-            return ConfigType.EMAIL
-        if option_name in ("repository", "funding", "type"):
-            return ConfigType.UNKNOWN
-        if option_name == "license":
-            return ConfigType.LICENSE
-        if option_name == "private":
-            return ConfigType.BOOLEAN
-        return super().get_config_type(option_name, value)
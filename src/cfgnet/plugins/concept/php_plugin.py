@@ -14,10 +14,78 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from typing import List
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 
 
 class PhpPlugin(ConfigParserPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.USERNAME, suffixes=("default_pw",)),
+            TypeRule(
+                ConfigType.NAME,
+                names=(
+                    "instance_name",
+                    "default_db",
+                    "name",
+                    "user_agent",
+                    "timezone",
+                    "default_charset",
+                    "default_socket",
+                    "default_host",
+                    "SMTP",
+                ),
+            ),
+            TypeRule(
+                ConfigType.TYPE,
+                suffixes=("format", "http_output_conv_mimetypes"),
+            ),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=("max_len", "precision", "file_uploads", "number"),
+            ),
+            TypeRule(
+                ConfigType.SIZE,
+                names=(
+                    "memory_limit",
+                    "memory_consumption",
+                    "interned_strings_buffer",
+                    "max_file_size",
+                    "wsdl_cache_limit",
+                    "max_persistent",
+                    "max_links",
+                    "max_accelerated_files",
+                    "regex_retry_limit",
+                    "regex_stack_limit",
+                    "max_failover_attempts",
+                    "default_prefetch",
+                    "jit_blacklist_root_trace",
+                    "jit_blacklist_side_trace",
+                    "jit_max_loop_unrolls",
+                    "jit_max_recursive_calls",
+                    "jit_max_recursive_returns",
+                    "jit_max_polymorphic_calls",
+                    "backtrack_limit",
+                    "recursion_limit",
+                    "sid_length",
+                ),
+                suffixes=("size", "match_max"),
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                names=(
+                    "ping_interval",
+                    "cookie_lifetime",
+                    "cache_expire",
+                    "upload_progress.min_freq",
+                ),
+                suffixes=("cache_ttl", "timeout"),
+            ),
+            TypeRule(ConfigType.TYPE, names=("default_mimetype",)),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("php")
         self.excluded_keys: List[str] = ["extension"]
@@ -26,81 +94,3 @@ class PhpPlugin(ConfigParserPlugin):
         if abs_file_path.endswith("php.ini"):
             return True
         return False
-
-    # pylint: disable=unused-argument,too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name.endswith(("default_pw")):
-            return ConfigType.USERNAME
-
-        if option_name in (
-            "instance_name",
-            "default_db",
-            "name",
-            "user_agent",
-            "timezone",
-            "default_db",
-            "default_charset",
-            "default_socket",
-            "default_host",
-            "SMTP",
-        ):
-            return ConfigType.NAME
-
-        if option_name.endswith(("format", "http_output_conv_mimetypes")):
-            return ConfigType.TYPE
-
-        if option_name.endswith(
-            (
-                "max_len",
-                "precision",
-                "file_uploads",
-                "number",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name in (
-            "memory_limit",
-            "memory_consumption",
-            "interned_strings_buffer",
-            "max_file_size",
-            "wsdl_cache_limit",
-            "max_persistent",
-            "max_links",
-            "max_accelerated_files",
-            "regex_retry_limit",
-            "regex_stack_limit",
-            "max_failover_attempts",
-            "default_prefetch",
-            "jit_blacklist_root_trace",
-            "jit_blacklist_side_trace",
-            "jit_max_loop_unrolls",
-            "jit_max_recursive_calls",
-            "jit_max_recursive_returns",
-            "jit_max_polymorphic_calls",
-            "backtrack_limit",
-            "recursion_limit",
-            "sid_length",
-        ):
-            return ConfigType.SIZE
-
-        if option_name.endswith(("size", "match_max")):
-            return ConfigType.SIZE
-
-        if option_name.endswith(("cache_ttl", "timeout")):
-            return ConfigType.TIME
-
-        if option_name in (
-            "ping_interval",
-            "cookie_lifetime",
-            "cache_expire",
-            "upload_progress.min_freq",
-        ):
-            return ConfigType.TIME
-
-        if option_name in ("default_mimetype"):
-            return ConfigType.TYPE
-
-        return super().get_config_type(option_name, value)
@@ -14,9 +14,33 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.plugins.file_type.toml_plugin import TomlPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class PoetryPlugin(TomlPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.NAME, names=("name",)),
+            TypeRule(ConfigType.LICENSE, names=("license",)),
+            TypeRule(
+                ConfigType.URL,
+                names=(
+                    "homepage",
+                    "repository",
+                    "documentation",
+                    "urls",
+                    "url",
+                ),
+            ),
+            TypeRule(ConfigType.PATH, names=("include", "exclude")),
+            TypeRule(
+                ConfigType.VERSION_NUMBER,
+                names=("version", "dependencies", "dev-dependencies"),
+            ),
+            TypeRule(ConfigType.COMMAND, names=("scripts",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("poetry")
         self.excluded_keys = [
@@ -32,25 +56,3 @@ class PoetryPlugin(TomlPlugin):
         if abs_file_path.endswith("pyproject.toml"):
             return True
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name == "name":
-            return ConfigType.NAME
-        if option_name == "license":
-            return ConfigType.LICENSE
-        if option_name in (
-            "homepage",
-            "repository",
-            "documentation",
-            "urls",
-            "url",
-        ):
-            return ConfigType.URL
-        if option_name in ("include", "exclude"):
-            return ConfigType.PATH
-        if option_name in ("version", "dependencies", "dev-dependencies"):
-            return ConfigType.VERSION_NUMBER
-        if option_name == "scripts":
-            return ConfigType.COMMAND
-        return super().get_config_type(option_name, value)
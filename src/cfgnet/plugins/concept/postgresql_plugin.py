@@ -15,9 +15,84 @@
 
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class PostgreSQLPlugin(ConfigParserPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.NAME, suffixes=("_name", "_names", "_hostname")
+            ),
+            TypeRule(ConfigType.IP_ADDRESS, suffixes=("_addresses",)),
+            TypeRule(
+                ConfigType.NUMBER,
+                suffixes=(
+                    "_connections",
+                    "_iterations",
+                    "_permissions",
+                    "_count",
+                    "_buffers",
+                    "_transactions",
+                    "_depth",
+                    "_pages",
+                    "_concurrency",
+                    "_workers",
+                    "_senders",
+                    "_slots",
+                    "_subscription",
+                    "_cost",
+                    "_threshold",
+                    "_seed",
+                    "_generations",
+                    "_fraction",
+                    "_rate",
+                    "_length",
+                    "_factor",
+                    "_age",
+                ),
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=(
+                    "_timeout",
+                    "_interval",
+                    "_delay",
+                    "_time",
+                    "_timestamp",
+                    "_duration",
+                ),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(
+                    "_file",
+                    "_files",
+                    "_dir",
+                    "_directories",
+                    "_keyfile",
+                    "_directory",
+                    "_destination",
+                    "_path",
+                    "_filename",
+                ),
+            ),
+            TypeRule(
+                ConfigType.VERSION_NUMBER,
+                suffixes=("_version", "_version_num"),
+            ),
+            TypeRule(ConfigType.COMMAND, suffixes=("_command",)),
+            TypeRule(
+                ConfigType.SIZE,
+                suffixes=("_size", "_mem", "_limit", "_memory"),
+            ),
+            TypeRule(ConfigType.TYPE, suffixes=("_type", "_level")),
+            TypeRule(ConfigType.ID, suffixes=("_xid", "_ident", "_id")),
+            TypeRule(ConfigType.PORT, suffixes=("port",)),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("postgresql")
 
@@ -25,88 +100,3 @@ class PostgreSQLPlugin(ConfigParserPlugin):
         if abs_file_path.endswith("postgresql.conf"):
             return True
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        option_name = option_name.lower()
-
-        if option_name.endswith(("_name", "_names", "_hostname")):
-            return ConfigType.NAME
-
-        if option_name.endswith("_addresses"):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith(
-            (
-                "_connections",
-                "_iterations",
-                "_permissions",
-                "_count",
-                "_buffers",
-                "_transactions",
-                "_depth",
-                "_pages",
-                "_concurrency",
-                "_workers",
-                "_senders",
-                "_slots",
-                "_subscription",
-                "_cost",
-                "_threshold",
-                "_seed",
-                "_generations",
-                "_fraction",
-                "_rate",
-                "_length",
-                "_factor",
-                "_age",
-            )
-        ):
-            return ConfigType.NUMBER
-
-        if option_name.endswith(
-            (
-                "_timeout",
-                "_interval",
-                "_delay",
-                "_time",
-                "_timestamp",
-                "_duration",
-            )
-        ):
-            return ConfigType.TIME
-
-        if option_name.endswith(
-            (
-                "_file",
-                "_files",
-                "_dir",
-                "_directories",
-                "_keyfile",
-                "_directory",
-                "_destination",
-                "_path",
-                "_filename",
-            )
-        ):
-            return ConfigType.PATH
-
-        if option_name.endswith(("_version", "_version_num")):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith("_command"):
-            return ConfigType.COMMAND
-
-        if option_name.endswith(("_size", "_mem", "_limit", "_memory")):
-            return ConfigType.SIZE
-
-        if option_name.endswith(("_type", "_level")):
-            return ConfigType.TYPE
-
-        if option_name.endswith(("_xid", "_ident", "_id")):
-            return ConfigType.ID
-
-        if option_name.endswith("port"):
-            return ConfigType.PORT
-
-        return super().get_config_type(option_name, value)
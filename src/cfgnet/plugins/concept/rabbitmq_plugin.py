@@ -15,12 +15,49 @@
 
 import os
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 
 
 class RabbitMQPlugin(ConfigParserPlugin):
     """Plugin for parsing RabbitMQ configuration files."""
 
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.PORT,
+                names=("listeners.tcp.default", "management.tcp.port"),
+            ),
+            TypeRule(
+                ConfigType.TYPE,
+                names=("cluster_nodes", "cluster_partition_handling"),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                names=("log.file", "config_files", "enabled_plugins"),
+            ),
+            TypeRule(
+                ConfigType.SIZE,
+                names=("vm_memory_high_watermark", "disk_free_limit"),
+            ),
+            TypeRule(
+                ConfigType.NUMBER,
+                names=("heartbeat", "channel_max", "frame_max"),
+            ),
+            TypeRule(
+                ConfigType.PASSWORD, names=("default_user", "default_pass")
+            ),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=("loopback_users", "collect_statistics"),
+            ),
+            TypeRule(
+                ConfigType.TYPE, names=("auth_mechanisms", "auth_backends")
+            ),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("rabbitmq")
 
@@ -28,33 +65,3 @@ class RabbitMQPlugin(ConfigParserPlugin):
         """Check if the plugin is responsible for the given file."""
         file_name = os.path.basename(abs_file_path)
         return file_name.endswith("rabbitmq.conf")
-
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        """Determine the configuration type based on the option name and value."""
-        option_name = option_name.lower()
-
-        if option_name in ["listeners.tcp.default", "management.tcp.port"]:
-            return ConfigType.PORT
-
-        if option_name in ["cluster_nodes", "cluster_partition_handling"]:
-            return ConfigType.TYPE
-
-        if option_name in ["log.file", "config_files", "enabled_plugins"]:
-            return ConfigType.PATH
-
-        if option_name in ["vm_memory_high_watermark", "disk_free_limit"]:
-            return ConfigType.SIZE
-
-        if option_name in ["heartbeat", "channel_max", "frame_max"]:
-            return ConfigType.NUMBER
-
-        if option_name in ["default_user", "default_pass"]:
-            return ConfigType.PASSWORD
-
-        if option_name in ["loopback_users", "collect_statistics"]:
-            return ConfigType.BOOLEAN
-
-        if option_name in ["auth_mechanisms", "auth_backends"]:
-            return ConfigType.TYPE
-
-        return super().get_config_type(option_name)
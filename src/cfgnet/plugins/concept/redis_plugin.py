@@ -16,7 +16,9 @@
 import os
 from typing import Optional
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
 from cfgnet.network.nodes import (
     ArtifactNode,
     OptionNode,
@@ -28,6 +30,35 @@ from cfgnet.network.nodes import (
 class RedisPlugin(Plugin):
     """Plugin for parsing Redis configuration files."""
 
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.PORT, names=("port", "cluster-port")),
+            TypeRule(
+                ConfigType.IP_ADDRESS, names=("bind", "cluster-announce-ip")
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                names=("dir", "dbfilename", "logfile", "pidfile"),
+            ),
+            TypeRule(
+                ConfigType.SIZE,
+                names=("maxmemory", "maxmemory-policy", "maxmemory-samples"),
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                names=("timeout", "tcp-keepalive", "repl-timeout"),
+            ),
+            TypeRule(ConfigType.PASSWORD, names=("requirepass", "masterauth")),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=("daemonize", "protected-mode", "appendonly"),
+            ),
+            TypeRule(ConfigType.NUMBER, names=("databases", "maxclients")),
+            TypeRule(ConfigType.TYPE, names=("loglevel",)),
+        ],
+        ignore_case=True,
+    )
+
     def __init__(self):
         super().__init__("redis")
 
@@ -41,6 +72,7 @@ class RedisPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         """Parse the Redis configuration file."""
         artifact = ArtifactNode(
@@ -50,10 +82,7 @@ class RedisPlugin(Plugin):
             project_root=root,
         )
 
-        with open(abs_file_path, "r", encoding="utf-8") as file:
-            content = file.readlines()
-
-        for line_number, line in enumerate(content, 1):
+        for line_number, line in enumerate(content.lines, 1):
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
@@ -78,40 +107,3 @@ class RedisPlugin(Plugin):
                 option_node.add_child(value_node)
 
         return artifact
-
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        """Determine the configuration type based on the option name and value."""
-        option_name = option_name.lower()
-
-        if option_name in ["port", "cluster-port"]:
-            return ConfigType.PORT
-
-        if option_name in ["bind", "cluster-announce-ip"]:
-            return ConfigType.IP_ADDRESS
-
-        if option_name in ["dir", "dbfilename", "logfile", "pidfile"]:
-            return ConfigType.PATH
-
-        if option_name in [
-            "maxmemory",
-            "maxmemory-policy",
-            "maxmemory-samples",
-        ]:
-            return ConfigType.SIZE
-
-        if option_name in ["timeout", "tcp-keepalive", "repl-timeout"]:
-            return ConfigType.TIME
-
-        if option_name in ["requirepass", "masterauth"]:
-            return ConfigType.PASSWORD
-
-        if option_name in ["daemonize", "protected-mode", "appendonly"]:
-            return ConfigType.BOOLEAN
-
-        if option_name in ["databases", "maxclients"]:
-            return ConfigType.NUMBER
-
-        if option_name in ["loglevel"]:
-            return ConfigType.TYPE
-
-        return super().get_config_type(option_name, value)
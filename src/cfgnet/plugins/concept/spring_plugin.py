@@ -15,7 +15,7 @@
 import configparser
 import logging
 import re
-from typing import Optional, Dict
+from typing import Optional
 import flatdict
 import yaml
 from cfgnet.network.nodes import (
@@ -25,10 +25,109 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.line_index import LineIndex
+from cfgnet.plugins.file_type.yaml_plugin import YAML_FULL_LOADER
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class SpringPlugin(Plugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.BOOLEAN,
+                suffixes=(
+                    ".show-sql",
+                    ".cache",
+                    ".trace",
+                    ".await-termination",
+                    ".pool.allow-core-thread-timeout",
+                    ".wait-for-jobs-to-complete-on-shutdown",
+                    ".auto-startup",
+                    ".use-code-as-default-message",
+                    ".fallback-to-system-locale",
+                    ".always-use-message-format",
+                    ".register-shutdown-hook",
+                    ".log-startup-info",
+                    ".lazy-initialization",
+                    ".allow-circular-references",
+                    ".allow-bean-definition-overriding",
+                    ".unique-names",
+                    ".use-legacy-processing",
+                    ".log-request-details",
+                    ".ignore",
+                    ".image.invert",
+                    "debug",
+                    ".clean-history-on-start",
+                    ".aop.auto",
+                    ".proxy-target-class",
+                    ".enabled",
+                ),
+            ),
+            TypeRule(
+                ConfigType.SIZE,
+                suffixes=(
+                    "size",
+                    ".max-file-size",
+                    ".total-size-cap",
+                    ".image.width",
+                    ".max-in-memory-size",
+                    ".image.height",
+                    ".pool.size",
+                    ".max-history",
+                    ".core-size",
+                    ".pool.max-size",
+                ),
+            ),
+            TypeRule(
+                ConfigType.NAME,
+                suffixes=(
+                    "platform",
+                    "-name",
+                    ".database",
+                    ".authentication-database",
+                    ".provider",
+                    ".scheduler-name",
+                    ".jmx-name",
+                    ".name",
+                    ".jmx.server",
+                    ".active",
+                    ".basenames",
+                    ".profiles.default",
+                ),
+            ),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(
+                    ".location",
+                    ".file",
+                    ".jdbc.schema",
+                    ".config",
+                    ".path",
+                    ".image",
+                ),
+            ),
+            TypeRule(
+                ConfigType.URL,
+                suffixes=(".default-domain", ".host", ".uri", "url", "-uri"),
+            ),
+            TypeRule(
+                ConfigType.TIME,
+                suffixes=(
+                    ".timeout-per-shutdown-phase",
+                    ".startup-delay",
+                    "pool.keep-alive",
+                    ".await-termination-period",
+                ),
+            ),
+            TypeRule(ConfigType.PORT, suffixes=(".port",)),
+            TypeRule(ConfigType.USERNAME, suffixes=(".username",)),
+            TypeRule(ConfigType.PASSWORD, suffixes=(".password",)),
+            TypeRule(ConfigType.EMAIL, suffixes=(".mail",)),
+        ],
+    )
+
     application_yaml_regex = re.compile(r"application(.(dev|prod)+)?.yml")
     application_properties_regex = re.compile(
         r"application(.(dev|prod)+)?.properties"
@@ -51,6 +150,7 @@ class SpringPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         if abs_file_path.endswith(".yml"):
             artifact = ArtifactNode(
@@ -61,7 +161,7 @@ class SpringPlugin(Plugin):
             )
 
             self._parse_yml_file(
-                abs_file_path=abs_file_path,
+                content=content,
                 rel_file_path=rel_file_path,
                 artifact=artifact,
             )
@@ -76,7 +176,7 @@ class SpringPlugin(Plugin):
         )
 
         self._parse_properties_file(
-            abs_file_path=abs_file_path,
+            content=content,
             rel_file_path=rel_file_path,
             artifact=artifact,
         )
@@ -85,22 +185,13 @@ class SpringPlugin(Plugin):
 
     def _parse_properties_file(
         self,
-        abs_file_path: str,
+        content: FileContent,
         rel_file_path: str,
         artifact: ArtifactNode,
     ):
         """Parse spring properties files."""
-        with open(abs_file_path, "r", encoding="utf-8") as file:
-            line_dict = {}
-            lineno = 1
-            for line in file:
-                line = line.strip()
-                if len(line) > 0:
-                    line_dict[line] = lineno
-                lineno += 1
-
-        with open(abs_file_path, "r", encoding="utf-8") as config_file:
-            file_content = config_file.read()
+        file_content = content.text
+        line_index = content.get_line_index(LineIndex.for_ini)
 
         try:
             dummy_section = "[dummy_section]\n"
@@ -136,8 +227,8 @@ class SpringPlugin(Plugin):
                 config_type = self.get_config_type(option_name=option)
                 option_node = OptionNode(
                     name=option,
-                    location=self.get_line_number(
-                        option_name=option, line_dict=line_dict
+                    location=LineIndex.to_location(
+                        line_index.get_line(option)
                     ),
                     config_type=config_type,
                 )
@@ -158,46 +249,22 @@ class SpringPlugin(Plugin):
                     logging.warning('Empty value in file "%s"', rel_file_path)
                     parent.children.remove(option_node)
 
-    def get_line_number(self, option_name: str, line_dict: Dict) -> str:
-        """
-        Get line number from line dictionary.
-
-        :param option_name: option name in line
-        :param line_dict: dictionary of lines
-        :return: line number as string
-        """
-        for line in line_dict.keys():
-            if option_name in line:
-                lineno = line_dict[line]
-                del line_dict[line]
-                return str(lineno)
-        return "Unknown"
-
     # pylint: disable=broad-except
     def _parse_yml_file(
         self,
-        abs_file_path: str,
+        content: FileContent,
         rel_file_path: str,
         artifact: ArtifactNode,
     ):
         """Parse spring yml files."""
-        with open(abs_file_path, "r", encoding="utf-8") as file:
-            line_number_dict = {}
-            lineno = 1
-            for line in file:
-                line = line.strip()
-                if len(line) > 0:
-                    line_number_dict[line] = lineno
-                lineno += 1
-
         try:
-            with open(abs_file_path, encoding="utf-8") as yaml_file:
-                parsed_yaml = yaml.load(yaml_file, Loader=yaml.FullLoader)
-                yaml_dict = flatdict.FlatDict(parsed_yaml, ".")
-                if len(yaml_dict) != 0:
-                    for key, values in yaml_dict.items():
-                        if isinstance(values, list):
-                            yaml_dict[key] = ", ".join(values)
+            line_index = content.get_line_index(LineIndex.for_yaml)
+            parsed_yaml = yaml.load(content.text, Loader=YAML_FULL_LOADER)
+            yaml_dict = flatdict.FlatDict(parsed_yaml, ".")
+            if len(yaml_dict) != 0:
+                for key, values in yaml_dict.items():
+                    if isinstance(values, list):
+                        yaml_dict[key] = ", ".join(values)
         except Exception as error:
             logging.warning(
                 'Failed to parse yml file "%s"'
@@ -208,8 +275,8 @@ class SpringPlugin(Plugin):
             return
 
         for key, value in yaml_dict.items():
-            line_number = self.get_line_number(
-                option_name=key.split(".")[-1], line_dict=line_number_dict
+            line_number = LineIndex.to_location(
+                line_index.get_path_line(key.split("."))
             )
             config_type = self.get_config_type(key)
             option = OptionNode(
@@ -218,112 +285,3 @@ class SpringPlugin(Plugin):
             artifact.add_child(option)
             value = ValueNode(name=value)
             option.add_child(value)
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name.endswith(
-            (
-                ".show-sql",
-                ".cache",
-                ".trace",
-                ".await-termination",
-                ".pool.allow-core-thread-timeout",
-                ".wait-for-jobs-to-complete-on-shutdown",
-                ".auto-startup",
-                ".use-code-as-default-message",
-                ".fallback-to-system-locale",
-                ".always-use-message-format",
-                ".register-shutdown-hook",
-                ".log-startup-info",
-                ".lazy-initialization",
-                ".allow-circular-references",
-                ".allow-bean-definition-overriding",
-                ".unique-names",
-                ".use-legacy-processing",
-                ".log-request-details",
-                ".ignore",
-                ".image.invert",
-                "debug",
-                ".clean-history-on-start",
-                ".register-shutdown-hook",
-                ".aop.auto",
-                ".proxy-target-class",
-                ".enabled",
-            )
-        ):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith(
-            (
-                "size",
-                ".max-file-size",
-                ".total-size-cap",
-                ".image.width",
-                ".max-in-memory-size",
-                ".image.height",
-                ".pool.size",
-                ".max-history",
-                ".core-size",
-                ".pool.max-size",
-            )
-        ):
-            return ConfigType.SIZE
-
-        if option_name.endswith(
-            (
-                "platform",
-                "-name",
-                ".database",
-                ".authentication-database",
-                ".provider",
-                ".scheduler-name",
-                ".jmx-name",
-                ".name",
-                ".jmx.server",
-                ".active",
-                ".basenames",
-                ".profiles.default",
-            )
-        ):
-            return ConfigType.NAME
-
-        if option_name.endswith(
-            (
-                ".location",
-                ".file",
-                ".jdbc.schema",
-                ".config",
-                ".path",
-                ".image",
-            )
-        ):
-            return ConfigType.PATH
-
-        if option_name.endswith(
-            (".default-domain", ".host", ".uri", "url", "-uri")
-        ):
-            return ConfigType.URL
-
-        if option_name.endswith(
-            (
-                ".timeout-per-shutdown-phase",
-                ".startup-delay",
-                "pool.keep-alive",
-                ".await-termination-period",
-            )
-        ):
-            return ConfigType.TIME
-
-        if option_name.endswith(".port"):
-            return ConfigType.PORT
-
-        if option_name.endswith(".username"):
-            return ConfigType.USERNAME
-
-        if option_name.endswith(".password"):
-            return ConfigType.PASSWORD
-
-        if option_name.endswith(".mail"):
-            return ConfigType.EMAIL
-
-        return super().get_config_type(option_name, value)
@@ -18,9 +18,56 @@ from yaml.nodes import MappingNode, ScalarNode
 from cfgnet.network.nodes import OptionNode
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class TravisPlugin(YAMLPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.COMMAND,
+                names=(
+                    "before_install",
+                    "before_script",
+                    "script",
+                    "install",
+                    "before_cache",
+                    "after_success",
+                    "after_failure",
+                    "before_deploy",
+                    "after_deploy",
+                    "after_script",
+                ),
+            ),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=("submodules", "quiet", "lfs_skip_smudge"),
+            ),
+            TypeRule(ConfigType.URL, names=("hosts",)),
+            TypeRule(ConfigType.PLATFORM, names=("os", "arch")),
+            TypeRule(
+                ConfigType.NAME,
+                names=("name", "services", "hostname", "dist", "compiler"),
+            ),
+            TypeRule(ConfigType.ENVIRONMENT, names=("env",)),
+            TypeRule(
+                ConfigType.PATH,
+                substrings=("file", "File", "FILE", "folder", "FOLDER"),
+            ),
+            TypeRule(ConfigType.NUMBER, names=("depth",)),
+            TypeRule(
+                ConfigType.VERSION_NUMBER,
+                names=(
+                    "version",
+                    "firefox",
+                    "mariadb",
+                    "postgresql",
+                    "rethinkdb",
+                ),
+            ),
+        ],
+    )
+
     def __init__(self):
         super().__init__("travis")
 
@@ -54,55 +101,3 @@ class TravisPlugin(YAMLPlugin):
                 return virtual_option
 
         return None
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in (
-            "before_install",
-            "before_script",
-            "script",
-            "before_script",
-            "install",
-            "before_cache",
-            "after_success",
-            "after_failure",
-            "before_deploy",
-            "after_deploy",
-            "after_script",
-        ):
-            return ConfigType.COMMAND
-
-        if option_name in ("submodules", "quiet", "lfs_skip_smudge"):
-            return ConfigType.BOOLEAN
-
-        if option_name == "hosts":
-            return ConfigType.URL
-
-        if option_name in ("os", "arch"):
-            return ConfigType.PLATFORM
-
-        if option_name in ("name", "services", "hostname", "dist", "compiler"):
-            return ConfigType.NAME
-
-        if option_name == "env":
-            return ConfigType.ENVIRONMENT
-
-        if any(
-            x in option_name
-            for x in ["file", "File", "FILE", "folder", "FOLDER"]
-        ):
-            return ConfigType.PATH
-
-        if option_name == "depth":
-            return ConfigType.NUMBER
-
-        if option_name in (
-            "version",
-            "firefox",
-            "mariadb",
-            "postgresql",
-            "rethinkdb",
-        ):
-            return ConfigType.VERSION_NUMBER
-
-        return super().get_config_type(option_name, value)
@@ -14,9 +14,49 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 from cfgnet.plugins.file_type.json_plugin import JsonPlugin
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 
 
 class TsconfigPlugin(JsonPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(
+                ConfigType.PATH,
+                names=(
+                    "files",
+                    "outFile",
+                    "include",
+                    "exclude",
+                    "extends",
+                    "baseUrl",
+                    "paths",
+                    "rootDir",
+                    "rootDirs",
+                    "typeRoots",
+                    "mapRoot",
+                ),
+            ),
+            TypeRule(
+                ConfigType.BOOLEAN,
+                names=(
+                    "noImplicitAny",
+                    "removeComments",
+                    "preserveConstEnums",
+                    "sourceMap",
+                    "allowJs",
+                    "strictNullChecks",
+                    "allowUnreachableCode",
+                    "allowUnusedLabels",
+                    "emitBOM",
+                    "noEmitOnError",
+                    "disableSizeLimit",
+                    "allowSyntheticDefaultImports",
+                ),
+            ),
+            TypeRule(ConfigType.NAME, names=("types",)),
+        ],
+    )
+
     def __init__(self):
         super().__init__("tsconfig")
         self.excluded_keys = []
@@ -25,44 +65,3 @@ class TsconfigPlugin(JsonPlugin):
         if abs_file_path.endswith("tsconfig.json"):
             return True
         return False
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name in (
-            "files",
-            "outFile",
-            "include",
-            "exclude",
-            "extends",
-            "baseUrl",
-            "paths",
-            "rootDir",
-            "rootDirs",
-            "typeRoots",
-            "mapRoot",
-        ):
-            return ConfigType.PATH
-
-        if option_name in (
-            "noImplicitAny",
-            "removeComments",
-            "preserveConstEnums",
-            "sourceMap",
-            "allowJs",
-            "strictNullChecks",
-            "allowUnreachableCode",
-            "allowUnusedLabels",
-            "emitBOM",
-            "noEmitOnError",
-            "preserveConstEnums",
-            "removeComments"
-            "allowJs"
-            "disableSizeLimit"
-            "allowSyntheticDefaultImports",
-        ):
-            return ConfigType.BOOLEAN
-
-        if option_name == "types":
-            return ConfigType.NAME
-
-        return super().get_config_type(option_name, value)
@@ -14,53 +14,42 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import os
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
 from cfgnet.plugins.file_type.hadoop_plugin import HadoopPlugin
 
 
 class YarnPlugin(HadoopPlugin):
+    type_rules = TypeRules(
+        [
+            TypeRule(ConfigType.NAME, suffixes=(".hostname",)),
+            TypeRule(ConfigType.VERSION_NUMBER, suffixes=(".version",)),
+            TypeRule(ConfigType.TIME, suffixes=("ms", ".timeout")),
+            TypeRule(
+                ConfigType.NUMBER, suffixes=(".thread-count", "-retries")
+            ),
+            TypeRule(ConfigType.URL, suffixes=(".uri",)),
+            TypeRule(
+                ConfigType.PATH,
+                suffixes=(
+                    ".include-path",
+                    ".exclude-path",
+                    ".local-dirs",
+                    "path",
+                    ".dir",
+                    ".root-dir",
+                ),
+            ),
+            TypeRule(ConfigType.BOOLEAN, suffixes=(".enable",)),
+            TypeRule(
+                ConfigType.IP_ADDRESS, suffixes=(".bind-host", ".address")
+            ),
+            TypeRule(ConfigType.ID, suffixes=(".cluster-id", ".id")),
+        ],
+    )
+
     def __init__(self):
         super().__init__("yarn")
 
     def is_responsible(self, abs_file_path: str) -> bool:
         file_name = os.path.basename(abs_file_path)
         return file_name == "yarn-site.xml"
-
-    # pylint: disable=too-many-return-statements
-    def get_config_type(self, option_name: str, value: str = "") -> ConfigType:
-        if option_name.endswith((".hostname")):
-            return ConfigType.NAME
-
-        if option_name.endswith((".version")):
-            return ConfigType.VERSION_NUMBER
-
-        if option_name.endswith(("ms", ".timeout")):
-            return ConfigType.TIME
-
-        if option_name.endswith((".thread-count", "-retries")):
-            return ConfigType.NUMBER
-
-        if option_name.endswith((".uri")):
-            return ConfigType.URL
-
-        if option_name.endswith(
-            (
-                ".include-path",
-                ".exclude-path",
-                ".local-dirs",
-                "path",
-                ".dir",
-                ".root-dir",
-            )
-        ):
-            return ConfigType.PATH
-
-        if option_name.endswith((".enable")):
-            return ConfigType.BOOLEAN
-
-        if option_name.endswith((".bind-host", ".address")):
-            return ConfigType.IP_ADDRESS
-
-        if option_name.endswith((".cluster-id", ".id")):
-            return ConfigType.ID
-
-        return super().get_config_type(option_name, value)
@@ -0,0 +1,365 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Content of a configuration file that is read once and shared."""
+
+from __future__ import annotations
+
+import abc
+import glob
+import hashlib
+import os
+
+from bisect import bisect_right
+from fnmatch import fnmatchcase
+from typing import Callable, Dict, List, Optional, Set
+
+from cfgnet.plugins.line_index import LineIndex
+from cfgnet.vcs.git_objects import GitObjectReader
+
+
+class FileContent:
+    """
+    Raw bytes of a configuration file with lazily derived views.
+
+    Plugins get the content of a file as a `FileContent` instead of opening
+    the file themselves, so every artifact is read from disk exactly once.
+    The text is decoded on first access and newlines are translated like
+    in text mode. Lines, line offsets and key indexes are derived from the
+    text on demand and cached, so plugins that need them share the work.
+
+    Parameters
+    ----------
+    data: bytes
+        Raw content of the file.
+    file_path: str
+        Absolute path of the file.
+    encoding: str
+        Encoding used to decode the text.
+    source: FileSource
+        Source of the file, used to load other files, e.g. from the working
+        tree or a commit.
+
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        file_path: str = "",
+        encoding: str = "utf-8",
+        source: Optional[FileSource] = None,
+    ) -> None:
+        self.data: bytes = data
+        self.file_path: str = file_path
+        self.encoding: str = encoding
+        self.source: Optional[FileSource] = source
+        self._digest: Optional[str] = None
+        self._text: Optional[str] = None
+        self._lines: Optional[List[str]] = None
+        self._line_offsets: Optional[List[int]] = None
+        self._line_indexes: Dict[Callable[[str], LineIndex], LineIndex] = {}
+
+    @staticmethod
+    def from_file(
+        file_path: str,
+        encoding: str = "utf-8",
+        source: Optional[FileSource] = None,
+    ) -> FileContent:
+        """
+        Read the content of a file.
+
+        :param file_path: Absolute path of the file
+        :param encoding: Encoding used to decode the text
+        :param source: Source of referenced files, the whole working tree
+            if not given
+        :return: Content of the file
+        """
+        with open(file_path, "rb") as file:
+            return FileContent(
+                file.read(), file_path, encoding, source=source or WORKING_TREE
+            )
+
+    def load(self, file_path: str) -> Optional[FileContent]:
+        """
+        Load another file from the same source as this content.
+
+        Plugins use this to follow references to other files, so that a file
+        parsed from a commit only sees files of the same commit.
+
+        :param file_path: Absolute path of the file
+        :return: Content of the file or None if it does not exist
+        """
+        if self.source is None:
+            return None
+        return self.source.load(file_path)
+
+    def glob(self, pattern: str) -> List[str]:
+        """
+        Find files of the same source as this content.
+
+        :param pattern: Absolute path that may contain wildcards
+        :return: Sorted absolute paths of all matching files
+        """
+        if self.source is None:
+            return []
+        return self.source.glob(pattern)
+
+    @property
+    def digest(self) -> str:
+        """Return a hash of the raw content, e.g. to key caches."""
+        if self._digest is None:
+            self._digest = hashlib.sha1(self.data).hexdigest()
+        return self._digest
+
+    @property
+    def text(self) -> str:
+        """
+        Return the decoded text with universal newlines.
+
+        :raises UnicodeDecodeError: If the content cannot be decoded
+        """
+        if self._text is None:
+            text = self.data.decode(self.encoding)
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            self._text = text
+        return self._text
+
+    @property
+    def lines(self) -> List[str]:
+        """Return the lines of the text including their line endings."""
+        if self._lines is None:
+            self._lines = self.text.splitlines(keepends=True)
+        return self._lines
+
+    def get_line_number(self, offset: int) -> int:
+        """
+        Return the line that contains a character of the text.
+
+        :param offset: Offset of the character in the text
+        :return: Line number starting at 1
+        """
+        if self._line_offsets is None:
+            offsets = [0]
+            position = self.text.find("\n")
+            while position != -1:
+                offsets.append(position + 1)
+                position = self.text.find("\n", position + 1)
+            self._line_offsets = offsets
+        return bisect_right(self._line_offsets, offset)
+
+    def get_line_index(self, build: Callable[[str], LineIndex]) -> LineIndex:
+        """
+        Return a key index of the text, building it on first use.
+
+        :param build: Function building the index, e.g. `LineIndex.for_ini`
+        :return: Line index of the text
+        """
+        if build not in self._line_indexes:
+            self._line_indexes[build] = build(self.text)
+        return self._line_indexes[build]
+
+
+class FileSource(abc.ABC):
+    """
+    Source from which plugins load files referenced by other files.
+
+    Sources of a project are created for a single network. They keep the
+    data of every file they read, so a file that is referenced by several
+    artifacts, e.g. a parent POM, or that is an artifact itself is read
+    once per network.
+
+    Parameters
+    ----------
+    project_root: Optional[str]
+        Absolute path of the project root. Files outside of it are not
+        loaded. All files can be loaded if no project root is given, in
+        which case neither data nor dependencies are kept.
+    dependencies: Set[str]
+        Paths and patterns of all files requested from the source, relative
+        to the project root. Changes of these files can change a network.
+
+    """
+
+    def __init__(self, project_root: Optional[str] = None) -> None:
+        self.project_root: Optional[str] = project_root
+        self.dependencies: Set[str] = set()
+        self._data: Dict[str, Optional[bytes]] = {}
+
+    def contains(self, file_path: str) -> bool:
+        """Return true if a file is inside the project root."""
+        return self._get_rel_path(file_path) is not None
+
+    def _get_rel_path(self, file_path: str) -> Optional[str]:
+        """Return a path relative to the project root if it is inside."""
+        if self.project_root is None:
+            return file_path
+        rel_file_path = os.path.relpath(file_path, self.project_root)
+        if rel_file_path == os.pardir or rel_file_path.startswith(
+            os.pardir + os.sep
+        ):
+            return None
+        return rel_file_path
+
+    def _add_dependency(self, rel_path: str) -> None:
+        if self.project_root is not None:
+            self.dependencies.add(rel_path)
+
+    def load(self, file_path: str) -> Optional[FileContent]:
+        """
+        Load a file that is referenced by another file.
+
+        :param file_path: Absolute path of the file
+        :return: Content of the file or None if it does not exist
+        """
+        rel_file_path = self._get_rel_path(file_path)
+        if rel_file_path is None:
+            return None
+        self._add_dependency(rel_file_path)
+        return self.read(file_path)
+
+    def read(self, file_path: str) -> Optional[FileContent]:
+        """
+        Read a file without recording it as dependency, e.g. an artifact.
+
+        :param file_path: Absolute path of the file
+        :return: Content of the file or None if it does not exist
+        """
+        rel_file_path = self._get_rel_path(file_path)
+        if rel_file_path is None:
+            return None
+
+        if rel_file_path in self._data:
+            data = self._data[rel_file_path]
+        else:
+            data = self._read_data(file_path, rel_file_path)
+            if self.project_root is not None:
+                self._data[rel_file_path] = data
+
+        if data is None:
+            return None
+        return FileContent(data, file_path, source=self)
+
+    @abc.abstractmethod
+    def _read_data(
+        self, file_path: str, rel_file_path: str
+    ) -> Optional[bytes]:
+        """
+        Read the raw data of a file.
+
+        :param file_path: Absolute path of the file
+        :param rel_file_path: Path of the file relative to the project root
+        :return: Data of the file or None if it does not exist
+        """
+
+    @abc.abstractmethod
+    def glob(self, pattern: str) -> List[str]:
+        """
+        Find files matching a pattern.
+
+        Wildcards do not match the path separator.
+
+        :param pattern: Absolute path that may contain wildcards
+        :return: Sorted absolute paths of all matching files
+        """
+
+
+class WorkingTreeSource(FileSource):
+    """Files on disk."""
+
+    def _read_data(
+        self, file_path: str, rel_file_path: str
+    ) -> Optional[bytes]:
+        if not os.path.isfile(file_path):
+            return None
+        try:
+            with open(file_path, "rb") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def glob(self, pattern: str) -> List[str]:
+        rel_pattern = self._get_rel_path(pattern)
+        if rel_pattern is None:
+            return []
+        self._add_dependency(rel_pattern)
+        return sorted(
+            path
+            for path in glob.glob(pattern)
+            if os.path.isfile(path) and self.contains(path)
+        )
+
+
+class CommitSource(FileSource):
+    """
+    Files of a project at a commit, read from git blobs.
+
+    Parameters
+    ----------
+    reader: GitObjectReader
+        Object reader of the repository.
+    commit: str
+        Commit whose files are loaded.
+    project_root: str
+        Absolute path of the project root.
+    blobs: Dict[str, str]
+        Blob ids of files that are already known by their relative path.
+
+    """
+
+    def __init__(
+        self,
+        reader: GitObjectReader,
+        commit: str,
+        project_root: str,
+        blobs: Dict[str, str],
+    ) -> None:
+        super().__init__(project_root)
+        self.reader: GitObjectReader = reader
+        self.commit: str = commit
+        self.blobs: Dict[str, str] = blobs
+        self._files: Optional[List[str]] = None
+
+    def _read_data(
+        self, file_path: str, rel_file_path: str
+    ) -> Optional[bytes]:
+        if rel_file_path in self.blobs:
+            return self.reader.read_blob_by_sha(self.blobs[rel_file_path])
+        return self.reader.read_blob(self.commit, rel_file_path)
+
+    def glob(self, pattern: str) -> List[str]:
+        rel_pattern = self._get_rel_path(pattern)
+        if rel_pattern is None:
+            return []
+        self._add_dependency(rel_pattern)
+        if self._files is None:
+            self._files = self.reader.list_files(self.commit)
+
+        parts = rel_pattern.split(os.sep)
+        return [
+            os.path.join(self.project_root, file)
+            for file in self._files
+            if self._matches(file.split("/"), parts)
+        ]
+
+    @staticmethod
+    def _matches(path: List[str], pattern: List[str]) -> bool:
+        if len(path) != len(pattern):
+            return False
+        return all(map(fnmatchcase, path, pattern))
+
+
+# files are read from the working tree unless a plugin is given other content
+WORKING_TREE = WorkingTreeSource()
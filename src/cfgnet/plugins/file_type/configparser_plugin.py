@@ -16,10 +16,11 @@ import configparser
 import logging
 import re
 from collections import OrderedDict
-from typing import List, Dict
+from typing import List
 
 from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.line_index import LineIndex
 
 
 class MultiOrderedDict(OrderedDict):
@@ -38,7 +39,7 @@ class ConfigParserPlugin(Plugin):
             super().__init__(name)
         self.excluded_keys: List[str] = []
 
-    def _parse_config_file(self, abs_file_path, rel_file_path, root):
+    def _parse_config_file(self, abs_file_path, rel_file_path, root, content):
         artifact = ArtifactNode(
             file_path=abs_file_path,
             rel_file_path=rel_file_path,
@@ -46,17 +47,8 @@ class ConfigParserPlugin(Plugin):
             project_root=root,
         )
 
-        with open(abs_file_path, "r", encoding="utf-8") as file:
-            line_dict = {}
-            lineno = 1
-            for line in file:
-                line = line.strip()
-                if len(line) > 0:
-                    line_dict[line] = lineno
-                lineno += 1
-
-        with open(abs_file_path, "r", encoding="utf-8") as config_file:
-            file_content = config_file.read()
+        file_content = content.text
+        line_index = content.get_line_index(LineIndex.for_ini)
 
         try:
             if self.concept_name == "php":
@@ -95,14 +87,12 @@ class ConfigParserPlugin(Plugin):
             # become a node in our network
             if section_name == "dummy_section":
                 parent = artifact
+                section_line = 0
             else:
-                line_number = (
-                    self.get_line_number(
-                        option_name=section_name, line_dict=line_dict
-                    ),
-                )
+                section_line = line_index.get_line(section_name) or 0
                 section_node = OptionNode(
-                    name=section_name, location=line_number
+                    name=section_name,
+                    location=LineIndex.to_location(section_line or None),
                 )
                 artifact.add_child(section_node)
                 parent = section_node
@@ -111,12 +101,10 @@ class ConfigParserPlugin(Plugin):
                 if option in self.excluded_keys:
                     continue
                 config_type = self.get_config_type(option_name=option)
-                line_number = self.get_line_number(
-                    option_name=option, line_dict=line_dict
-                )
+                line_number = line_index.get_line(option, after=section_line)
                 option_node = OptionNode(
                     name=option,
-                    location=line_number,
+                    location=LineIndex.to_location(line_number),
                     config_type=config_type,
                 )
                 parent.add_child(option_node)
@@ -149,18 +137,3 @@ class ConfigParserPlugin(Plugin):
 
     def is_responsible(self, abs_file_path):
         return re.match(r".*\.(ini|properties)$", abs_file_path)
-
-    def get_line_number(self, option_name: str, line_dict: Dict) -> str:
-        """
-        Get line number from line dictionary.
-
-        :param option_name: option name in line
-        :param line_dict: dictionary of lines
-        :return: line number as string
-        """
-        for line in line_dict.keys():
-            if option_name in line:
-                lineno = line_dict[line]
-                del line_dict[line]
-                return str(lineno)
-        return "Unknown"
@@ -15,7 +15,7 @@
 
 import logging
 
-from typing import Optional
+from typing import List, Optional
 from lxml import etree as ET
 from lxml.etree import _Element
 
@@ -28,6 +28,8 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.file_type.xml_parser import XmlEvent, iter_xml_events
 
 
 class HadoopPlugin(Plugin):
@@ -42,6 +44,7 @@ class HadoopPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         artifact = ArtifactNode(
             file_path=abs_file_path,
@@ -51,25 +54,28 @@ class HadoopPlugin(Plugin):
         )
 
         try:
-            tree = ET.parse(abs_file_path)
-            tree_root = tree.getroot()
-
-            # Remove namespace prefixes
-            for elem in tree_root.getiterator():
-                if elem.tag is not ET.Comment:
-                    elem.tag = ET.QName(elem).localname
-            # Remove unused namespace declarations
-            ET.cleanup_namespaces(tree_root)
-
-            option_root = OptionNode(
-                tree_root.tag,
-                tree_root.sourceline,
-                self.get_config_type(tree_root.tag),
-            )
-            artifact.add_child(option_root)
-            for child in tree_root:
-                if child.tag is not ET.Comment:
-                    self.parse_tree(child, parent_node=option_root)
+            stack: List[OptionNode] = []
+            for event, element in iter_xml_events(
+                content.data, subtree_tags=("property",)
+            ):
+                parent_node = stack[-1] if stack else artifact
+
+                if event == XmlEvent.SUBTREE:
+                    self.parse_tree(element, parent_node)
+
+                elif event == XmlEvent.START:
+                    name = element.tag
+                    option = OptionNode(
+                        name, element.sourceline, self.get_config_type(name)
+                    )
+                    parent_node.add_child(option)
+                    stack.append(option)
+
+                else:
+                    option = stack.pop()
+                    # the root option is kept even without children
+                    if stack:
+                        self._add_text(element, option, stack[-1])
 
         except ET.Error as error:
             logging.warning(
@@ -97,9 +103,9 @@ class HadoopPlugin(Plugin):
 
                 # Capture property details
                 for child in subtree:
-                    if child.tag == "name":
+                    if child.tag == "name" and child.text:
                         property_name = child.text.strip()
-                    elif child.tag == "value":
+                    elif child.tag == "value" and child.text:
                         property_value = child.text.strip()
 
                 if property_name:
@@ -131,21 +137,28 @@ class HadoopPlugin(Plugin):
                     #    description_node = ValueNode(name=property_description)
                     #    option_desc.add_child(description_node)
 
+                # remove properties without a name
+                if not property_option.children:
+                    parent_node.children.remove(property_option)
+
             else:
                 config_type = self.get_config_type(name)
                 option = OptionNode(name, subtree.sourceline, config_type)
                 parent_node.add_child(option)
 
-                value_name = subtree.text.strip()
+                for child in subtree:
+                    self.parse_tree(child, option)
+
+                self._add_text(subtree, option, parent_node)
 
-                if value_name:
-                    value_node = ValueNode(name=value_name)
-                    option.add_child(value_node)
-                else:
-                    for child in subtree:
-                        if child.tag is not ET.Comment:
-                            self.parse_tree(child, option)
+    @staticmethod
+    def _add_text(element: _Element, option: OptionNode, parent_node: Node):
+        """Add the text of an element or drop its option if it is empty."""
+        value_name = element.text.strip() if element.text else ""
+
+        if value_name:
+            option.add_child(ValueNode(name=value_name))
 
-            # remove option nodes without children
-            if not option.children:
-                parent_node.children.remove(option)
+        # remove option nodes without children
+        if not option.children:
+            parent_node.children.remove(option)
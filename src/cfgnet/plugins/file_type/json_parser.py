@@ -0,0 +1,194 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Single-pass JSON tokenizer that keeps track of line numbers."""
+
+import re
+
+from enum import Enum, auto
+from json import JSONDecodeError
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from typing import Any, Iterator, List, Tuple
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+CONSTANTS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+CONSTANT_RE = re.compile(r"true|false|null|NaN|Infinity|-Infinity")
+
+
+class JsonEvent(Enum):
+    START_OBJECT = auto()
+    END_OBJECT = auto()
+    START_ARRAY = auto()
+    END_ARRAY = auto()
+    KEY = auto()
+    VALUE = auto()
+
+
+# (event, key or decoded value, line number)
+Event = Tuple[JsonEvent, Any, int]
+
+
+def iter_json_events(text: str) -> Iterator[Event]:
+    """
+    Tokenize a JSON document in a single pass.
+
+    Events are emitted in document order together with the line on which
+    the token starts. Values are decoded like `json.loads` does. Nesting
+    is tracked with an explicit stack, so deeply nested documents do not
+    hit the recursion limit. The document itself is not copied, but has
+    to be in memory, as it is shared with other plugins.
+
+    :param text: JSON document
+    :return: Iterator over events of the document
+    :raises JSONDecodeError: If the document is not valid JSON
+    """
+    position = 0
+    line = 1
+    line_position = 0
+
+    def line_at(index: int) -> int:
+        nonlocal line, line_position
+        line += text.count("\n", line_position, index)
+        line_position = index
+        return line
+
+    # open containers, either "{" or "["
+    stack: List[str] = []
+    expect_value = True
+
+    while True:
+        position = WHITESPACE.match(text, position).end()
+
+        if expect_value:
+            char = text[position : position + 1]
+            if char == "{":
+                yield JsonEvent.START_OBJECT, None, line_at(position)
+                stack.append("{")
+                position = WHITESPACE.match(text, position + 1).end()
+                if text[position : position + 1] == "}":
+                    stack.pop()
+                    yield JsonEvent.END_OBJECT, None, line_at(position)
+                    position += 1
+                    expect_value = False
+                else:
+                    position = yield from _scan_key(text, position, line_at)
+                continue
+            if char == "[":
+                yield JsonEvent.START_ARRAY, None, line_at(position)
+                stack.append("[")
+                position = WHITESPACE.match(text, position + 1).end()
+                if text[position : position + 1] == "]":
+                    stack.pop()
+                    yield JsonEvent.END_ARRAY, None, line_at(position)
+                    position += 1
+                    expect_value = False
+                continue
+
+            value, end = _scan_scalar(text, position)
+            yield JsonEvent.VALUE, value, line_at(position)
+            position = end
+            expect_value = False
+            continue
+
+        if not stack:
+            if position != len(text):
+                raise JSONDecodeError("Extra data", text, position)
+            return
+
+        char = text[position : position + 1]
+        if char == ",":
+            position = WHITESPACE.match(text, position + 1).end()
+            if stack[-1] == "{":
+                position = yield from _scan_key(text, position, line_at)
+            expect_value = True
+        elif char == "}" and stack[-1] == "{":
+            stack.pop()
+            yield JsonEvent.END_OBJECT, None, line_at(position)
+            position += 1
+        elif char == "]" and stack[-1] == "[":
+            stack.pop()
+            yield JsonEvent.END_ARRAY, None, line_at(position)
+            position += 1
+        else:
+            raise JSONDecodeError("Expecting ',' delimiter", text, position)
+
+
+def skip_json_value(events: Iterator[Event], event: Event) -> None:
+    """
+    Consume all events of the value that starts with the given event.
+
+    :param events: Iterator over events of a document
+    :param event: First event of the value to skip
+    """
+    depth = 0
+    while True:
+        if event[0] in (JsonEvent.START_OBJECT, JsonEvent.START_ARRAY):
+            depth += 1
+        elif event[0] in (JsonEvent.END_OBJECT, JsonEvent.END_ARRAY):
+            depth -= 1
+
+        if depth == 0:
+            return
+        event = next(events)
+
+
+def _scan_key(text: str, position: int, line_at) -> Iterator[Event]:
+    """Scan an object key and the following colon."""
+    if text[position : position + 1] != '"':
+        raise JSONDecodeError(
+            "Expecting property name enclosed in double quotes",
+            text,
+            position,
+        )
+
+    key, end = scanstring(text, position + 1)
+    yield JsonEvent.KEY, key, line_at(position)
+
+    end = WHITESPACE.match(text, end).end()
+    if text[end : end + 1] != ":":
+        raise JSONDecodeError("Expecting ':' delimiter", text, end)
+
+    return end + 1
+
+
+def _scan_scalar(text: str, position: int) -> Tuple[Any, int]:
+    """Scan a string, number or constant value."""
+    char = text[position : position + 1]
+    if char == '"':
+        return scanstring(text, position + 1)
+
+    number = NUMBER_RE.match(text, position)
+    if number is not None:
+        integer, fraction, exponent = number.groups()
+        if fraction or exponent:
+            value = float(integer + (fraction or "") + (exponent or ""))
+        else:
+            value = int(integer)
+        return value, number.end()
+
+    constant = CONSTANT_RE.match(text, position)
+    if constant is not None:
+        return CONSTANTS[constant.group()], constant.end()
+
+    raise JSONDecodeError("Expecting value", text, position)
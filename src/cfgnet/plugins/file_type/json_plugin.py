@@ -15,14 +15,22 @@
 import json
 import logging
 
-from typing import Union, Optional, Dict, List
+from typing import Dict, Iterator, Union, Optional, List
 from cfgnet.network.nodes import (
+    Node,
     ProjectNode,
     ArtifactNode,
     OptionNode,
     ValueNode,
 )
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.file_type.json_parser import (
+    Event,
+    JsonEvent,
+    iter_json_events,
+    skip_json_value,
+)
 
 
 class JsonPlugin(Plugin):
@@ -43,6 +51,7 @@ class JsonPlugin(Plugin):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         artifact = ArtifactNode(
             file_path=abs_file_path,
@@ -50,26 +59,11 @@ class JsonPlugin(Plugin):
             concept_name=self.concept_name,
             project_root=root,
         )
+        file_options = list(artifact.children)
 
         try:
-            # store line and line number in a dict
-            with open(abs_file_path, "r", encoding="utf-8") as json_file:
-                line_number_dict = {}
-                lineno = 1
-                for line in json_file:
-                    line = line.strip()
-                    line = line.replace("\\\\", "\\")
-                    if len(line) > 0:
-                        line_number_dict[line] = lineno
-                    lineno += 1
-
-            with open(abs_file_path, "r", encoding="utf-8") as json_file:
-                json_object = json.load(json_file)
-                self._parse_json_object(
-                    json_object=json_object,
-                    parent=artifact,
-                    line_number_dict=line_number_dict,
-                )
+            events = iter_json_events(content.text)
+            self._parse_value(events, next(events), artifact)
 
         except json.JSONDecodeError as error:
             logging.warning(
@@ -77,70 +71,113 @@ class JsonPlugin(Plugin):
                 rel_file_path,
                 error,
             )
+            # keep only the file option, as for files that fail to load
+            for option in artifact.children[len(file_options) :]:
+                self._remove_option(artifact, option)
 
         return artifact
 
-    def _parse_json_object(
+    def _parse_value(
         self,
-        json_object: Union[Dict, List],
+        events: Iterator[Event],
+        event: Event,
         parent: Union[ArtifactNode, OptionNode],
-        line_number_dict: Dict,
     ) -> None:
-        if isinstance(json_object, dict):
-            for key in json_object:
-                if key not in self.excluded_keys:
-                    config_type = self.get_config_type(key)
-                    option = OptionNode(
-                        name=key,
-                        location=self._get_line_number(line_number_dict, key),
-                        config_type=config_type,
-                    )
-                    parent.add_child(option)
-                    child = json_object[key]
-
-                    self._parse_json_object(child, option, line_number_dict)
-                    if not option.children:
-                        parent.children.remove(option)
-            return
+        """
+        Build the nodes of the value that starts with the given event.
 
-        if isinstance(json_object, list):
-            for item in json_object:
-                if isinstance(item, (dict, list)):
-                    self._parse_json_object(item, parent, line_number_dict)
-
-                else:
-                    virtual_option_name = f"{parent.name}/{item}"
-                    virtual_option = OptionNode(
-                        name=virtual_option_name,
-                        location=self._get_line_number(
-                            line_number_dict, parent.name
-                        ),
-                    )
-                    parent.add_child(virtual_option)
-
-                    if isinstance(parent, OptionNode):
-                        name = item
-                        value = ValueNode(name=name)
-                        virtual_option.add_child(value)
+        :param events: Iterator over the remaining events of the file
+        :param event: First event of the value
+        :param parent: Node to which the value belongs
+        """
+        event_type, value, _ = event
 
-        else:
-            if not isinstance(parent, ArtifactNode):
-                name = json_object
-                value = ValueNode(name=name)
+        if event_type == JsonEvent.START_OBJECT:
+            self._parse_object(events, parent)
+        elif event_type == JsonEvent.START_ARRAY:
+            self._parse_array(events, parent)
+        elif not isinstance(parent, ArtifactNode):
+            parent.add_child(ValueNode(name=value))
+
+    def _parse_object(
+        self,
+        events: Iterator[Event],
+        parent: Union[ArtifactNode, OptionNode],
+    ) -> None:
+        # the last value of duplicate keys wins, as with `json.load`
+        options: Dict[str, OptionNode] = {}
+        for event_type, key, line in events:
+            if event_type == JsonEvent.END_OBJECT:
+                return
+
+            if key in options:
+                self._remove_option(parent, options.pop(key))
+
+            if key in self.excluded_keys:
+                skip_json_value(events, next(events))
+                continue
+
+            option = OptionNode(
+                name=key,
+                location=line,
+                config_type=self.get_config_type(key),
+            )
+            parent.add_child(option)
 
-                parent.add_child(value)
+            self._parse_value(events, next(events), option)
+            if option.children:
+                options[key] = option
+            else:
+                self._remove_option(parent, option)
 
     @staticmethod
-    def _get_line_number(lines_dict: Dict, name: str) -> str:
+    def _remove_option(
+        parent: Union[ArtifactNode, OptionNode], option: OptionNode
+    ) -> None:
         """
-        Get line number of an option.
+        Remove an option and its descendants from the parent and network.
 
-        :param lines_dict: Dictionary containing lines and corresponding line numbers
-        :param: name: name of option
-        :return: line number of option
+        :param parent: Node to which the option belongs
+        :param option: Option to remove
         """
-        try:
-            line = next(filter(lambda x: f'"{name}"' in x, lines_dict.keys()))
-            return lines_dict[line]
-        except StopIteration:
-            return "unknown"
+        parent.children.remove(option)
+        if option.network is None:
+            return
+
+        nodes: List[Node] = [option]
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.children)
+            # value nodes are equal by name, so compare their identity
+            remaining = [
+                other
+                for other in option.network.nodes.get(node.id, [])
+                if other is not node
+            ]
+            if remaining:
+                option.network.nodes[node.id] = remaining
+            else:
+                option.network.nodes.pop(node.id, None)
+
+    def _parse_array(
+        self,
+        events: Iterator[Event],
+        parent: Union[ArtifactNode, OptionNode],
+    ) -> None:
+        for event in events:
+            event_type, item, line = event
+            if event_type == JsonEvent.END_ARRAY:
+                return
+
+            if event_type != JsonEvent.VALUE:
+                self._parse_value(events, event, parent)
+                continue
+
+            virtual_option = OptionNode(
+                name=f"{parent.name}/{item}",
+                location=line,
+            )
+            parent.add_child(virtual_option)
+
+            if isinstance(parent, OptionNode):
+                virtual_option.add_child(ValueNode(name=item))
@@ -19,6 +19,11 @@ import tomllib
 from tomllib import TOMLDecodeError
 from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.line_index import (
+    LineIndex,
+    toml_inline_key,
+    toml_table_key,
+)
 
 
 class TomlPlugin(Plugin):
@@ -29,7 +34,7 @@ class TomlPlugin(Plugin):
             super().__init__(name)
         self.excluded_keys: List[str] = []
 
-    def _parse_config_file(self, abs_file_path, rel_file_path, root):
+    def _parse_config_file(self, abs_file_path, rel_file_path, root, content):
         artifact = ArtifactNode(
             file_path=abs_file_path,
             rel_file_path=rel_file_path,
@@ -37,24 +42,14 @@ class TomlPlugin(Plugin):
             project_root=root,
         )
 
-        with open(abs_file_path, "r", encoding="utf-8") as file:
-            line_number_dict = {}
-            lineno = 1
-            for line in file:
-                line = line.strip()
-                if len(line) > 0:
-                    line_number_dict[line] = lineno
-                lineno += 1
-
-        with open(abs_file_path, "rb") as file:
-            try:
-                data = tomllib.load(file)
-                self._iter_data(data, line_number_dict, artifact)
-
-            except TOMLDecodeError as error:
-                logging.warning(
-                    "Invalid Toml file %s: %s", abs_file_path, error
-                )
+        try:
+            data = tomllib.loads(content.text)
+            self._iter_data(
+                data, content.get_line_index(LineIndex.for_toml), artifact
+            )
+
+        except TOMLDecodeError as error:
+            logging.warning("Invalid Toml file %s: %s", abs_file_path, error)
 
         return artifact
 
@@ -64,36 +59,82 @@ class TomlPlugin(Plugin):
 
         return False
 
-    def _iter_data(self, data, line_number_dict, parent):
+    # pylint: disable=too-many-arguments
+    def _iter_data(
+        self, data, line_index, parent, path=(), after=0, inline=False
+    ):
+        """
+        Add the options of a table to the parent node.
+
+        :param data: table to add
+        :param line_index: line index of the file
+        :param parent: node to which the options are added
+        :param path: keys of the table
+        :param after: line at which the table starts
+        :param inline: whether the table is an inline table
+        """
         for argument, value in data.items():
-            lineno = None
-
-            for line in line_number_dict.keys():
-                if argument in line:
-                    lineno = line_number_dict[line]
-                    del line_number_dict[line]
-                    break
-
-            if argument not in self.excluded_keys:
-                config_type = self.get_config_type(argument)
-                option = OptionNode(
-                    name=argument,
-                    location=str(lineno),
-                    config_type=config_type,
+            if argument in self.excluded_keys:
+                continue
+
+            option_path = (*path, argument)
+            table_lines = line_index.get_lines(toml_table_key(option_path))
+            if table_lines:
+                lineno = table_lines[0]
+            else:
+                lineno = self._get_key_line(
+                    line_index, argument, after, inline
                 )
-                parent.add_child(option)
-
-                if isinstance(value, dict):
-                    self._iter_data(value, line_number_dict, option)
-                elif isinstance(value, list):
-                    if all(isinstance(item, dict) for item in value):
-                        for dict_item in value:
-                            self._iter_data(
-                                dict_item, line_number_dict, option
-                            )
-                    else:
-                        value_node = ValueNode(name=str(value))
-                        option.add_child(value_node)
+
+            config_type = self.get_config_type(argument)
+            option = OptionNode(
+                name=argument,
+                location=LineIndex.to_location(lineno),
+                config_type=config_type,
+            )
+            parent.add_child(option)
+
+            if isinstance(value, dict):
+                self._iter_data(
+                    value,
+                    line_index,
+                    option,
+                    option_path,
+                    lineno or after,
+                    inline=not table_lines,
+                )
+            elif isinstance(value, list):
+                if all(isinstance(item, dict) for item in value):
+                    for position, dict_item in enumerate(value):
+                        # every table of an array has its own header
+                        if position < len(table_lines):
+                            item_line = table_lines[position]
+                        else:
+                            item_line = lineno or after
+                        self._iter_data(
+                            dict_item,
+                            line_index,
+                            option,
+                            option_path,
+                            item_line,
+                            inline=not table_lines,
+                        )
                 else:
-                    name = value
-                    option.add_child(ValueNode(name))
+                    value_node = ValueNode(name=str(value))
+                    option.add_child(value_node)
+            else:
+                name = value
+                option.add_child(ValueNode(name))
+
+    @staticmethod
+    def _get_key_line(line_index, key, after, inline):
+        """Find a key, preferring keys of inline tables inside them."""
+        keys = [key, toml_inline_key(key)]
+        if inline:
+            keys.reverse()
+
+        for candidate in keys:
+            lineno = line_index.get_line(candidate, after=after)
+            if lineno is not None:
+                return lineno
+        return None
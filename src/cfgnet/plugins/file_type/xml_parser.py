@@ -0,0 +1,95 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Streaming XML front end shared by the XML based plugins."""
+
+import io
+
+from enum import Enum, auto
+from typing import Collection, Iterator, Optional, Tuple
+
+from lxml import etree as ET
+from lxml.etree import _Element
+
+
+class XmlEvent(Enum):
+    START = auto()
+    END = auto()
+    SUBTREE = auto()
+
+
+def local_name(tag: str) -> str:
+    """Remove the namespace in curly brackets from a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_xml_events(
+    data: bytes,
+    subtree_tags: Collection[str] = (),
+) -> Iterator[Tuple[XmlEvent, _Element]]:
+    """
+    Parse an XML document in a single streaming pass.
+
+    Namespaces are stripped from element tags as soon as an element starts.
+    Comments and processing instructions are dropped by the parser. An
+    element is reported when it starts, with its tag, attributes and source
+    line, and when it ends, with its complete text. Afterwards it is freed
+    together with its children, so memory stays bounded by the depth of the
+    document instead of its size.
+
+    Elements whose tag is in `subtree_tags` are reported once as a complete
+    subtree when they end, for consumers that need to look at the children
+    of an element before building its nodes. No events are emitted for the
+    descendants of such an element.
+
+    :param data: XML document
+    :param subtree_tags: Tags of elements that are reported as subtrees
+    :return: Iterator over events and elements
+    :raises lxml.etree.Error: If the document is not well-formed
+    """
+    context = ET.iterparse(
+        io.BytesIO(data),
+        events=("start", "end"),
+        remove_comments=True,
+        remove_pis=True,
+    )
+
+    # element that is currently collected as a subtree
+    subtree: Optional[_Element] = None
+
+    for event, element in context:
+        if event == "start":
+            element.tag = local_name(element.tag)
+            if subtree is None:
+                if element.tag in subtree_tags:
+                    subtree = element
+                else:
+                    yield XmlEvent.START, element
+            continue
+
+        if subtree is not None:
+            if element is not subtree:
+                continue
+            subtree = None
+            yield XmlEvent.SUBTREE, element
+        else:
+            yield XmlEvent.END, element
+
+        # free the element and all preceding siblings
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
@@ -26,6 +26,13 @@ from yaml.reader import ReaderError
 from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
 from cfgnet.plugins.plugin import Plugin
 
+# Use the libyaml bindings if PyYAML has been built with them. They yield
+# the same nodes and marks as the pure Python implementation.
+# pylint: disable=invalid-name
+YAML_LOADER = getattr(yaml, "CLoader", yaml.Loader)
+YAML_FULL_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+# pylint: enable=invalid-name
+
 
 class YAMLPlugin(Plugin):
     def __init__(self, name=None):
@@ -34,7 +41,7 @@ class YAMLPlugin(Plugin):
         else:
             super().__init__(name)
 
-    def _parse_config_file(self, abs_file_path, rel_file_path, root):
+    def _parse_config_file(self, abs_file_path, rel_file_path, root, content):
         artifact = ArtifactNode(
             file_path=abs_file_path,
             rel_file_path=rel_file_path,
@@ -43,15 +50,14 @@ class YAMLPlugin(Plugin):
         )
 
         try:
-            with open(abs_file_path, "r", encoding="utf8") as yaml_file:
-                docs = yaml.compose_all(yaml_file)
-                for root_tree in docs:
-                    self._iter_tree(root_tree, artifact)
+            docs = yaml.compose_all(content.text, Loader=YAML_LOADER)
+            for root_tree in docs:
+                self._iter_tree(root_tree, artifact)
         except (ScannerError, ParserError, ComposerError) as error:
             logging.warning(
                 "Invalid YAML file %s: %s", abs_file_path, error.problem
             )
-        except (FileNotFoundError, ReaderError) as error:
+        except ReaderError as error:
             logging.warning("Invalid YAML file %s: %s", abs_file_path, error)
         return artifact
 
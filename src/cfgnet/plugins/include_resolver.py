@@ -0,0 +1,241 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Resolution of include directives with a cache of parsed fragments."""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import (
+    Callable,
+    FrozenSet,
+    Generic,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from cfgnet.plugins.file_content import FileContent
+
+T = TypeVar("T")
+
+GLOB_CHARS = frozenset("*?[")
+
+# includes nested deeper than this are most likely a misconfiguration
+MAX_INCLUDE_DEPTH = 16
+
+
+@dataclass(frozen=True)
+class IncludeContext:
+    """
+    File whose options are currently added to an artifact.
+
+    Parameters
+    ----------
+    content: FileContent
+        Content of the artifact or of an included file.
+    artifact_path: str
+        Absolute path of the artifact.
+    project_root: str
+        Absolute path of the project root.
+    base_dirs: Sequence[str]
+        Directories against which include patterns are resolved.
+    chain: FrozenSet[str]
+        Files that include the current file, directly or indirectly.
+
+    """
+
+    content: FileContent
+    artifact_path: str
+    project_root: str
+    base_dirs: Sequence[str]
+    chain: FrozenSet[str] = field(default=frozenset())
+
+    def get_location(self, line: int) -> Union[int, str]:
+        """
+        Return the location of an option defined on a line of the file.
+
+        Options of included files are located by their relative path.
+
+        :param line: Line of the option
+        :return: Line number, or relative path and line of included files
+        """
+        if self.content.file_path == self.artifact_path:
+            return line
+        rel_file_path = os.path.relpath(
+            self.content.file_path, self.project_root
+        )
+        return f"{rel_file_path}:{line}"
+
+    def enter(self, content: FileContent) -> IncludeContext:
+        """Return the context of a file included by the current file."""
+        return replace(
+            self,
+            content=content,
+            chain=self.chain | {self.content.file_path},
+        )
+
+
+class IncludeResolver(Generic[T]):
+    """
+    Follows include directives of configuration files.
+
+    Include patterns may contain wildcards and are resolved against a list
+    of base directories within the project. Absolute patterns usually point
+    to the location of a file on the target system, e.g.
+    `/etc/nginx/conf.d/*.conf`, so they are matched against the trailing
+    parts of the path below the base directories instead.
+
+    Parsed fragments are cached by path and content hash, so a fragment
+    included from many places is parsed once per run, also across commits.
+
+    Parameters
+    ----------
+    parse: Callable[[FileContent], T]
+        Function parsing the content of a fragment.
+    max_size: int
+        Maximum number of cached fragments.
+
+    """
+
+    def __init__(
+        self, parse: Callable[[FileContent], T], max_size: int = 1024
+    ) -> None:
+        self.parse: Callable[[FileContent], T] = parse
+        self.max_size: int = max_size
+        self._fragments: OrderedDict[Tuple[str, str], T] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def get_fragment(self, content: FileContent) -> T:
+        """
+        Return the parsed content of a fragment, parsing it on first use.
+
+        :param content: Content of the fragment
+        :return: Parsed fragment
+        """
+        key = (content.file_path, content.digest)
+        if key in self._fragments:
+            self._fragments.move_to_end(key)
+            return self._fragments[key]
+
+        fragment = self.parse(content)
+        self._fragments[key] = fragment
+        if len(self._fragments) > self.max_size:
+            self._fragments.popitem(last=False)
+        return fragment
+
+    def resolve(
+        self, pattern: str, context: IncludeContext
+    ) -> Iterator[Tuple[IncludeContext, T]]:
+        """
+        Load and parse all fragments matched by an include pattern.
+
+        :param pattern: Pattern of the include directive
+        :param context: Context of the including file
+        :return: Iterator over the contexts and parsed fragments
+        """
+        content = context.content
+        if len(context.chain) >= MAX_INCLUDE_DEPTH:
+            logging.warning(
+                'Include of "%s" in "%s" exceeds the maximum depth.',
+                pattern,
+                content.file_path,
+            )
+            return
+
+        for file_path in self.expand(pattern, content, context.base_dirs):
+            if file_path in context.chain or file_path == content.file_path:
+                logging.warning(
+                    'Cyclic include of "%s" in "%s".',
+                    file_path,
+                    content.file_path,
+                )
+                continue
+
+            fragment = content.load(file_path)
+            if fragment is not None:
+                yield context.enter(fragment), self.get_fragment(fragment)
+
+    @staticmethod
+    def expand(
+        pattern: str, content: FileContent, base_dirs: Sequence[str]
+    ) -> List[str]:
+        """
+        Return the files matched by an include pattern.
+
+        Candidates are tried in order and the first one that matches any
+        file wins.
+
+        :param pattern: Pattern of the include directive
+        :param content: Content of the including file
+        :param base_dirs: Directories against which the pattern is resolved
+        :return: Sorted absolute paths of all matching files
+        """
+        for candidate in IncludeResolver._get_candidates(pattern, base_dirs):
+            files = content.glob(candidate)
+            if files:
+                return files
+        return []
+
+    @staticmethod
+    def _get_candidates(
+        pattern: str, base_dirs: Sequence[str]
+    ) -> Iterator[str]:
+        pattern = pattern.strip().strip("\"'")
+        if not pattern:
+            return
+
+        if not os.path.isabs(pattern):
+            for base_dir in base_dirs:
+                yield os.path.normpath(os.path.join(base_dir, pattern))
+            return
+
+        pattern = os.path.normpath(pattern)
+        for base_dir in base_dirs:
+            if pattern.startswith(os.path.join(base_dir, "")):
+                yield pattern
+
+        parts = pattern.strip(os.sep).split(os.sep)
+        # a bare wildcard would match unrelated files of the base directory
+        min_parts = 1 if GLOB_CHARS.isdisjoint(parts[-1]) else 2
+        for start in range(len(parts) - min_parts + 1):
+            for base_dir in base_dirs:
+                yield os.path.join(base_dir, *parts[start:])
+
+    @staticmethod
+    def get_project_root(abs_file_path: str, rel_file_path: str) -> str:
+        """
+        Return the project root of a parsed file.
+
+        :param abs_file_path: Absolute path of the file
+        :param rel_file_path: Path of the file relative to the project root
+        :return: Absolute path of the project root
+        """
+        abs_file_path = os.path.normpath(abs_file_path)
+        rel_file_path = os.path.normpath(rel_file_path)
+        if not os.path.isabs(rel_file_path) and abs_file_path.endswith(
+            os.sep + rel_file_path
+        ):
+            return abs_file_path[: -len(rel_file_path) - 1] or os.sep
+        return os.path.dirname(abs_file_path)
@@ -0,0 +1,265 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Index from option keys to the lines on which they are defined."""
+
+from __future__ import annotations
+
+import re
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+INI_COMMENT_PREFIXES = ("#", ";", "!")
+INI_SECTION_REGEX = re.compile(r"\[(?P<name>[^\]]+)\]")
+INI_DELIMITER_REGEX = re.compile(r"[=:]")
+
+TOML_TABLE_REGEX = re.compile(
+    r"\[\[?\s*(?P<name>(?:[\w.\s-]|\"[^\"]*\"|'[^']*')+?)\s*\]\]?\s*(?:#.*)?$"
+)
+TOML_KEY_REGEX = re.compile(
+    r"(?:^|[{,])\s*(?P<key>(?:[\w-]+|\"[^\"]*\"|'[^']*')"
+    r"(?:\s*\.\s*(?:[\w-]+|\"[^\"]*\"|'[^']*'))*)\s*="
+)
+TOML_KEY_PART_REGEX = re.compile(r"[\w-]+|\"([^\"]*)\"|'([^']*)'")
+
+YAML_KEY_REGEX = re.compile(
+    r"(?:-\s+)*(?P<key>\"[^\"]*\"|'[^']*'|[^\s#'\"\-?][^#]*?|-[^\s#]*?)"
+    r"\s*:(?:\s|$)"
+)
+
+
+class LineIndex:
+    """
+    Line numbers of all keys of a configuration file.
+
+    The file is tokenized once. Afterwards the line of a key is looked up in
+    a dictionary instead of scanning all lines, and only whole keys match, so
+    an option is never attributed to a line on which its name merely appears
+    as a substring. Keys that occur several times keep all their lines in
+    document order, so lookups can be scoped to the part of the file that
+    follows an enclosing section.
+
+    Parameters
+    ----------
+    lines: Dict[str, List[int]]
+        Sorted line numbers of every key.
+    normalize: Callable[[str], str]
+        Function applied to every key before it is looked up.
+
+    """
+
+    def __init__(
+        self,
+        lines: Dict[str, List[int]],
+        normalize: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        self.lines: Dict[str, List[int]] = lines
+        self.normalize: Optional[Callable[[str], str]] = normalize
+
+    def __contains__(self, key: str) -> bool:
+        return self._normalize(key) in self.lines
+
+    def get_line(self, key: str, after: int = 0) -> Optional[int]:
+        """
+        Return the first line of a key at or after a given line.
+
+        :param key: Key of an option or section
+        :param after: Line at which the search starts
+        :return: Line number or None if the key does not occur
+        """
+        lines = self.lines.get(self._normalize(key))
+        if not lines:
+            return None
+
+        position = bisect_left(lines, after)
+        if position == len(lines):
+            return None
+        return lines[position]
+
+    def get_lines(self, key: str) -> List[int]:
+        """
+        Return all lines of a key.
+
+        :param key: Key of an option or section
+        :return: Line numbers in document order
+        """
+        return self.lines.get(self._normalize(key), [])
+
+    def get_path_line(
+        self, path: Sequence[str], after: int = 0
+    ) -> Optional[int]:
+        """
+        Return the line of a nested key.
+
+        Each part of the path is searched after the line of its predecessor.
+
+        :param path: Keys from the outermost to the innermost one
+        :param after: Line at which the search starts
+        :return: Line number of the last key or None if a key does not occur
+        """
+        line: Optional[int] = after
+        for key in path:
+            line = self.get_line(key, after=line or 0)
+            if line is None:
+                return None
+        return line
+
+    @staticmethod
+    def to_location(line: Optional[int]) -> str:
+        """
+        Convert a line number into the location of an option node.
+
+        :param line: Line number or None if the line is unknown
+        :return: Line number as string or "Unknown"
+        """
+        if line is None:
+            return "Unknown"
+        return str(line)
+
+    def _normalize(self, key: str) -> str:
+        if self.normalize is None:
+            return key
+        return self.normalize(key)
+
+    @staticmethod
+    def from_lines(
+        lines: Iterable[str],
+        key_extractor: Callable[[str], Iterable[str]],
+        normalize: Optional[Callable[[str], str]] = None,
+    ) -> LineIndex:
+        """
+        Build an index by extracting the keys of every line.
+
+        :param lines: Lines of the file
+        :param key_extractor: Function returning the keys defined on a line
+        :param normalize: Function applied to every key
+        :return: Line index of the file
+        """
+        index: Dict[str, List[int]] = {}
+        for lineno, line in enumerate(lines, start=1):
+            for key in key_extractor(line):
+                if normalize is not None:
+                    key = normalize(key)
+                index.setdefault(key, []).append(lineno)
+
+        return LineIndex(index, normalize)
+
+    @staticmethod
+    def for_ini(text: str) -> LineIndex:
+        """
+        Index sections and options of INI and properties files.
+
+        Keys are compared case-insensitively, as configparser does.
+        """
+        return LineIndex.from_lines(
+            _join_continuations(text.splitlines()),
+            _ini_keys,
+            normalize=str.lower,
+        )
+
+    @staticmethod
+    def for_toml(text: str) -> LineIndex:
+        """Index tables and keys of TOML files including dotted keys."""
+        return LineIndex.from_lines(text.splitlines(), _toml_keys)
+
+    @staticmethod
+    def for_yaml(text: str) -> LineIndex:
+        """Index mapping keys of YAML files."""
+        return LineIndex.from_lines(text.splitlines(), _yaml_keys)
+
+
+def _join_continuations(lines: List[str]) -> Iterable[str]:
+    """Hide lines that continue a value ending with a backslash."""
+    continued = False
+    for line in lines:
+        if continued:
+            continued = line.endswith("\\")
+            yield ""
+            continue
+        continued = line.endswith("\\")
+        yield line
+
+
+def _ini_keys(line: str) -> List[str]:
+    line = line.strip()
+    if not line or line.startswith(INI_COMMENT_PREFIXES):
+        return []
+
+    section = INI_SECTION_REGEX.fullmatch(line)
+    if section:
+        return [section.group("name")]
+
+    key = INI_DELIMITER_REGEX.split(line, maxsplit=1)[0].strip()
+    return [key] if key else []
+
+
+def _toml_keys(line: str) -> List[str]:
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return []
+
+    table = TOML_TABLE_REGEX.match(line)
+    if table:
+        parts = _split_dotted_key(table.group("name"))
+        return _dotted_keys(parts) + [toml_table_key(parts)]
+
+    keys: List[str] = []
+    for match in TOML_KEY_REGEX.finditer(line):
+        dotted_keys = _dotted_keys(_split_dotted_key(match.group("key")))
+        if match.start("key") == 0:
+            keys.extend(dotted_keys)
+        else:
+            keys.extend(toml_inline_key(key) for key in dotted_keys)
+    return keys
+
+
+def toml_table_key(path: Sequence[str]) -> str:
+    """Return the key under which the header of a TOML table is indexed."""
+    return "[" + ".".join(path) + "]"
+
+
+def toml_inline_key(key: str) -> str:
+    """Return the key under which a key of an inline table is indexed."""
+    return "{" + key + "}"
+
+
+def _split_dotted_key(key: str) -> List[str]:
+    return [
+        match.group(1) or match.group(2) or match.group(0)
+        for match in TOML_KEY_PART_REGEX.finditer(key)
+    ]
+
+
+def _dotted_keys(parts: List[str]) -> List[str]:
+    """Return the parts of a dotted key, and the key itself if dotted."""
+    if len(parts) > 1:
+        return parts + [".".join(parts)]
+    return parts
+
+
+def _yaml_keys(line: str) -> List[str]:
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return []
+
+    match = YAML_KEY_REGEX.match(stripped)
+    if not match:
+        return []
+
+    key = match.group("key").strip("\"'")
+    if "." in key:
+        return key.split(".") + [key]
+    return [key]
@@ -15,17 +15,22 @@
 
 import abc
 import logging
-import os
 
 from typing import Optional
-from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
+from cfgnet.config_types.config_type_inferer import INFERER
 from cfgnet.config_types.config_types import ConfigType
-from cfgnet.network.nodes import ProjectNode, ArtifactNode
+from cfgnet.config_types.type_rules import TypeRules
+from cfgnet.network.nodes import ProjectNode, ArtifactNode, ValueNode
+from cfgnet.plugins.file_content import FileContent, WorkingTreeSource
+from cfgnet.plugins.include_resolver import IncludeResolver
 
 
 class Plugin(abc.ABC):
     """Plugin for parsing a specific configuration concept."""
 
+    # types of well-known options of the concept
+    type_rules: Optional[TypeRules] = None
+
     def __init__(self, concept_name: str, threshold: Optional[int] = None):
         """
         Initialize plugin.
@@ -35,7 +40,7 @@ class Plugin(abc.ABC):
         """
         self.concept_name: str = concept_name
         self.file_size_threshold: Optional[int] = threshold
-        self.inferer = ConfigTypeInferer()
+        self.inferer = INFERER
 
     @abc.abstractmethod
     def _parse_config_file(
@@ -43,6 +48,7 @@ class Plugin(abc.ABC):
         abs_file_path: str,
         rel_file_path: str,
         root: Optional[ProjectNode],
+        content: FileContent,
     ) -> ArtifactNode:
         """
         Parse the file to extract configuration options and values.
@@ -50,6 +56,7 @@ class Plugin(abc.ABC):
         :param abs_file_path: Absolute path to the file
         :param rel_file_path: Relative path to the file
         :param root: The ArtifactNode will be appended to this ProjectNode
+        :param content: Content of the file
         :return: ArtifactNode that will be added to the configuration network
         """
 
@@ -77,26 +84,69 @@ class Plugin(abc.ABC):
         :param root: project root of the file to parse
         :returns: artifact node that represents a sub-network of the parsed file
         """
-        if self.is_responsible(abs_file_path):
-            self._warn_if_large_file(abs_file_path)
+        if not self.is_responsible(abs_file_path):
+            return None
+
+        # referenced files are only loaded from within the project
+        if root is not None:
+            project_root = root.root_dir
+        else:
+            project_root = IncludeResolver.get_project_root(
+                abs_file_path, rel_file_path
+            )
+        source = WorkingTreeSource(project_root)
+
+        return self.parse_content(
+            FileContent.from_file(abs_file_path, source=source),
+            rel_file_path,
+            root,
+        )
+
+    def parse_content(
+        self,
+        content: FileContent,
+        rel_file_path: str,
+        root: Optional[ProjectNode] = None,
+        infer_types: bool = True,
+    ) -> Optional[ArtifactNode]:
+        """
+        Parse the content of a configuration file.
+
+        The content may come from disk, a git blob or any other source. Its
+        file path decides whether the plugin is responsible and becomes the
+        file path of the artifact node.
 
-            artifact = self._parse_config_file(
-                abs_file_path, rel_file_path, root
+        :param content: content of the file
+        :param rel_file_path: relative file path
+        :param root: project root of the file to parse
+        :param infer_types: infer the types of values with an unknown type,
+            can be disabled to infer the types of a whole network at once
+        :returns: artifact node that represents a sub-network of the parsed file
+        """
+        if not self.is_responsible(content.file_path):
+            return None
+
+        self._warn_if_large_file(content)
+
+        artifact = self._parse_config_file(
+            content.file_path, rel_file_path, root, content
+        )
+
+        if infer_types:
+            self.inferer.infer_value_types(
+                artifact.get_nodes(node_type=ValueNode)
             )
-            return artifact
 
-        return None
+        return artifact
 
-    def _warn_if_large_file(self, file_path: str) -> None:
+    def _warn_if_large_file(self, content: FileContent) -> None:
         """Log a warning if the file size in bytes exceeds the threshold."""
         if not self.file_size_threshold:
             return
-        if (
-            os.path.exists(file_path)
-            and os.path.getsize(file_path) > self.file_size_threshold
-        ):
+        if len(content.data) > self.file_size_threshold:
             logging.warning(
-                "Large file '%s' might not be configuration.", file_path
+                "Large file '%s' might not be configuration.",
+                content.file_path,
             )
 
     # pylint: disable=unused-argument,too-many-return-statements
@@ -104,10 +154,18 @@ class Plugin(abc.ABC):
         """
         Find config type based on naming conventions and syntax patterns.
 
+        The type rules of the plugin take precedence over the generic
+        inference.
+
         :param option_name: name of option
         :param value: value of option
         :return: config type
         """
+        if self.type_rules is not None:
+            config_type = self.type_rules.match(option_name)
+            if config_type is not None:
+                return config_type
+
         return self.inferer.get_config_type(
             option_name=option_name, value=value
         )
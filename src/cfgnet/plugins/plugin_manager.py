@@ -13,7 +13,9 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Optional
+import os
+
+from typing import Callable, List, Optional
 
 from cfgnet.plugins.plugin import Plugin
 from cfgnet.plugins.concept.docker_plugin import DockerPlugin
@@ -23,6 +25,7 @@ from cfgnet.plugins.concept.cypress_plugin import CypressPlugin
 from cfgnet.plugins.concept.tsconfig_plugin import TsconfigPlugin
 from cfgnet.plugins.concept.travis_plugin import TravisPlugin
 from cfgnet.plugins.concept.docker_compose_plugin import DockerComposePlugin
+from cfgnet.plugins.concept.dotenv_plugin import DotenvPlugin
 from cfgnet.plugins.concept.poetry_plugin import PoetryPlugin
 from cfgnet.plugins.concept.spring_plugin import SpringPlugin
 from cfgnet.plugins.concept.apache_webserver_plugin import (
@@ -109,6 +112,7 @@ class PluginManager:
         GradleWrapperPlugin(),
         MavenWrapperPlugin(),
         NetlifyPlugin(),
+        DotenvPlugin(),
     ]
 
     file_type_plugins: List[Plugin] = [
@@ -143,3 +147,46 @@ class PluginManager:
                 return plugin
 
         return None
+
+    @staticmethod
+    def get_config_file_filter(
+        project_root: str, enable_file_type_plugins: bool = False
+    ) -> Callable[[str], bool]:
+        """
+        Create a filter that only accepts files a plugin is responsible for.
+
+        :param project_root: Absolute path of the project root
+        :param enable_file_type_plugins: Whether file type plugins are used
+        :return: Predicate on file paths relative to the project root
+        """
+        plugins = list(PluginManager.concept_plugins)
+        if enable_file_type_plugins:
+            plugins.extend(PluginManager.file_type_plugins)
+
+        def is_config_file(rel_file_path: str) -> bool:
+            abs_file_path = os.path.join(project_root, rel_file_path)
+            return any(
+                plugin.is_responsible(abs_file_path) for plugin in plugins
+            )
+
+        return is_config_file
+
+    @staticmethod
+    def get_fingerprint(enable_file_type_plugins: bool = False) -> str:
+        """
+        Identify the plugins that decide which files are config files.
+
+        Caches of config files are invalid once a plugin is added or
+        removed, so they are keyed by this fingerprint.
+
+        :param enable_file_type_plugins: Whether file type plugins are used
+        :return: Qualified names of all plugins in order
+        """
+        plugins = list(PluginManager.concept_plugins)
+        if enable_file_type_plugins:
+            plugins.extend(PluginManager.file_type_plugins)
+
+        return ",".join(
+            f"{plugin.__class__.__module__}.{plugin.__class__.__qualname__}"
+            for plugin in plugins
+        )
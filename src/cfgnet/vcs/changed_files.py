@@ -0,0 +1,241 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Index of the configuration files changed by each commit."""
+
+from __future__ import annotations
+
+import os
+import hashlib
+import logging
+import pickle
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from cfgnet.vcs.git import Git
+
+# separates commit records in the log output
+RECORD_SEPARATOR = b"\x01"
+CHUNK_SIZE = 1 << 16
+
+
+class ChangedFileIndex:
+    """
+    Changed configuration files of every commit in a history.
+
+    The index is extracted from a single `git log --name-status` stream.
+    Changes are computed against the first parent of a commit, so they
+    describe the transition from `get_parent(commit)` to `commit`. Paths
+    are interned, each commit only stores a tuple of path ids.
+
+    Parameters
+    ----------
+    paths: List[str]
+        Interned paths of all changed configuration files.
+    commits: Dict[str, Tuple[Optional[str], Tuple[int, ...]]]
+        First parent and ids of changed paths for each commit.
+
+    """
+
+    def __init__(
+        self,
+        paths: List[str],
+        commits: Dict[str, Tuple[Optional[str], Tuple[int, ...]]],
+    ) -> None:
+        self.paths: List[str] = paths
+        self.commits: Dict[str, Tuple[Optional[str], Tuple[int, ...]]] = (
+            commits
+        )
+
+    def __contains__(self, commit_hash: str) -> bool:
+        return commit_hash in self.commits
+
+    def __len__(self) -> int:
+        return len(self.commits)
+
+    def get_parent(self, commit_hash: str) -> Optional[str]:
+        """
+        Return the first parent of a commit.
+
+        :param commit_hash: Hash of the commit
+        :return: Hash of the first parent or None for root commits
+        """
+        if commit_hash not in self.commits:
+            return None
+        return self.commits[commit_hash][0]
+
+    def get_changed_files(self, commit_hash: str) -> Optional[List[str]]:
+        """
+        Return the configuration files changed by a commit.
+
+        :param commit_hash: Hash of the commit
+        :return: Changed paths or None if the commit is not indexed
+        """
+        if commit_hash not in self.commits:
+            return None
+        return [
+            self.paths[path_id] for path_id in self.commits[commit_hash][1]
+        ]
+
+    def is_unchanged(self, commit_hash: str, previous_hash: str) -> bool:
+        """
+        Check if no configuration file changed since the previous commit.
+
+        This only holds if the previous commit is the first parent of the
+        commit and the commit does not touch any configuration file.
+
+        :param commit_hash: Hash of the commit
+        :param previous_hash: Hash of the previously analyzed commit
+        :return: True if the configuration files of both commits are equal
+        """
+        entry = self.commits.get(commit_hash)
+        if entry is None:
+            return False
+        parent, changed = entry
+        return parent == previous_hash and not changed
+
+    def save(self, file_path: str) -> None:
+        """Store the index in a pickle file."""
+        with open(file_path, "wb") as pickle_file:
+            pickle.dump(self, pickle_file)
+
+    @staticmethod
+    def load(file_path: str) -> Optional[ChangedFileIndex]:
+        """Load an index from a pickle file or None if it does not exist."""
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "rb") as pickle_file:
+                return pickle.load(pickle_file)
+        except (pickle.UnpicklingError, EOFError, AttributeError) as error:
+            logging.warning(
+                "Ignoring invalid changed file index %s: %s", file_path, error
+            )
+            return None
+
+    @staticmethod
+    def build(
+        git: Git,
+        rev_args: List[str],
+        file_filter: Optional[Callable[[str], bool]] = None,
+    ) -> ChangedFileIndex:
+        """
+        Extract the changed files of a history in one pass.
+
+        :param git: Repository of the history
+        :param rev_args: Revision arguments selecting the history
+        :param file_filter: Optional predicate on changed paths
+        :return: Index of changed configuration files
+        """
+        process = git.repo.git.log(
+            "-m",
+            "--no-renames",
+            "--name-status",
+            "-z",
+            "--format=%x01%H %P",
+            *rev_args,
+            as_process=True,
+        )
+
+        paths: List[str] = []
+        path_ids: Dict[str, int] = {}
+        commits: Dict[str, Tuple[Optional[str], Tuple[int, ...]]] = {}
+
+        for record in ChangedFileIndex._iter_records(process.stdout):
+            header, _, body = record.partition(b"\0")
+            hashes = header.decode().split()
+            commit_hash = hashes[0]
+
+            # merge commits are listed once per parent, keep the first one
+            if commit_hash in commits:
+                continue
+
+            parent = hashes[1] if len(hashes) > 1 else None
+
+            # fields alternate between status and path
+            fields = body.lstrip(b"\n").split(b"\0")
+            changed: List[int] = []
+            for raw_path in fields[1::2]:
+                path = raw_path.decode("utf-8", "surrogateescape")
+                if file_filter is not None and not file_filter(path):
+                    continue
+                if path not in path_ids:
+                    path_ids[path] = len(paths)
+                    paths.append(path)
+                changed.append(path_ids[path])
+
+            commits[commit_hash] = (parent, tuple(changed))
+
+        process.wait()
+
+        return ChangedFileIndex(paths, commits)
+
+    @staticmethod
+    def load_or_build(
+        git: Git,
+        rev_args: List[str],
+        cache_dir: str,
+        file_filter: Optional[Callable[[str], bool]] = None,
+        cache_key: str = "",
+    ) -> ChangedFileIndex:
+        """
+        Load a cached index of a history or build and cache it.
+
+        :param git: Repository of the history
+        :param rev_args: Revision arguments selecting the history
+        :param cache_dir: Directory in which the index is cached
+        :param file_filter: Optional predicate on changed paths
+        :param cache_key: Identifies the file filter in the cache
+        :return: Index of changed configuration files
+        """
+        # resolve references, so a moved branch invalidates the cache
+        revisions = git.repo.git.rev_parse(*rev_args).split()
+        key = "|".join(revisions + [cache_key])
+        file_name = hashlib.md5(key.encode()).hexdigest()
+        cache_path = os.path.join(
+            cache_dir, f"changed_files_{file_name}.pickle"
+        )
+
+        index = ChangedFileIndex.load(cache_path)
+        if index is not None:
+            return index
+
+        index = ChangedFileIndex.build(git, rev_args, file_filter)
+
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        index.save(cache_path)
+
+        return index
+
+    @staticmethod
+    def _iter_records(stream) -> Iterator[bytes]:
+        """Split the log output into commit records chunk by chunk."""
+        # pieces of a record spanning several chunks, joined once complete
+        pending: List[bytes] = []
+        while chunk := stream.read(CHUNK_SIZE):
+            first, *records = chunk.split(RECORD_SEPARATOR)
+            pending.append(first)
+            if not records:
+                continue
+            record = b"".join(pending)
+            if record:
+                yield record
+            pending = [records.pop()]
+            for record in records:
+                if record:
+                    yield record
+        record = b"".join(pending)
+        if record:
+            yield record
@@ -15,13 +15,15 @@
 
 import logging
 
-from typing import Optional, Any, List, Union
+from typing import Optional, Any, Callable, List, Set, Union
 
 from git.repo import Repo
 from git.exc import InvalidGitRepositoryError
 from git.refs.symbolic import SymbolicReference
 from git.objects.commit import Commit
-from git.objects.tree import Tree
+from cfgnet.vcs.git_objects import GitObjectReader
+
+SUBMODULE_MODE = "160000"
 
 
 class Git:
@@ -29,6 +31,7 @@ class Git:
 
     def __init__(self, project_root: str) -> None:
         """Initialize the git repository."""
+        self._object_reader: Optional[GitObjectReader] = None
         try:
             self.repo = Repo(project_root)
         except InvalidGitRepositoryError:
@@ -51,16 +54,77 @@ class Git:
         """Return current commit hash."""
         return self.repo.head.object.hexsha
 
-    def get_tracked_files(self) -> List:
-        """Return tracked files."""
-        tree = self.repo.tree()
+    def get_tracked_files(
+        self, file_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[str]:
+        """
+        Return tracked files.
+
+        The files are read in bulk from the index. Submodules are skipped.
+
+        :param file_filter: Optional predicate on the relative file path
+        :return: Relative paths of tracked files accepted by the filter
+        """
+        entries = self.repo.git.ls_files("-s", "-z").split("\0")
 
-        files: List[Any] = []
+        files: List[str] = []
+        previous_path = None
+        for entry in entries:
+            if not entry:
+                continue
 
-        self._iter_tree([tree], files)
+            info, path = entry.split("\t", 1)
+            mode = info.split(" ", 1)[0]
+
+            # skip submodules and further stages of unmerged files
+            if mode == SUBMODULE_MODE or path == previous_path:
+                continue
+            previous_path = path
+
+            if file_filter is None or file_filter(path):
+                files.append(path)
 
         return files
 
+    def get_tagged_commits(self) -> Set[str]:
+        """Return hashes of all commits a tag points to."""
+        tagged_commits = set()
+        for tag in self.repo.tags:
+            try:
+                tagged_commits.add(tag.commit.hexsha)
+            except ValueError:
+                # tag points to a tree or blob
+                continue
+        return tagged_commits
+
+    def get_object_reader(self) -> GitObjectReader:
+        """Return the object reader shared by all users of this repository."""
+        if self._object_reader is None:
+            self._object_reader = GitObjectReader(self.repo)
+        return self._object_reader
+
+    def get_files_at_commit(
+        self,
+        commit: Union[Commit, str],
+        file_filter: Optional[Callable[[str], bool]] = None,
+    ) -> List[str]:
+        """Return files tracked at a commit without checking it out."""
+        return self.get_object_reader().list_files(
+            str(commit), file_filter=file_filter
+        )
+
+    def read_blob(
+        self, commit: Union[Commit, str], path: str
+    ) -> Optional[bytes]:
+        """Return the content of a file at a commit or None if missing."""
+        return self.get_object_reader().read_blob(str(commit), path)
+
+    def close(self) -> None:
+        """Terminate long-lived git processes of this repository."""
+        if self._object_reader is not None:
+            self._object_reader.close()
+            self._object_reader = None
+
     def checkout(self, commit: Union[Commit, SymbolicReference]) -> None:
         """Go to a specific commit."""
         self.repo.git.checkout(commit)
@@ -71,10 +135,3 @@ class Git:
         if len(changed_files) > 0:
             return True
         return False
-
-    def _iter_tree(self, trees: List[Tree], files: List[Any]) -> None:
-        for tree in trees:
-            for blob in tree.blobs:
-                files.append(blob.path)
-            if tree.trees:
-                self._iter_tree(tree.trees, files)
@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List
+from typing import Iterator, List, Optional
 
 from git.repo import Repo
 from git.objects.commit import Commit
@@ -21,31 +21,105 @@ from cfgnet.vcs.git import Git
 
 
 class GitHistory:
+    """
+    Walk through the commit history from the oldest to the newest commit.
+
+    Commit hashes are streamed from a single `git rev-list` process, so
+    neither the whole list nor any commit objects are held in memory.
+
+    Parameters
+    ----------
+    git: Git
+        Repository to walk through.
+    branch: Optional[str]
+        Branch to analyze, by default the first branch of the repository.
+    rev_range: Optional[str]
+        Revision range such as `v1.0..v2.0`, takes precedence over branch.
+    first_parent: bool
+        Only follow the first parent of merge commits.
+    since: Optional[str]
+        Only consider commits more recent than this date.
+    until: Optional[str]
+        Only consider commits older than this date.
+
+    """
+
     repo: Repo
-    commits: List[Commit]
     commit_index: int
 
-    def __init__(self, git: Git):
+    def __init__(
+        self,
+        git: Git,
+        branch: Optional[str] = None,
+        rev_range: Optional[str] = None,
+        first_parent: bool = False,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ):
         self.repo = git.repo
-        self.commits = list(self.repo.iter_commits(rev=self.repo.heads[0]))
-        self.commits.reverse()
-        self.commit_index = len(self.commits) - 1
+        self.commit_index = -1
 
-    def restore_initial_commit(self) -> Commit:
-        initial_commit = self.commits[0]
-        if len(self.commits) > 0:
-            self.repo.git.checkout(initial_commit)
-            self.commit_index = 0
+        # revision arguments shared with other history walks, e.g. git log
+        self.rev_args: List[str] = []
+        if first_parent:
+            self.rev_args.append("--first-parent")
+        if since:
+            self.rev_args.append(f"--since={since}")
+        if until:
+            self.rev_args.append(f"--until={until}")
+        self.rev_args.append(rev_range or branch or str(self.repo.heads[0]))
 
-        return initial_commit
+        self._process = self.repo.git.rev_list(
+            "--reverse", *self.rev_args, as_process=True
+        )
+        self._commit_hashes: Iterator[str] = self._stream_commit_hashes()
+        self._next_hash: Optional[str] = next(self._commit_hashes, None)
 
-    def has_next_commit(self) -> bool:
-        return self.commit_index < len(self.commits) - 1
+    def _stream_commit_hashes(self) -> Iterator[str]:
+        for line in self._process.stdout:
+            commit_hash = line.strip().decode()
+            if commit_hash:
+                yield commit_hash
+
+        # raises if git failed, e.g. due to an unknown revision
+        self._process.wait()
 
-    def next_commit(self) -> Commit:
+    def _advance(self) -> Commit:
+        if self._next_hash is None:
+            raise IndexError("No more commits in history.")
+
+        commit = self.repo.commit(self._next_hash)
+        self._next_hash = next(self._commit_hashes, None)
         self.commit_index += 1
 
-        next_commit: Commit = self.commits[self.commit_index]
-        self.repo.git.checkout(next_commit, force=True)
+        return commit
+
+    def restore_initial_commit(self) -> Optional[Commit]:
+        if self.commit_index >= 0 or self._next_hash is None:
+            return None
+
+        initial_commit = self._advance()
+        self.repo.git.checkout(initial_commit)
+
+        return initial_commit
+
+    def has_next_commit(self) -> bool:
+        return self._next_hash is not None
+
+    def next_commit(self, checkout: bool = True) -> Commit:
+        next_commit = self._advance()
+        if checkout:
+            self.checkout(next_commit)
 
         return next_commit
+
+    def checkout(self, commit: Commit) -> None:
+        """Check out a commit of the history, discarding local changes."""
+        self.repo.git.checkout(commit, force=True)
+
+    def close(self) -> None:
+        """Terminate the rev-list process."""
+        self._next_hash = None
+        if self._process.proc is not None:
+            self._process.proc.kill()
+            self._process.proc.wait()
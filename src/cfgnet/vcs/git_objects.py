@@ -0,0 +1,225 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Bulk access to git objects through long-lived cat-file processes."""
+
+import logging
+
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from git.repo import Repo
+from git.objects.fun import tree_entries_from_data
+
+# mode bits (mode >> 12) of tree entries
+TREE_MODE = 0o04
+BLOB_MODES = (0o10, 0o12)
+
+# tree entry: (name, mode, hexsha)
+TreeEntry = Tuple[str, int, str]
+
+
+class GitObjectReader:
+    """
+    Read trees and blobs of a repository without touching the working tree.
+
+    All object access goes through the persistent ``git cat-file --batch``
+    and ``git cat-file --batch-check`` processes of GitPython, so reading
+    thousands of objects costs no extra process spawns. Objects are content
+    addressed, which makes both caches valid across commits: a tree or blob
+    that did not change between two commits is read only once.
+
+    Parameters
+    ----------
+    repo: Repo
+        Repository to read objects from.
+    blob_cache_size: int
+        Maximum number of bytes kept in the blob cache.
+    tree_cache_size: int
+        Maximum number of trees kept in the tree cache.
+
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        blob_cache_size: int = 64 * 1024 * 1024,
+        tree_cache_size: int = 4096,
+    ) -> None:
+        self.repo: Repo = repo
+        self.blob_cache_size: int = blob_cache_size
+        self.tree_cache_size: int = tree_cache_size
+        self._blob_cache: OrderedDict = OrderedDict()
+        self._blob_cache_bytes: int = 0
+        self._tree_cache: OrderedDict = OrderedDict()
+
+    def get_object_info(self, rev: str) -> Optional[Tuple[str, str, int]]:
+        """
+        Look up an object without reading its content.
+
+        :param rev: Any revision git understands, e.g. `<commit>:<path>`
+        :return: Tuple of hexsha, object type and size or None if missing
+        """
+        if "\n" in rev:
+            return None
+        try:
+            hexsha, object_type, size = self.repo.git.get_object_header(rev)
+        except ValueError:
+            return None
+        return hexsha.decode(), object_type.decode(), size
+
+    def read_object(self, rev: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Read an object from the object database.
+
+        :param rev: Any revision git understands, e.g. `<commit>:<path>`
+        :return: Tuple of hexsha, object type and content or None if missing
+        """
+        if "\n" in rev:
+            return None
+        try:
+            hexsha, object_type, _, data = self.repo.git.get_object_data(rev)
+        except ValueError:
+            return None
+        return hexsha.decode(), object_type.decode(), data
+
+    def read_blob(self, commit: str, path: str) -> Optional[bytes]:
+        """
+        Read the content of a file at a given commit.
+
+        :param commit: Commit hash or reference
+        :param path: Path of the file relative to the project root
+        :return: Content of the file or None if there is no such file
+        """
+        info = self.get_object_info(f"{commit}:{path}")
+        if info is None or info[1] != "blob":
+            return None
+
+        return self.read_blob_by_sha(info[0])
+
+    def read_blob_by_sha(self, hexsha: str) -> Optional[bytes]:
+        """
+        Read the content of a blob by its object id.
+
+        :param hexsha: Object id of the blob
+        :return: Content of the blob or None if there is no such blob
+        """
+        if hexsha in self._blob_cache:
+            self._blob_cache.move_to_end(hexsha)
+            return self._blob_cache[hexsha]
+
+        result = self.read_object(hexsha)
+        if result is None or result[1] != "blob":
+            return None
+
+        data = result[2]
+        self._cache_blob(hexsha, data)
+        return data
+
+    def list_files(
+        self,
+        commit: str,
+        file_filter: Optional[Callable[[str], bool]] = None,
+    ) -> List[str]:
+        """
+        List all files of a commit.
+
+        :param commit: Commit hash or reference
+        :param file_filter: Optional predicate on the relative file path
+        :return: Sorted relative paths of all files in the commit
+        """
+        return [
+            path
+            for path, _ in self.list_blobs(commit, file_filter=file_filter)
+        ]
+
+    def list_blobs(
+        self,
+        commit: str,
+        file_filter: Optional[Callable[[str], bool]] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        List all files of a commit together with their blob ids.
+
+        :param commit: Commit hash or reference
+        :param file_filter: Optional predicate on the relative file path
+        :return: Sorted tuples of relative path and blob id
+        """
+        info = self.get_object_info(f"{commit}^{{tree}}")
+        if info is None:
+            logging.warning("Could not resolve tree of commit %s.", commit)
+            return []
+
+        blobs: List[Tuple[str, str]] = []
+        self._walk_tree(info[0], "", blobs, file_filter)
+        blobs.sort()
+        return blobs
+
+    def clear(self) -> None:
+        """Drop all cached objects."""
+        self._blob_cache.clear()
+        self._blob_cache_bytes = 0
+        self._tree_cache.clear()
+
+    def close(self) -> None:
+        """Drop all cached objects and terminate the cat-file processes."""
+        self.clear()
+        self.repo.git.clear_cache()
+
+    def _walk_tree(
+        self,
+        tree_sha: str,
+        prefix: str,
+        blobs: List[Tuple[str, str]],
+        file_filter: Optional[Callable[[str], bool]],
+    ) -> None:
+        for name, mode, hexsha in self._read_tree(tree_sha):
+            path = prefix + name
+            if mode >> 12 == TREE_MODE:
+                self._walk_tree(hexsha, path + "/", blobs, file_filter)
+            elif mode >> 12 in BLOB_MODES:
+                if file_filter is None or file_filter(path):
+                    blobs.append((path, hexsha))
+
+    def _read_tree(self, tree_sha: str) -> List[TreeEntry]:
+        if tree_sha in self._tree_cache:
+            self._tree_cache.move_to_end(tree_sha)
+            return self._tree_cache[tree_sha]
+
+        result = self.read_object(tree_sha)
+        if result is None or result[1] != "tree":
+            return []
+
+        entries = [
+            (name, mode, binsha.hex())
+            for binsha, mode, name in tree_entries_from_data(result[2])
+        ]
+
+        self._tree_cache[tree_sha] = entries
+        if len(self._tree_cache) > self.tree_cache_size:
+            self._tree_cache.popitem(last=False)
+
+        return entries
+
+    def _cache_blob(self, hexsha: str, data: bytes) -> None:
+        if len(data) > self.blob_cache_size:
+            return
+
+        self._blob_cache[hexsha] = data
+        self._blob_cache_bytes += len(data)
+
+        while self._blob_cache_bytes > self.blob_cache_size:
+            _, evicted = self._blob_cache.popitem(last=False)
+            self._blob_cache_bytes -= len(evicted)
@@ -102,3 +102,24 @@ def test_analyze_all_conflicts(get_config_all_conflicts):
         rows = list(reader)
 
         assert len(rows) == 4
+
+
+@pytest.mark.parametrize("sample_interval", [2, 10])
+def test_analyze_sampled(get_config, sample_interval):
+    analyzer = Analyzer(get_config, sample_interval=sample_interval)
+    project_name = get_config.project_name()
+
+    analyzer.analyze_commit_history()
+
+    conflicts_csv_path = os.path.join(
+        get_config.project_root_abs,
+        get_config.cfgnet_path_rel,
+        "analysis",
+        f"conflicts_{project_name}.csv",
+    )
+
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        reader = csv.DictReader(csv_stats_file)
+        rows = list(reader)
+
+        assert len(rows) == 3
@@ -13,8 +13,9 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import pytest
-from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
+from cfgnet.config_types.config_type_inferer import ConfigTypeInferer, INFERER
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.network.nodes import OptionNode, ValueNode
 
 test_dataset = [
     # Ports
@@ -144,3 +145,42 @@ def test_config_types(get_inferer):
     for test in test_dataset:
         inferred_type = inferer.get_config_type(test["option_name"], test["value"])
         assert inferred_type == test["expected_type"]
+
+
+def test_cached_config_types(get_inferer):
+    inferer = get_inferer
+
+    for test in test_dataset:
+        expected_type = inferer.infer_config_type(
+            test["option_name"].lower(), test["value"]
+        )
+        assert inferer.get_config_type(test["option_name"], test["value"]) == expected_type
+        assert INFERER.get_config_type(test["option_name"], test["value"]) == expected_type
+
+
+def test_option_patterns():
+    assert ConfigTypeInferer.get_option_patterns("db_port") == {"port"}
+    assert ConfigTypeInferer.get_option_patterns("enable_flag") == {"boolean"}
+    assert ConfigTypeInferer.get_option_patterns("x") == frozenset()
+
+
+def test_infer_value_types(get_inferer):
+    inferer = get_inferer
+    option = OptionNode("db_port", location=1)
+    typed_option = OptionNode("server", location=2, config_type=ConfigType.URL)
+    values = [ValueNode("5432"), ValueNode("5432"), ValueNode("true")]
+    for value in values:
+        option.add_child(value)
+    typed_value = ValueNode("localhost")
+    typed_option.add_child(typed_value)
+
+    assert all(value.config_type == ConfigType.UNKNOWN for value in values)
+
+    inferer.infer_value_types(values + [typed_value])
+
+    assert [value.config_type for value in values] == [
+        ConfigType.PORT,
+        ConfigType.PORT,
+        ConfigType.BOOLEAN,
+    ]
+    assert typed_value.config_type == ConfigType.URL
@@ -0,0 +1,70 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import pytest
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.type_rules import TypeRule, TypeRules
+
+
+@pytest.fixture(name="get_rules")
+def get_rules_():
+    rules = TypeRules(
+        [
+            TypeRule(None, names=("core_file",)),
+            TypeRule(ConfigType.PATH, names=("socket",), suffixes=("dir", "file")),
+            TypeRule(ConfigType.NAME, suffixes=("name", "hostname")),
+            TypeRule(ConfigType.SIZE, names=("max_file",), suffixes=("size",)),
+            TypeRule(ConfigType.BOOLEAN, prefixes=("enable", "disable")),
+            TypeRule(ConfigType.URL, substrings=("url",)),
+        ],
+        ignore_case=True,
+    )
+    return rules
+
+
+def test_match(get_rules):
+    rules = get_rules
+
+    assert len(rules) == 6
+    assert rules.match("socket") == ConfigType.PATH
+    assert rules.match("Socket") == ConfigType.PATH
+    assert rules.match("log_dir") == ConfigType.PATH
+    assert rules.match("dir") == ConfigType.PATH
+    assert rules.match("server_hostname") == ConfigType.NAME
+    assert rules.match("buffer_size") == ConfigType.SIZE
+    assert rules.match("enableCache") == ConfigType.BOOLEAN
+    assert rules.match("base_url_prefix") == ConfigType.URL
+    assert rules.match("socket_timeout") is None
+    assert rules.match("") is None
+
+
+def test_first_rule_wins(get_rules):
+    rules = get_rules
+
+    # the suffix of the earlier rule takes precedence over the exact name
+    assert rules.match("max_file") == ConfigType.PATH
+    assert rules.match("enable_file") == ConfigType.PATH
+    assert rules.match("disable_url") == ConfigType.BOOLEAN
+    assert rules.match("url_name") == ConfigType.NAME
+
+    # names without a type are left to the generic inference
+    assert rules.match("core_file") is None
+
+
+def test_case_sensitive_rules():
+    rules = TypeRules([TypeRule(ConfigType.URL, names=("baseUrl",))])
+
+    assert rules.match("baseUrl") == ConfigType.URL
+    assert rules.match("baseurl") is None
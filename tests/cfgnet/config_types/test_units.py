@@ -0,0 +1,54 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.config_types.units import get_option_unit, to_canonical_unit
+
+
+def test_sizes():
+    size = to_canonical_unit(ConfigType.SIZE, "512m")
+
+    assert size == 536870912
+    assert to_canonical_unit(ConfigType.SIZE, "512MB") == size
+    assert to_canonical_unit(ConfigType.SIZE, "536870912") == size
+    assert to_canonical_unit(ConfigType.SIZE, "512", "mb") == size
+    assert to_canonical_unit(ConfigType.SIZE, "0.5 GiB") == size
+    assert to_canonical_unit(ConfigType.SIZE, "512 apples") is None
+
+
+def test_durations():
+    duration = to_canonical_unit(ConfigType.TIME, "30s")
+
+    assert duration == 30000
+    assert to_canonical_unit(ConfigType.TIME, "30000") == duration
+    assert to_canonical_unit(ConfigType.TIME, "30", "sec") == duration
+    assert to_canonical_unit(ConfigType.TIME, "1h30m") == 5400000
+    assert to_canonical_unit(ConfigType.TIME, "90min") == 5400000
+    assert to_canonical_unit(ConfigType.TIME, "1h30x") is None
+
+
+def test_speeds():
+    assert to_canonical_unit(ConfigType.SPEED, "100Mbps") == 10**8
+    assert to_canonical_unit(ConfigType.SPEED, "1KB/s") == 8192
+    assert to_canonical_unit(ConfigType.PORT, "8080") is None
+
+
+def test_option_units():
+    assert get_option_unit("timeout_ms") == "ms"
+    assert get_option_unit("connectTimeoutMillis") == "millis"
+    assert get_option_unit("retention.bytes") == "bytes"
+    assert get_option_unit("maxSizeKB") == "kb"
+    assert get_option_unit("items") == ""
+    assert get_option_unit("timeout") == ""
@@ -13,12 +13,17 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import io
+import json
 import os
 import pytest
 
 from shutil import rmtree
 
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.link_group import LinkGroup
 from cfgnet.network.network import Network
+from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
 from cfgnet.exporter.exporter import DotExporter, JSONExporter
 from cfgnet.network.network import NetworkConfiguration
 from tests.utility.temporary_repository import TemporaryRepository
@@ -93,3 +98,45 @@ def test_json_export_file(get_config):
         JSONExporter(network).export(export_file, False)
 
     assert os.path.isfile(file_path)
+
+
+def test_export_link_groups(get_config):
+    network = Network.init_network(cfg=get_config)
+    network.link_groups.clear()
+    nodes = []
+    for file_name, option_name in [
+        ("a.yml", "port"),
+        ("a.yml", "debug_port"),
+        ("b.yml", "port"),
+        ("c.yml", "port"),
+    ]:
+        artifact = ArtifactNode(
+            os.path.join(get_config.project_root_abs, file_name),
+            file_name,
+            "test",
+            network.root,
+        )
+        option = OptionNode(option_name, "1", ConfigType.PORT)
+        artifact.add_child(option)
+        value = ValueNode("8000")
+        option.add_child(value)
+        nodes.append(value)
+    # nodes of a.yml are not linked with each other
+    network.add_link_group(LinkGroup(nodes[:3]))
+    network.add_link_group(LinkGroup(nodes[1:]))
+
+    def export():
+        dot_file = io.StringIO()
+        DotExporter(network).export(dot_file, False)
+        json_file = io.StringIO()
+        JSONExporter(network).export(json_file, False)
+        return dot_file.getvalue(), json.loads(json_file.getvalue())
+
+    dot, exported = export()
+    groups = [node for node in exported["nodes"] if node["type"] == "LinkGroup"]
+
+    assert export() == (dot, exported)
+    assert [group["id_cfgnet"] for group in groups] == ["group_1"]
+    assert "group_0" not in dot
+    assert "group_1 [" in dot
+    assert len([link for link in exported["links"] if link["type"] == "link"]) == 5
@@ -0,0 +1,86 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.linker.env_var_linker import EnvVarLinker
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+def add_option(parent, option_name: str, value_name: str) -> ValueNode:
+    option = OptionNode(option_name, "1")
+    parent.add_child(option)
+    value = ValueNode(name=value_name)
+    option.add_child(value)
+    return value
+
+
+def test_get_references():
+    references = EnvVarLinker.get_references(
+        "postgres://${DB_HOST}:${DB_PORT:-5432}/$DB_NAME?${{ env.MODE }}"
+    )
+
+    assert references == ["DB_HOST", "DB_PORT", "DB_NAME", "MODE"]
+    assert EnvVarLinker.get_references("${project.version} $1") == []
+
+
+def test_link_references(tmp_path):
+    root = ProjectNode("project", str(tmp_path))
+    cfg = NetworkConfiguration(
+        project_root_abs=str(tmp_path),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+        enable_file_type_plugins=False,
+        system_level=False,
+    )
+    network = Network("project", root, cfg)
+    dotenv = ArtifactNode("/.env", ".env", "dotenv", root)
+    compose = ArtifactNode(
+        "/docker-compose.yml", "docker-compose.yml", "docker-compose", root
+    )
+    travis = ArtifactNode("/.travis.yml", ".travis.yml", "travis", root)
+
+    port = add_option(dotenv, "DB_PORT", "5432")
+    environment = OptionNode("environment", "1")
+    compose.add_child(environment)
+    url = add_option(environment, "DATABASE_URL", "db:${DB_PORT}")
+    env = OptionNode("env", "1")
+    travis.add_child(env)
+    suite = ValueNode("SUITE=unit")
+    env.add_child(suite)
+    script = add_option(travis, "script", "./test.sh $SUITE $DB_PORT")
+
+    linker = EnvVarLinker()
+    linker.network = network
+    linker.enable_internal_links = False
+    linker.create_links()
+
+    groups = {
+        frozenset(node.id for node in group) for group in network.link_groups
+    }
+
+    # references of the same variable are not linked with each other
+    assert groups == {
+        frozenset((port.id, url.id)),
+        frozenset((port.id, script.id)),
+    }
+    assert linker._find_matches(script) == [port]
+    assert linker._definitions["SUITE"] == [suite]
@@ -0,0 +1,93 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pickle
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.link import Link
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+def create_value(artifact: ArtifactNode, *option_names: str) -> ValueNode:
+    parent = artifact
+    for option_name in option_names:
+        option = OptionNode(option_name, "1", ConfigType.PORT)
+        parent.add_child(option)
+        parent = option
+    value = ValueNode(name="8000")
+    parent.add_child(value)
+    return value
+
+
+def test_link_identity():
+    root = ProjectNode("project", "/")
+    artifact_a = ArtifactNode("/a", "a", "test", root)
+    artifact_b = ArtifactNode("/b", "b", "test", root)
+    value_a = create_value(artifact_a, "server", "port")
+    value_b = create_value(artifact_b, "port")
+    other = create_value(artifact_b, "debug_port")
+
+    link = Link(value_b, value_a)
+
+    assert link.node_a is value_a
+    assert link.node_b is value_b
+    assert link == Link(value_a, value_b)
+    assert hash(link) == hash(Link(value_a, value_b))
+    assert link != Link(value_a, other)
+    assert len({link, Link(value_a, value_b), Link(value_a, other)}) == 2
+    assert link != "a <-> b"
+
+
+def test_link_components():
+    root = ProjectNode("project", "/")
+    artifact_a = ArtifactNode("/a", "a", "test", root)
+    artifact_b = ArtifactNode("/b", "b", "test", root)
+    value_a = create_value(artifact_a, "server", "port")
+    value_b = create_value(artifact_b, "port")
+    other = create_value(artifact_b, "debug_port")
+
+    components = {}
+    link = Link(value_a, value_b, components)
+    other_link = Link(value_a, other, components)
+
+    assert not components
+    assert link.artifact_a is artifact_a
+    assert link.artifact_b is artifact_b
+    assert [option.name for option in link.option_stack_a] == [
+        "server",
+        "port",
+    ]
+    assert [option.name for option in link.option_stack_b] == ["port"]
+    assert other_link.option_stack_a is link.option_stack_a
+
+
+def test_pickle_link():
+    root = ProjectNode("project", "/")
+    artifact_a = ArtifactNode("/a", "a", "test", root)
+    artifact_b = ArtifactNode("/b", "b", "test", root)
+    link = Link(
+        create_value(artifact_a, "port"), create_value(artifact_b, "port")
+    )
+
+    loaded = pickle.loads(pickle.dumps(link))
+
+    assert loaded == link
+    assert loaded.artifact_b.id == artifact_b.id
+    assert loaded.option_stack_a[-1].name == "port"
@@ -0,0 +1,82 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.link import Link
+from cfgnet.linker.link_group import LinkGroup
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+def create_value(artifact: ArtifactNode, option_name: str) -> ValueNode:
+    option = OptionNode(option_name, "1", ConfigType.PORT)
+    artifact.add_child(option)
+    value = ValueNode(name="8000")
+    option.add_child(value)
+    return value
+
+
+def test_links_between_artifacts():
+    root = ProjectNode("project", "/")
+    artifact_a = ArtifactNode("/a", "a", "test", root)
+    artifact_b = ArtifactNode("/b", "b", "test", root)
+    a_1 = create_value(artifact_a, "port_1")
+    a_2 = create_value(artifact_a, "port_2")
+    b_1 = create_value(artifact_b, "port_1")
+
+    group = LinkGroup([b_1, a_2, a_1])
+    internal_group = LinkGroup([a_1, a_2, b_1], enable_internal_links=True)
+
+    assert len(group) == 3
+    assert group.count_links() == len(list(group.links())) == 2
+    assert (
+        internal_group.count_links() == len(set(internal_group.links())) == 3
+    )
+    assert group.has_link(Link(a_1, b_1))
+    assert group.has_link(Link(b_1, a_2))
+    assert not group.has_link(Link(a_1, a_2))
+    assert internal_group.has_link(Link(a_1, a_2))
+    assert group != internal_group
+    assert group == LinkGroup([a_1, a_2, b_1])
+
+
+def test_links_between_names():
+    root = ProjectNode("project", "/")
+    artifact_a = ArtifactNode("/a", "a", "test", root)
+    artifact_b = ArtifactNode("/b", "b", "test", root)
+    a_1 = create_value(artifact_a, "port_1")
+    a_2 = create_value(artifact_a, "port_2")
+    b_1 = create_value(artifact_b, "port_1")
+    b_2 = create_value(artifact_b, "port_2")
+    b_2.name = "8000.0"
+
+    group = LinkGroup([a_1, a_2, b_1, b_2], link_equal_names=False)
+    internal_group = LinkGroup(
+        [a_1, a_2, b_1, b_2],
+        enable_internal_links=True,
+        link_equal_names=False,
+    )
+
+    assert group.count_links() == len(list(group.links())) == 2
+    assert internal_group.count_links() == len(list(internal_group.links()))
+    assert internal_group.count_links() == 3
+    assert group.has_link(Link(a_1, b_2))
+    assert not group.has_link(Link(a_1, b_1))
+    assert internal_group.has_link(Link(b_1, b_2))
+    assert group != LinkGroup([a_1, a_2, b_1, b_2])
@@ -0,0 +1,46 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.linker_manager import LinkerManager
+from cfgnet.network.nodes import OptionNode, ValueNode
+
+
+def test_get_enabled_linkers():
+    all_linkers = LinkerManager.get_enabled_linkers(None)
+    path_linkers = LinkerManager.get_enabled_linkers(["path", "unknown"])
+
+    assert all_linkers == LinkerManager.all_linkers
+    assert [linker.name for linker in path_linkers] == ["path"]
+    assert LinkerManager.get_enabled_linkers([]) == []
+
+
+def test_shard_by_config_type():
+    nodes = []
+    for name, config_type in [
+        ("8080", ConfigType.PORT),
+        ("conf/app.yml", ConfigType.PATH),
+        ("8081", ConfigType.PORT),
+    ]:
+        option = OptionNode("option", "1", config_type)
+        value = ValueNode(name)
+        option.add_child(value)
+        nodes.append(value)
+
+    shards = LinkerManager.shard_by_config_type(nodes)
+
+    assert shards[ConfigType.PORT] == [nodes[0], nodes[2]]
+    assert shards[ConfigType.PATH] == [nodes[1]]
+    assert ConfigType.SIZE not in shards
@@ -0,0 +1,99 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.path_linker import PathLinker, PathTrie
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+def test_normalize():
+    assert PathLinker.normalize("./.env", "") == ".env"
+    assert PathLinker.normalize("../config/app.yml", "docker") == (
+        "config/app.yml"
+    )
+    assert PathLinker.normalize('"conf\\\\app.yml"', "a") == "a/conf/app.yml"
+    assert PathLinker.normalize("/etc/nginx//nginx.conf", "a") == (
+        "/etc/nginx/nginx.conf"
+    )
+    assert PathLinker.normalize("${HOME}/.env", "") is None
+    assert PathLinker.normalize("https://example.org/a", "") is None
+    assert PathLinker.normalize(".", "") is None
+
+
+def test_find_path():
+    trie = PathTrie()
+    for path in ["nginx.conf", "config/app.yml", "a/.env", "b/.env"]:
+        trie.insert(path)
+
+    assert trie.find("config/app.yml") == "config/app.yml"
+    assert trie.find("/etc/nginx/nginx.conf") == "nginx.conf"
+    assert trie.find("app.yml") == "config/app.yml"
+    assert trie.find("docker/config/app.yml") == "config/app.yml"
+    assert trie.find(".env") is None
+    assert trie.find("c/.env") is None
+    assert trie.find("other.yml") is None
+
+
+def test_create_links(tmp_path):
+    root = ProjectNode("project", str(tmp_path))
+    cfg = NetworkConfiguration(
+        project_root_abs=str(tmp_path),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+        enable_file_type_plugins=False,
+        system_level=False,
+    )
+    network = Network("project", root, cfg)
+    values = []
+    for file_name, value_name in [
+        ("docker-compose.yml", "./.env"),
+        ("a/app.yml", "../.env"),
+        ("b/app.yml", "../.env"),
+    ]:
+        artifact = ArtifactNode(
+            str(tmp_path / file_name), file_name, "test", root
+        )
+        option = OptionNode("env_file", "1", ConfigType.PATH)
+        artifact.add_child(option)
+        value = ValueNode(value_name)
+        value.config_type = ConfigType.PATH
+        option.add_child(value)
+        values.append(value)
+    compose, app_a, app_b = values
+
+    linker = PathLinker()
+    linker.network = network
+    linker.enable_internal_links = False
+    linker.value_nodes = values
+    linker.create_links()
+
+    links = {
+        frozenset((link.node_a.id, link.node_b.id)) for link in network.links
+    }
+
+    # identical spellings are left to the equality linker
+    assert len(network.link_groups) == 1
+    assert links == {
+        frozenset((compose.id, app_a.id)),
+        frozenset((compose.id, app_b.id)),
+    }
@@ -0,0 +1,81 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.stop_values import StopValueFilter
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+def create_values():
+    root = ProjectNode("project", "/")
+    values = []
+    for index in range(10):
+        artifact = ArtifactNode(f"/{index}", str(index), "test", root)
+        for name in ["latest", "utf-8"] if index < 6 else ["latest"]:
+            option = OptionNode(name, "1", ConfigType.UNKNOWN)
+            artifact.add_child(option)
+            value = ValueNode(name=name)
+            option.add_child(value)
+            values.append(value)
+    return values
+
+
+def test_find_stop_values():
+    values = create_values()
+
+    spread_filter = StopValueFilter(max_nodes=100, max_artifact_share=0.5)
+    frequency_filter = StopValueFilter(max_nodes=8, max_artifact_share=1.0)
+
+    assert set(spread_filter.analyze(values, 10)) == {"latest", "utf-8"}
+    assert set(frequency_filter.analyze(values, 10)) == {"latest"}
+    assert frequency_filter.suppressed["latest"].artifacts == 10
+
+
+def test_filter_stop_values():
+    values = create_values()
+    latest = [value for value in values if value.name == "latest"]
+    utf_8 = [value for value in values if value.name == "utf-8"]
+
+    drop_filter = StopValueFilter(max_nodes=8, max_artifact_share=1.0)
+    cap_filter = StopValueFilter(max_nodes=8, max_artifact_share=1.0, cap=True)
+    drop_filter.analyze(values, 10)
+    cap_filter.analyze(values, 10)
+
+    assert drop_filter.filter(latest) == []
+    assert drop_filter.filter(utf_8) == utf_8
+    assert len(cap_filter.filter(latest)) == 8
+
+
+def test_persist_stop_values(tmp_path):
+    values = create_values()
+    stopvalues_path = os.path.join(tmp_path, "stopvalues")
+
+    learning_filter = StopValueFilter(max_nodes=8, max_artifact_share=1.0)
+    learning_filter.analyze(values, 10)
+    learning_filter.save(stopvalues_path)
+
+    stop_value_filter = StopValueFilter(max_nodes=100, max_artifact_share=1.0)
+    stop_value_filter.load(stopvalues_path)
+    stop_value_filter.analyze(values, 10)
+
+    assert stop_value_filter.learned_values == {"latest"}
+    assert stop_value_filter.suppressed["latest"].learned
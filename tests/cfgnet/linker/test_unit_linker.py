@@ -0,0 +1,128 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.link import Link
+from cfgnet.linker.unit_linker import UnitLinker
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+def create_value(
+    artifact: ArtifactNode,
+    option_name: str,
+    value_name: str,
+    config_type: ConfigType,
+) -> ValueNode:
+    option = OptionNode(option_name, "1", config_type)
+    artifact.add_child(option)
+    value = ValueNode(name=value_name)
+    option.add_child(value)
+    return value
+
+
+def test_find_matches():
+    root = ProjectNode("project", "/")
+    artifact_a = ArtifactNode("/a", "a", "test", root)
+    artifact_b = ArtifactNode("/b", "b", "test", root)
+
+    heap = create_value(artifact_a, "heap", "512m", ConfigType.SIZE)
+    memory = create_value(artifact_b, "memory", "512MB", ConfigType.SIZE)
+    memory_mb = create_value(artifact_b, "memory_mb", "512", ConfigType.SIZE)
+    timeout = create_value(artifact_b, "timeout", "512", ConfigType.TIME)
+    copy = create_value(artifact_b, "heap", "512m", ConfigType.SIZE)
+
+    linker = UnitLinker()
+    linker.enable_internal_links = False
+    linker._nodes_by_key = {}
+    for node in [heap, memory, memory_mb, timeout, copy]:
+        linker._nodes_by_key.setdefault(linker._get_key(node), []).append(node)
+
+    assert linker._find_matches(heap) == [memory, memory_mb]
+    assert linker._find_matches(timeout) == []
+
+
+def test_create_links(tmp_path):
+    root = ProjectNode("project", str(tmp_path))
+    cfg = NetworkConfiguration(
+        project_root_abs=str(tmp_path),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+        enable_file_type_plugins=False,
+        system_level=False,
+    )
+    network = Network("project", root, cfg)
+    artifact_a = ArtifactNode("/a", "a", "test", root)
+    artifact_b = ArtifactNode("/b", "b", "test", root)
+
+    heap = create_value(artifact_a, "heap", "512m", ConfigType.SIZE)
+    copy = create_value(artifact_b, "heap", "512m", ConfigType.SIZE)
+    memory = create_value(artifact_b, "memory", "512MB", ConfigType.SIZE)
+
+    linker = UnitLinker()
+    linker.network = network
+    linker.enable_internal_links = False
+    linker.value_nodes = [heap, copy, memory]
+    linker.create_links()
+
+    links = {
+        frozenset((link.node_a.id, link.node_b.id)) for link in network.links
+    }
+
+    # identical values are left to the equality linker
+    assert len(network.link_groups) == 1
+    assert links == {frozenset((heap.id, memory.id))}
+
+
+def test_create_links_scales_with_nodes(tmp_path):
+    root = ProjectNode("project", str(tmp_path))
+    cfg = NetworkConfiguration(
+        project_root_abs=str(tmp_path),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+        enable_file_type_plugins=False,
+        system_level=False,
+    )
+    network = Network("project", root, cfg)
+    nodes = {"512m": [], "536870912": []}
+    for name, values in nodes.items():
+        for index in range(1000):
+            artifact = ArtifactNode(
+                f"/{name}_{index}", f"{name}_{index}", "test", root
+            )
+            values.append(
+                create_value(artifact, "heap", name, ConfigType.SIZE)
+            )
+
+    linker = UnitLinker()
+    linker.network = network
+    linker.enable_internal_links = False
+    linker.value_nodes = nodes["512m"] + nodes["536870912"]
+    linker.create_links()
+
+    # one group stands for all links between the two spellings
+    assert len(network.link_groups) == 1
+    group = next(iter(network.link_groups))
+    assert group.count_links() == 1000 * 1000
+    assert network.has_link(Link(nodes["512m"][0], nodes["536870912"][-1]))
+    assert not network.has_link(Link(nodes["512m"][0], nodes["512m"][1]))
@@ -56,3 +56,31 @@ def test_ignorefile(repo):
     network = Network.init_network(cfg)
 
     assert len(network.get_nodes(ValueNode)) == 2
+
+
+def test_ignorefile_at_commit(repo):
+    cfg = NetworkConfiguration(
+        project_root_abs=os.path.abspath(repo.root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+        enable_file_type_plugins=False,
+        system_level=False
+    )
+
+    cfgnet_dir = os.path.join(cfg.project_root_abs, cfg.cfgnet_path_rel)
+    if not os.path.exists(cfgnet_dir):
+        os.makedirs(cfgnet_dir)
+    ignorefile_path = cfg.ignorefile_path()
+    with open(ignorefile_path, "w+", encoding="utf-8") as ignorefile:
+        ignorefile.write("*.xml\nignored_dir")
+    repo.repo.index.add([ignorefile_path])
+    commit = repo.repo.index.commit("Add ignorefile").hexsha
+
+    with open(ignorefile_path, "w+", encoding="utf-8") as ignorefile:
+        ignorefile.write("")
+
+    network = Network.init_network(cfg, commit=commit)
+
+    assert len(network.get_nodes(ValueNode)) == 2
+    assert len(Network.init_network(cfg).get_nodes(ValueNode)) > 2
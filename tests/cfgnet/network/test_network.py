@@ -26,6 +26,7 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.conflicts.conflict import ModifiedOptionConflict
+from cfgnet.config_types.config_types import ConfigType
 from tests.utility.temporary_repository import TemporaryRepository
 
 
@@ -71,10 +72,52 @@ def test_init_network(get_repo, get_config):
 
     assert network
     assert network.root == root
-    assert len(network.links) == 2
+    assert len(network.links) == 3
     assert os.path.isdir(network.cfg.data_dir_path())
 
 
+def test_init_network_at_commit(get_repo, get_config):
+    repo = get_repo
+    initial_commit = repo.repo.head.commit.hexsha
+    ref_network = Network.init_network(cfg=get_config)
+
+    repo.apply_patch(
+        "tests/test_repos/maven_docker/0002-Provoke-two-conflicts.patch"
+    )
+
+    commit_network = Network.init_network(
+        cfg=get_config, commit=initial_commit
+    )
+    head_network = Network.init_network(cfg=get_config)
+
+    assert set(commit_network.nodes) == set(ref_network.nodes)
+    assert commit_network.links == ref_network.links
+    assert set(head_network.nodes) != set(ref_network.nodes)
+
+
+def test_init_network_without_types(get_file_type_repo, get_config):
+    get_config.project_root_abs = os.path.abspath(get_file_type_repo.root)
+    get_config.enable_file_type_plugins = True
+    typed_network = Network.init_network(cfg=get_config)
+    get_config.infer_types = False
+    network = Network.init_network(cfg=get_config)
+
+    typed_values = {
+        node.id: node.config_type
+        for node in typed_network.get_nodes(node_type=ValueNode)
+    }
+    values = network.get_nodes(node_type=ValueNode)
+
+    assert {node.id for node in values} == set(typed_values)
+    assert any(
+        node.config_type != typed_values[node.id] for node in values
+    )
+    assert all(
+        node.config_type in (typed_values[node.id], ConfigType.UNKNOWN)
+        for node in values
+    )
+
+
 def test_init_network_with_file_type_plugins(get_file_type_repo, get_config):
     config = get_config
     config.project_root_abs = os.path.abspath(get_file_type_repo.root)
@@ -101,7 +144,7 @@ def test_links(get_config):
         str(link).rsplit("::::", maxsplit=1)[-1] for link in network.links
     }
 
-    assert len(network.links) == 2
+    assert len(network.links) == 3
     assert expected_links == link_targets
 
 
@@ -123,10 +166,23 @@ def test_enable_internal_links(get_config):
         str(link).rsplit("::::", maxsplit=1)[-1] for link in network.links
     }
     
-    assert len(network.links) == 6
+    assert len(network.links) == 8
     assert expected_links == link_targets
 
 
+def test_enabled_linkers(get_config):
+    config = get_config
+    config.enabled_linkers = ["equality"]
+    network = Network.init_network(cfg=config)
+
+    assert len(network.links) == 2
+
+    config.enabled_linkers = []
+    network = Network.init_network(cfg=config)
+
+    assert len(network.links) == 0
+
+
 def test_get_nodes(get_config):
     network = Network.init_network(cfg=get_config)
 
@@ -17,6 +17,7 @@ import os
 import pytest
 
 from cfgnet.plugins.concept.apache_webserver_plugin import ApacheWebserverPlugin
+from cfgnet.plugins.file_content import FileContent
 from cfgnet.config_types.config_types import ConfigType
 from tests.utility.id_creator import make_id
 
@@ -67,6 +68,73 @@ def test_parse_apache_webserver_file(get_plugin):
     assert make_id("httpd.conf", "VirtualHost", "10.1.2.3", "TransferLog", "transfer.log") in ids
 
 
+def test_include(get_plugin, tmp_path):
+    apache_webserver_plugin = get_plugin
+    (tmp_path / "conf" / "extra").mkdir(parents=True)
+    (tmp_path / "conf" / "httpd.conf").write_text(
+        "ServerName example.com\nInclude conf/extra/*.conf\nIncludeOptional missing.conf\n"
+    )
+    (tmp_path / "conf" / "extra" / "ssl.conf").write_text(
+        "# SSL\nListen 443\nInclude conf/httpd.conf\n"
+    )
+
+    artifact = apache_webserver_plugin.parse_file(
+        str(tmp_path / "conf" / "httpd.conf"), "conf/httpd.conf"
+    )
+    ids = {node.id for node in artifact.get_nodes()}
+    listen = next(node for node in artifact.children if node.name == "Listen")
+
+    assert make_id("conf/httpd.conf", "ServerName", "example.com") in ids
+    assert make_id("conf/httpd.conf", "Include", "conf/extra/*.conf") in ids
+    assert make_id("conf/httpd.conf", "Listen", "443") in ids
+    assert listen.location == "conf/extra/ssl.conf:2"
+
+
+def test_parse_directives():
+    content = FileContent(
+        b"# comment\n"
+        b"ServerName example.com\n"
+        b"<VirtualHost *:80>\n"
+        b'    DocumentRoot "/var/www/html"\n'
+        b"    <Directory /var/www/html>\n"
+        b"        Options Indexes \\\n"
+        b"            FollowSymLinks\n"
+        b"    </directory>\n"
+        b'    Header set X-Frame "a b"\n'
+        b"</VirtualHost>\n"
+        b"LogLevel warn\n",
+        "httpd.conf",
+    )
+
+    server_name, virtual_host, log_level = ApacheWebserverPlugin.parse_directives(content)
+    document_root, directory, header = virtual_host.block
+
+    assert server_name.args == "example.com"
+    assert virtual_host.args == "*:80"
+    assert virtual_host.line == 3
+    assert document_root.args == "/var/www/html"
+    assert directory.block[0].args == "Indexes FollowSymLinks"
+    assert directory.block[0].line == 6
+    assert header.args == 'set X-Frame "a b"'
+    assert log_level.line == 11
+
+
+def test_include_in_section(get_plugin, tmp_path):
+    apache_webserver_plugin = get_plugin
+    (tmp_path / "sites").mkdir()
+    (tmp_path / "httpd.conf").write_text(
+        "<VirtualHost *:443>\nInclude sites/*.conf\n</VirtualHost>\n"
+    )
+    (tmp_path / "sites" / "ssl.conf").write_text("SSLEngine on\n")
+
+    artifact = apache_webserver_plugin.parse_file(
+        str(tmp_path / "httpd.conf"), "httpd.conf"
+    )
+    ids = {node.id for node in artifact.get_nodes()}
+
+    assert make_id("httpd.conf", "VirtualHost", "*:443", "SSLEngine", "on") in ids
+
+
 def test_config_types(get_plugin):
     apache_webserver_plugin = get_plugin
     apache_webserver = os.path.abspath("tests/files/httpd.conf")
@@ -46,7 +46,7 @@ def test_parse_dockerfile(get_plugin):
     ids = {node.id for node in nodes}
 
     assert artifact is not None
-    assert len(nodes) == 35
+    assert len(nodes) == 36
 
     # FILE PATH
     assert make_id("Dockerfile", "file", "Dockerfile") in ids
@@ -55,6 +55,9 @@ def test_parse_dockerfile(get_plugin):
     assert make_id("Dockerfile", "FROM", "image", "java:8") in ids
     assert make_id("Dockerfile", "FROM", "name", "builder") in ids
 
+    # ARG
+    assert make_id("Dockerfile", "ARG", "PATH", "/path") in ids
+
     # ENV
     assert make_id("Dockerfile", "ENV", "myName", '"John Doe"') in ids
     assert make_id("Dockerfile", "ENV", "port", "8000") in ids
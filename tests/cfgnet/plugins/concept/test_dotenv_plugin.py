@@ -0,0 +1,44 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import os
+
+from cfgnet.plugins.concept.dotenv_plugin import DotenvPlugin
+from tests.utility.id_creator import make_id
+
+
+def test_is_responsible():
+    plugin = DotenvPlugin()
+
+    assert plugin.is_responsible("/path/to/.env")
+    assert plugin.is_responsible("/path/to/.env.production")
+    assert plugin.is_responsible("/path/to/database.env")
+    assert not plugin.is_responsible("/path/to/environment.yml")
+
+
+def test_parse_config_file():
+    plugin = DotenvPlugin()
+    dotenv_file = os.path.abspath("tests/files/.env")
+
+    artifact = plugin.parse_file(dotenv_file, ".env")
+    nodes = artifact.get_nodes()
+    ids = {node.id for node in nodes}
+
+    assert len(nodes) == 6
+    assert make_id(".env", "file", ".env") in ids
+    assert make_id(".env", "DB_HOST", "localhost") in ids
+    assert make_id(".env", "DB_PORT", "5432") in ids
+    assert make_id(".env", "DB_NAME", "app db") in ids
+    assert make_id(".env", "DB_USER", "admin") in ids
+    assert make_id(".env", "LOG_LEVEL", "info") in ids
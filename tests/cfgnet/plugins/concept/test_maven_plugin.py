@@ -18,6 +18,7 @@ import os
 import pytest
 
 from cfgnet.plugins.concept.maven_plugin import MavenPlugin
+from cfgnet.plugins.file_content import WorkingTreeSource
 from cfgnet.config_types.config_types import ConfigType
 from tests.utility.id_creator import make_id
 
@@ -151,3 +152,102 @@ def test_config_types(get_plugin):
     assert executable_name_no_version.config_type == ConfigType.PATH
     assert version_node.config_type == ConfigType.VERSION_NUMBER
     assert modelVersion_node.config_type == ConfigType.VERSION_NUMBER
+
+
+PARENT_POM = """<project>
+  <groupId>com.example</groupId>
+  <artifactId>parent</artifactId>
+  <version>1.0</version>
+  <packaging>pom</packaging>
+  <modules>
+    <module>app</module>
+  </modules>
+  <properties>
+    <spring.version>5.3.1</spring.version>
+    <app.port>8080</app.port>
+  </properties>
+</project>
+"""
+
+CHILD_POM = """<project>
+  <parent>
+    <groupId>com.example</groupId>
+    <artifactId>parent</artifactId>
+    <version>1.0</version>
+  </parent>
+  <artifactId>app</artifactId>
+  <properties>
+    <server.port>${app.port}</server.port>
+  </properties>
+  <dependencies>
+    <dependency>
+      <groupId>org.springframework</groupId>
+      <artifactId>spring-core</artifactId>
+      <version>${spring.version}</version>
+    </dependency>
+  </dependencies>
+</project>
+"""
+
+
+def test_parse_child_pom(get_plugin, tmp_path):
+    maven_plugin = get_plugin
+    (tmp_path / "pom.xml").write_text(PARENT_POM)
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "pom.xml").write_text(CHILD_POM)
+
+    artifact = maven_plugin.parse_file(
+        str(tmp_path / "app" / "pom.xml"), "app/pom.xml"
+    )
+    ids = {node.id for node in artifact.get_nodes()}
+
+    assert make_id("app/pom.xml", "project", "properties", "server.port", "8080") in ids
+    assert make_id("app/pom.xml", "project", "dependencies", "dependency", "org.springframework:spring-core:5.3.1", "version", "5.3.1") in ids
+    assert make_id("app/pom.xml", "ExecutableName", "target/app-1.0.jar") in ids
+
+
+def test_pom_cache(get_plugin, tmp_path):
+    maven_plugin = get_plugin
+    (tmp_path / "pom.xml").write_text(PARENT_POM)
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "pom.xml").write_text(CHILD_POM)
+
+    maven_plugin.parse_file(str(tmp_path / "pom.xml"), "pom.xml")
+    # the module is resolved while parsing its parent
+    assert len(maven_plugin.pom_cache) == 2
+
+    maven_plugin.parse_file(str(tmp_path / "app" / "pom.xml"), "app/pom.xml")
+    assert len(maven_plugin.pom_cache) == 2
+
+    (tmp_path / "pom.xml").write_text(PARENT_POM.replace("5.3.1", "5.3.2"))
+    artifact = maven_plugin.parse_file(
+        str(tmp_path / "app" / "pom.xml"), "app/pom.xml"
+    )
+    ids = {node.id for node in artifact.get_nodes()}
+
+    assert len(maven_plugin.pom_cache) == 3
+    assert make_id("app/pom.xml", "project", "dependencies", "dependency", "org.springframework:spring-core:5.3.2", "version", "5.3.2") in ids
+
+
+def test_parent_by_coordinates_per_source(get_plugin, tmp_path):
+    maven_plugin = get_plugin
+    (tmp_path / "parent").mkdir()
+    (tmp_path / "parent" / "pom.xml").write_text(PARENT_POM)
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "pom.xml").write_text(CHILD_POM)
+    source = WorkingTreeSource(str(tmp_path))
+
+    def parse_app(app_source):
+        artifact = maven_plugin.parse_content(
+            app_source.read(str(tmp_path / "app" / "pom.xml")), "app/pom.xml"
+        )
+        return {node.id for node in artifact.get_nodes()}
+
+    maven_plugin.parse_content(
+        source.read(str(tmp_path / "parent" / "pom.xml")), "parent/pom.xml"
+    )
+    port_id = make_id("app/pom.xml", "project", "properties", "server.port", "8080")
+
+    assert port_id in parse_app(source)
+    # the parent of another source is not used
+    assert port_id not in parse_app(WorkingTreeSource(str(tmp_path)))
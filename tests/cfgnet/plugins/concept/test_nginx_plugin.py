@@ -14,7 +14,9 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from cfgnet.plugins.concept.nginx_plugin import NginxPlugin
+from cfgnet.plugins.file_content import FileContent
 from cfgnet.config_types.config_types import ConfigType
+from cfgnet.network.nodes import OptionNode
 from tests.utility.id_creator import make_id
 
 
@@ -90,3 +92,85 @@ def test_parse_config_file(tmp_path):
     assert make_id("nginx.conf", "http", "server", "ssl_certificate_key", "/etc/nginx/ssl/example.com.key") in ids
     assert make_id("nginx.conf", "http", "server", "auth_basic", '"Restricted Area"') in ids
     assert make_id("nginx.conf", "http", "server", "auth_basic_user_file", "/etc/nginx/.htpasswd") in ids
+
+
+def test_block_nodes():
+    """Test that every block is represented by a single option node."""
+    plugin = NginxPlugin()
+    artifact = plugin.parse_file("tests/files/nginx.conf", "nginx.conf")
+    option_ids = [node.id for node in artifact.get_nodes(node_type=OptionNode)]
+
+    assert option_ids.count(make_id("nginx.conf", "http")) == 1
+    assert option_ids.count(make_id("nginx.conf", "http", "server")) == 1
+    assert option_ids.count(make_id("nginx.conf", "http", "server", "location /api")) == 1
+
+    server = next(node for node in artifact.get_nodes(node_type=OptionNode) if node.id == make_id("nginx.conf", "http", "server"))
+    assert server.location == 21
+    assert len(server.children) == 13
+
+
+def test_parse_directives():
+    """Test tokenizing statements, comments and quotes."""
+    content = FileContent(
+        b'events { worker_connections 512; }  # comment\n'
+        b'http {\n'
+        b'    log_format main "$remote_addr; $request"\n'
+        b'                    \'"$status"\';\n'
+        b'    server { listen 80; } server { listen 443; }\n'
+        b'}\n',
+        "nginx.conf",
+    )
+
+    directives = NginxPlugin.parse_directives(content)
+
+    assert [directive.name for directive in directives] == ["events", "http"]
+    assert directives[0].block[0].args == ["512"]
+    log_format, first, second = directives[1].block
+    assert log_format.args == ["main", '"$remote_addr; $request"', "'\"$status\"'"]
+    assert log_format.line == 3
+    assert first.block[0].args == ["80"]
+    assert second.block[0].args == ["443"]
+
+
+def test_merge_repeated_blocks():
+    """Test that directives of repeated blocks share the block node."""
+    plugin = NginxPlugin()
+    content = FileContent(
+        b"http {\n  server { listen 80; }\n  server { listen 443; }\n  upstream {}\n}\n",
+        "/path/to/nginx.conf",
+    )
+
+    artifact = plugin.parse_content(content, "nginx.conf")
+    options = artifact.get_nodes(node_type=OptionNode)
+    ids = {node.id for node in artifact.get_nodes()}
+
+    assert [node.name for node in options].count("server") == 1
+    assert "upstream" not in [node.name for node in options]
+    assert make_id("nginx.conf", "http", "server", "listen", "80") in ids
+    assert make_id("nginx.conf", "http", "server", "listen", "443") in ids
+
+
+def test_include(tmp_path):
+    """Test that included files are parsed into the tree of the artifact."""
+    plugin = NginxPlugin()
+    (tmp_path / "conf.d").mkdir()
+    (tmp_path / "nginx.conf").write_text(
+        "http {\n  include /etc/nginx/conf.d/*.conf;\n}\n"
+    )
+    (tmp_path / "conf.d" / "default.conf").write_text(
+        "server {\n  listen 80;\n  include /etc/nginx/nginx.conf;\n}\n"
+    )
+    (tmp_path / "conf.d" / "ssl.conf").write_text("server {\n  listen 443;\n}\n")
+
+    artifact = plugin.parse_file(str(tmp_path / "nginx.conf"), "nginx.conf")
+    options = artifact.get_nodes(node_type=OptionNode)
+    ids = {node.id for node in artifact.get_nodes()}
+
+    assert make_id("nginx.conf", "http", "include", "/etc/nginx/conf.d/*.conf") in ids
+    assert make_id("nginx.conf", "http", "server", "listen", "80") in ids
+    assert make_id("nginx.conf", "http", "server", "listen", "443") in ids
+    assert [node.name for node in options].count("server") == 1
+
+    listen = next(node for node in options if node.name == "listen")
+    assert listen.location == "conf.d/default.conf:2"
+    assert len(plugin.includes) == 2
@@ -0,0 +1,156 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+
+import pytest
+
+from cfgnet.network.nodes import OptionNode
+from cfgnet.plugins.file_type.json_parser import (
+    JsonEvent,
+    iter_json_events,
+    skip_json_value,
+)
+from cfgnet.plugins.file_type.json_plugin import JsonPlugin
+from tests.utility.id_creator import make_id
+
+
+@pytest.fixture(name="get_plugin")
+def get_plugin_():
+    plugin = JsonPlugin()
+    return plugin
+
+
+def test_is_responsible(get_plugin):
+    json_plugin = get_plugin
+
+    json_file = json_plugin.is_responsible("/path/to/file.json")
+    no_json_file = json_plugin.is_responsible("/path/to/pom.xml")
+
+    assert json_file
+    assert not no_json_file
+
+
+def test_parse_json_file(get_plugin, tmp_path):
+    json_plugin = get_plugin
+    json_file = tmp_path / "test.json"
+    json_file.write_text(
+        '{\n  "name": "app",\n  "server": {\n    "port": 8080,\n'
+        '    "debug": true\n  },\n  "hosts": ["a", "b"],\n'
+        '  "empty": {},\n  "path": "C:\\\\tmp"\n}\n',
+        encoding="utf-8",
+    )
+
+    artifact = json_plugin.parse_file(str(json_file), "test.json")
+    nodes = artifact.get_nodes()
+    ids = {node.id for node in nodes}
+    locations = {
+        node.id: node.location
+        for node in artifact.get_nodes(node_type=OptionNode)
+    }
+
+    assert len(nodes) == 7
+    assert make_id("test.json", "file", "test.json") in ids
+    assert make_id("test.json", "name", "app") in ids
+    assert make_id("test.json", "server", "port", "8080") in ids
+    assert make_id("test.json", "server", "debug", "True") in ids
+    assert make_id("test.json", "hosts", "hosts/a", "a") in ids
+    assert make_id("test.json", "hosts", "hosts/b", "b") in ids
+    assert make_id("test.json", "path", "C:\\tmp") in ids
+
+    assert locations[make_id("test.json", "server", "port")] == 4
+    assert locations[make_id("test.json", "server", "debug")] == 5
+    assert locations[make_id("test.json", "hosts", "hosts/b")] == 7
+    assert locations[make_id("test.json", "path")] == 9
+
+
+def test_parse_duplicate_keys(get_plugin, tmp_path):
+    json_plugin = get_plugin
+    json_file = tmp_path / "duplicate.json"
+    json_file.write_text(
+        '{\n  "server": {"port": 80},\n  "server": {"port": 8080}\n}\n',
+        encoding="utf-8",
+    )
+
+    artifact = json_plugin.parse_file(str(json_file), "duplicate.json")
+    options = artifact.get_nodes(node_type=OptionNode)
+    ids = [node.id for node in artifact.get_nodes()]
+
+    assert ids == [
+        make_id("duplicate.json", "file", "duplicate.json"),
+        make_id("duplicate.json", "server", "port", "8080"),
+    ]
+    assert len({option.id for option in options}) == len(options)
+    assert options[-1].location == 3
+
+
+def test_parse_invalid_json_file(get_plugin, tmp_path):
+    json_plugin = get_plugin
+    json_file = tmp_path / "invalid.json"
+    json_file.write_text('{"name": "app",}', encoding="utf-8")
+
+    artifact = json_plugin.parse_file(str(json_file), "invalid.json")
+    ids = [node.id for node in artifact.get_nodes()]
+
+    assert artifact is not None
+    assert ids == [make_id("invalid.json", "file", "invalid.json")]
+    assert len(artifact.children) == 1
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"a": [1, 2.5, -3e2, true, false, null], "b": {"c": "\\u00e4"}}',
+        "[[], {}, [{}], NaN]",
+        '"text"',
+    ],
+)
+def test_events_match_json_module(document):
+    def build(events, event):
+        if event[0] == JsonEvent.START_OBJECT:
+            result = {}
+            for key_event in events:
+                if key_event[0] == JsonEvent.END_OBJECT:
+                    return result
+                result[key_event[1]] = build(events, next(events))
+        if event[0] == JsonEvent.START_ARRAY:
+            result = []
+            for item_event in events:
+                if item_event[0] == JsonEvent.END_ARRAY:
+                    return result
+                result.append(build(events, item_event))
+        return event[1]
+
+    events = iter_json_events(document)
+
+    assert repr(build(events, next(events))) == repr(json.loads(document))
+
+
+@pytest.mark.parametrize(
+    "document", ['{"a": 1,}', "[1 2]", '{"a" 1}', "{} {}", "", "[1"]
+)
+def test_events_reject_invalid_json(document):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_events(document))
+
+
+def test_skip_json_value():
+    events = iter_json_events('{"a": {"b": [1, {"c": 2}]}, "d": 3}')
+    next(events)
+    next(events)
+
+    skip_json_value(events, next(events))
+
+    assert next(events) == (JsonEvent.KEY, "d", 1)
@@ -0,0 +1,80 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from lxml import etree as ET
+
+from cfgnet.plugins.file_type.xml_parser import (
+    XmlEvent,
+    iter_xml_events,
+    local_name,
+)
+
+DOCUMENT = b"""<?xml version="1.0"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <!-- comment -->
+  <name>app</name>
+  <dependency>
+    <groupId>org.example</groupId>
+    <!-- comment -->
+    <artifactId>lib</artifactId>
+  </dependency>
+</project>
+"""
+
+
+def test_local_name():
+    assert local_name("{http://maven.apache.org/POM/4.0.0}name") == "name"
+    assert local_name("name") == "name"
+
+
+def test_events():
+    events = [
+        (event, element.tag, element.sourceline)
+        for event, element in iter_xml_events(
+            DOCUMENT, subtree_tags={"dependency"}
+        )
+    ]
+
+    assert events == [
+        (XmlEvent.START, "project", 2),
+        (XmlEvent.START, "name", 4),
+        (XmlEvent.END, "name", 4),
+        (XmlEvent.SUBTREE, "dependency", 5),
+        (XmlEvent.END, "project", 2),
+    ]
+
+
+def test_subtree_is_complete():
+    for event, element in iter_xml_events(
+        DOCUMENT, subtree_tags={"dependency"}
+    ):
+        if event == XmlEvent.SUBTREE:
+            assert [(child.tag, child.text) for child in element] == [
+                ("groupId", "org.example"),
+                ("artifactId", "lib"),
+            ]
+
+
+def test_elements_are_freed():
+    for event, element in iter_xml_events(DOCUMENT):
+        if event == XmlEvent.END and element.tag == "project":
+            assert len(element) == 1
+
+
+def test_invalid_document():
+    with pytest.raises(ET.Error):
+        list(iter_xml_events(b"<project><name></project>"))
@@ -16,7 +16,10 @@
 import os
 
 import pytest
+import yaml
 
+from cfgnet.network.nodes import OptionNode
+from cfgnet.plugins.file_type import yaml_plugin as yaml_plugin_module
 from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from tests.utility.id_creator import make_id
 
@@ -62,3 +65,19 @@ def test_parse_yaml_file(get_plugin):
     assert make_id("test.yaml", "copy", "dest", "./tmp.sh") in ids
     assert make_id("test.yaml", "runs-on", "matrix.os") in ids
     assert make_id("test.yaml", "test", "empty", "") in ids
+
+
+def test_loaders_yield_same_nodes(get_plugin, monkeypatch):
+    yaml_plugin = get_plugin
+    file = os.path.abspath("tests/files/test.yaml")
+
+    def get_nodes(artifact):
+        return [
+            (node.id, node.location) for node in artifact.get_nodes(node_type=OptionNode)
+        ]
+
+    fast_nodes = get_nodes(yaml_plugin.parse_file(file, "test.yaml"))
+    monkeypatch.setattr(yaml_plugin_module, "YAML_LOADER", yaml.Loader)
+    python_nodes = get_nodes(yaml_plugin.parse_file(file, "test.yaml"))
+
+    assert fast_nodes == python_nodes
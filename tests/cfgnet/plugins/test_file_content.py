@@ -0,0 +1,161 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+import pytest
+
+from cfgnet.plugins.file_content import (
+    CommitSource,
+    FileContent,
+    WorkingTreeSource,
+)
+from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
+from cfgnet.plugins.line_index import LineIndex
+from cfgnet.vcs.git import Git
+from tests.utility.id_creator import make_id
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+def test_text_and_lines():
+    content = FileContent(b"a = 1\r\nb = 2\rc = 3\n")
+
+    assert content.text == "a = 1\nb = 2\nc = 3\n"
+    assert content.lines == ["a = 1\n", "b = 2\n", "c = 3\n"]
+
+
+def test_invalid_encoding():
+    content = FileContent(b"\xff\xfe")
+
+    with pytest.raises(UnicodeDecodeError):
+        _ = content.text
+
+
+def test_get_line_number():
+    content = FileContent(b"first\nsecond\n\nfourth")
+
+    assert content.get_line_number(0) == 1
+    assert content.get_line_number(5) == 1
+    assert content.get_line_number(6) == 2
+    assert content.get_line_number(13) == 3
+    assert content.get_line_number(14) == 4
+
+
+def test_line_index_is_shared():
+    content = FileContent(b"[section]\nkey = value\n")
+
+    line_index = content.get_line_index(LineIndex.for_ini)
+
+    assert content.get_line_index(LineIndex.for_ini) is line_index
+    assert line_index.get_line("key") == 2
+
+
+def test_from_file():
+    file_path = os.path.abspath("tests/files/test.ini")
+
+    content = FileContent.from_file(file_path)
+
+    assert content.file_path == file_path
+    with open(file_path, "rb") as file:
+        assert content.data == file.read()
+
+
+def test_load():
+    content = FileContent.from_file(os.path.abspath("tests/files/test.ini"))
+
+    other = content.load(os.path.abspath("tests/files/pom.xml"))
+
+    assert other is not None
+    assert other.file_path == os.path.abspath("tests/files/pom.xml")
+    assert content.load(os.path.abspath("tests/files/missing.xml")) is None
+    assert FileContent(b"").load(other.file_path) is None
+
+
+def test_working_tree_source_is_confined():
+    root = os.path.abspath("tests/files")
+    source = WorkingTreeSource(root)
+    content = FileContent.from_file(
+        os.path.join(root, "test.ini"), source=source
+    )
+
+    other = content.load(os.path.join(root, "pom.xml"))
+
+    assert other is not None
+    assert other.source is source
+    assert content.load(os.path.join(root, "..", "..", "README.md")) is None
+    assert content.glob(os.path.join(root, "..", "*.py")) == []
+    assert content.glob(os.path.join(root, "test.ini")) == [
+        os.path.join(root, "test.ini")
+    ]
+    assert source.dependencies == {"pom.xml", "test.ini"}
+
+
+def test_source_reads_files_once(tmp_path):
+    file_path = tmp_path / "test.ini"
+    file_path.write_bytes(b"a = 1\n")
+    source = WorkingTreeSource(str(tmp_path))
+
+    content = source.read(str(file_path))
+    file_path.write_bytes(b"a = 2\n")
+
+    assert content is not None
+    assert source.read(str(file_path)).data == b"a = 1\n"
+    assert source.load(str(file_path)).data == b"a = 1\n"
+    assert source.read(str(tmp_path / "missing.ini")) is None
+    assert source.dependencies == {"test.ini"}
+
+
+def test_digest():
+    assert FileContent(b"a = 1").digest == FileContent(b"a = 1").digest
+    assert FileContent(b"a = 1").digest != FileContent(b"a = 2").digest
+
+
+def test_commit_source():
+    repo = TemporaryRepository(
+        "tests/test_repos/maven_docker/0001-Add-Docker-and-maven-file.patch"
+    )
+    root = os.path.abspath(repo.root)
+    source = CommitSource(
+        Git(root).get_object_reader(), repo.repo.head.commit.hexsha, root, {}
+    )
+
+    content = source.load(os.path.join(root, "pom.xml"))
+
+    assert content is not None
+    assert content.source is source
+    assert content.glob(os.path.join(root, "*.xml")) == [
+        os.path.join(root, "pom.xml")
+    ]
+    assert content.glob(os.path.join(root, "*", "*.xml")) == []
+    assert source.load(os.path.join(root, "missing.xml")) is None
+    assert source.load(os.path.join(os.path.dirname(root), "pom.xml")) is None
+
+
+def test_parse_content():
+    plugin = ConfigParserPlugin()
+    content = FileContent(b"port = 8080\n", "/not/on/disk/test.ini")
+
+    artifact = plugin.parse_content(content, "test.ini")
+    ids = {node.id for node in artifact.get_nodes()}
+
+    assert artifact.file_path == "/not/on/disk/test.ini"
+    assert make_id("test.ini", "port", "8080") in ids
+
+
+def test_parse_content_not_responsible():
+    plugin = ConfigParserPlugin()
+    content = FileContent(b"port: 8080\n", "/not/on/disk/test.yml")
+
+    assert plugin.parse_content(content, "test.yml") is None
@@ -0,0 +1,84 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from cfgnet.plugins.file_content import FileContent
+from cfgnet.plugins.include_resolver import IncludeContext, IncludeResolver
+
+
+@pytest.fixture(name="project")
+def project_(tmp_path):
+    (tmp_path / "conf.d").mkdir()
+    (tmp_path / "conf.d" / "a.conf").write_text("a")
+    (tmp_path / "conf.d" / "b.conf").write_text("b")
+    (tmp_path / "main.conf").write_text("main")
+    return tmp_path
+
+
+def test_expand(project):
+    content = FileContent.from_file(str(project / "main.conf"))
+    base_dirs = [str(project)]
+
+    expected = [str(project / "conf.d" / "a.conf"), str(project / "conf.d" / "b.conf")]
+
+    assert IncludeResolver.expand("conf.d/*.conf", content, base_dirs) == expected
+    assert IncludeResolver.expand('"conf.d/a.conf"', content, base_dirs) == expected[:1]
+    assert IncludeResolver.expand("/etc/nginx/conf.d/*.conf", content, base_dirs) == expected
+    assert IncludeResolver.expand("/etc/nginx/*.conf", content, base_dirs) == []
+    assert IncludeResolver.expand("missing.conf", content, base_dirs) == []
+
+
+def test_resolve(project):
+    content = FileContent.from_file(str(project / "main.conf"))
+    context = IncludeContext(
+        content=content,
+        artifact_path=content.file_path,
+        project_root=str(project),
+        base_dirs=[str(project)],
+    )
+    resolver = IncludeResolver(lambda fragment: fragment.text.upper())
+
+    fragments = list(resolver.resolve("conf.d/*.conf", context))
+
+    assert [fragment for _, fragment in fragments] == ["A", "B"]
+    assert fragments[0][0].chain == {content.file_path}
+    assert fragments[0][0].get_location(3) == "conf.d/a.conf:3"
+    assert context.get_location(3) == 3
+
+    # fragments are parsed once
+    list(resolver.resolve("conf.d/a.conf", context))
+    assert len(resolver) == 2
+
+
+def test_resolve_cycle(project):
+    content = FileContent.from_file(str(project / "main.conf"))
+    context = IncludeContext(
+        content=content,
+        artifact_path=content.file_path,
+        project_root=str(project),
+        base_dirs=[str(project)],
+    )
+    resolver = IncludeResolver(lambda fragment: fragment.text)
+
+    assert not list(resolver.resolve("main.conf", context))
+
+    (fragment_context, _), = resolver.resolve("conf.d/a.conf", context)
+    assert not list(resolver.resolve("/main.conf", fragment_context))
+
+
+def test_get_project_root():
+    assert IncludeResolver.get_project_root("/repo/conf/httpd.conf", "conf/httpd.conf") == "/repo"
+    assert IncludeResolver.get_project_root("/repo/nginx.conf", "other/nginx.conf") == "/repo"
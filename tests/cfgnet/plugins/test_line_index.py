@@ -0,0 +1,91 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.plugins.line_index import (
+    LineIndex,
+    toml_inline_key,
+    toml_table_key,
+)
+
+
+def test_ini_index():
+    text = (
+        "# comment with port\n"
+        "Name = app\n"
+        "[server]\n"
+        "port = 80\n"
+        "url = http://localhost:80\n"
+        "[client]\n"
+        "port: 81\n"
+    )
+    line_index = LineIndex.for_ini(text)
+
+    assert line_index.get_line("name") == 2
+    assert line_index.get_line("server") == 3
+    assert line_index.get_line("port") == 4
+    assert line_index.get_line("port", after=6) == 7
+    assert line_index.get_line("port", after=8) is None
+    assert line_index.get_line("missing") is None
+
+
+def test_ini_index_skips_continuations():
+    line_index = LineIndex.for_ini("list = a,\\\n  key = b\nkey = c\n")
+
+    assert line_index.get_line("key") == 3
+
+
+def test_toml_index():
+    text = (
+        "[tool.poetry]\n"
+        "name = 'cfgnet'\n"
+        "packages = [{ include = 'cfgnet', from = 'src' }]\n"
+        "a.b = 1\n"
+        "[[bin]]\n"
+        "name = 'first'\n"
+        "[[bin]]\n"
+        "name = 'second'\n"
+    )
+    line_index = LineIndex.for_toml(text)
+
+    assert line_index.get_lines(toml_table_key(["tool", "poetry"])) == [1]
+    assert line_index.get_lines(toml_table_key(["bin"])) == [5, 7]
+    assert line_index.get_path_line(["tool", "poetry", "name"]) == 2
+    assert line_index.get_line(toml_inline_key("from")) == 3
+    assert line_index.get_line("include") is None
+    assert line_index.get_path_line(["a", "b"]) == 4
+    assert line_index.get_line("name", after=7) == 8
+
+
+def test_yaml_index():
+    text = (
+        "spring:\n"
+        "  datasource:\n"
+        "    # url: commented\n"
+        "    url: jdbc:mysql://localhost\n"
+        "server.port: 8080\n"
+        "list:\n"
+        "  - name: first\n"
+    )
+    line_index = LineIndex.for_yaml(text)
+
+    assert line_index.get_path_line(["spring", "datasource", "url"]) == 4
+    assert line_index.get_path_line(["server", "port"]) == 5
+    assert line_index.get_line("name") == 7
+    assert line_index.get_line("jdbc") is None
+
+
+def test_to_location():
+    assert LineIndex.to_location(3) == "3"
+    assert LineIndex.to_location(None) == "Unknown"
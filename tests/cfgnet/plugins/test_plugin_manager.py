@@ -19,7 +19,7 @@ from cfgnet.plugins.plugin_manager import PluginManager
 def test_get_all_concept_plugins():
     all_concept_plugins = PluginManager.get_concept_plugins()
 
-    assert len(all_concept_plugins) == 39
+    assert len(all_concept_plugins) == 40
 
 
 def test_get_responsible_concept_plugin():
@@ -64,6 +64,7 @@ def test_get_responsible_concept_plugin():
     gradle_wrapper_plugin = PluginManager.get_responsible_plugin(plugins, "path/to/gradle-wrapper.properties")
     maven_wrapper_plugin = PluginManager.get_responsible_plugin(plugins, "path/to/maven-wrapper.properties")
     netlify_plugin = PluginManager.get_responsible_plugin(plugins, "path/to/netlify.toml")
+    dotenv_plugin = PluginManager.get_responsible_plugin(plugins, "path/to/.env")
 
     assert docker_plugin.concept_name == "docker"
     assert maven_plugin.concept_name == "maven"
@@ -104,3 +105,30 @@ def test_get_responsible_concept_plugin():
     assert gradle_wrapper_plugin.concept_name == "gradle-wrapper"
     assert maven_wrapper_plugin.concept_name == "maven-wrapper"
     assert netlify_plugin.concept_name == "netlify"
+    assert dotenv_plugin.concept_name == "dotenv"
+
+
+def test_config_file_filter():
+    concept_filter = PluginManager.get_config_file_filter("/project")
+    file_type_filter = PluginManager.get_config_file_filter(
+        "/project", enable_file_type_plugins=True
+    )
+
+    assert concept_filter("path/to/Dockerfile")
+    assert concept_filter("playbooks/site.yml")
+    assert not concept_filter("src/main.py")
+    assert not concept_filter("path/to/test.ini")
+    assert file_type_filter("path/to/test.ini")
+    assert not file_type_filter("README.md")
+
+
+def test_fingerprint():
+    fingerprint = PluginManager.get_fingerprint()
+    file_type_fingerprint = PluginManager.get_fingerprint(
+        enable_file_type_plugins=True
+    )
+
+    assert "DotenvPlugin" in fingerprint
+    assert "JsonPlugin" not in fingerprint
+    assert file_type_fingerprint.startswith(fingerprint)
+    assert "JsonPlugin" in file_type_fingerprint
@@ -0,0 +1,84 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import io
+import os
+import pytest
+
+from cfgnet.vcs.git import Git
+from cfgnet.vcs import changed_files
+from cfgnet.vcs.changed_files import ChangedFileIndex
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+
+    readme = os.path.join(repo.root, "README.md")
+    with open(readme, "w", encoding="utf-8") as readme_file:
+        readme_file.write("Port database repository\n")
+    repo.repo.index.add([readme])
+    repo.repo.index.commit("Add readme")
+
+    return repo
+
+
+def test_build_index(get_repo):
+    commits = [commit.hexsha for commit in get_repo.get_commit_history()]
+    index = ChangedFileIndex.build(
+        Git(get_repo.root),
+        [str(get_repo.repo.heads[0])],
+        file_filter=lambda path: path != "README.md",
+    )
+
+    assert len(index) == 4
+    assert index.get_parent(commits[0]) is None
+    assert index.get_parent(commits[1]) == commits[0]
+    assert sorted(index.get_changed_files(commits[0])) == [
+        "Dockerfile",
+        "application.properties",
+        "docker-compose.yml",
+    ]
+    assert index.get_changed_files(commits[2]) == ["Dockerfile"]
+    assert index.get_changed_files(commits[3]) == []
+    assert index.get_changed_files("unknown") is None
+
+    assert index.is_unchanged(commits[3], commits[2])
+    assert not index.is_unchanged(commits[3], commits[1])
+    assert not index.is_unchanged(commits[2], commits[1])
+
+
+def test_load_or_build_caches_index(get_repo):
+    git = Git(get_repo.root)
+    cache_dir = os.path.join(get_repo.root, ".cfgnet", "analysis")
+    rev_args = [str(get_repo.repo.heads[0])]
+
+    index = ChangedFileIndex.load_or_build(git, rev_args, cache_dir)
+    cached_files = os.listdir(cache_dir)
+    cached_index = ChangedFileIndex.load_or_build(git, rev_args, cache_dir)
+
+    assert len(cached_files) == 1
+    assert cached_index.commits == index.commits
+
+
+def test_iter_records_across_chunks(monkeypatch):
+    monkeypatch.setattr(changed_files, "CHUNK_SIZE", 4)
+    records = [b"a" * 10_000, b"bc", b"", b"defgh", b"i"]
+    stream = io.BytesIO(b"\x01" + b"\x01".join(records))
+
+    assert list(ChangedFileIndex._iter_records(stream)) == [
+        record for record in records if record
+    ]
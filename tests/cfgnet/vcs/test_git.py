@@ -0,0 +1,79 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from cfgnet.vcs.git import Git
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+    return repo
+
+
+def test_get_files_at_commit(get_repo):
+    git = Git(get_repo.root)
+    commits = get_repo.get_commit_history()
+
+    files = git.get_files_at_commit(commits[0].hexsha)
+
+    assert files == sorted(git.get_tracked_files())
+    assert "Dockerfile" in files
+
+
+def test_read_blob(get_repo):
+    git = Git(get_repo.root)
+    commits = get_repo.get_commit_history()
+
+    first = git.read_blob(commits[0].hexsha, "Dockerfile")
+    last = git.read_blob(commits[-1].hexsha, "Dockerfile")
+
+    with open(f"{get_repo.root}/Dockerfile", "rb") as dockerfile:
+        assert last == dockerfile.read()
+
+    assert first != last
+    assert git.read_blob(commits[0].hexsha, "missing.txt") is None
+
+    git.close()
+
+
+def test_blob_cache_is_bounded(get_repo):
+    git = Git(get_repo.root)
+    reader = git.get_object_reader()
+    reader.blob_cache_size = 10
+    commits = get_repo.get_commit_history()
+
+    content = reader.read_blob(commits[-1].hexsha, "docker-compose.yml")
+
+    assert content
+    assert reader._blob_cache_bytes <= 10
+
+
+def test_get_tracked_files_with_filter(get_repo):
+    git = Git(get_repo.root)
+
+    files = git.get_tracked_files()
+    yaml_files = git.get_tracked_files(
+        file_filter=lambda path: path.endswith(".yml")
+    )
+
+    assert sorted(files) == [
+        "Dockerfile",
+        "application.properties",
+        "docker-compose.yml",
+    ]
+    assert yaml_files == ["docker-compose.yml"]
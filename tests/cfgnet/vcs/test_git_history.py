@@ -0,0 +1,64 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from cfgnet.vcs.git import Git
+from cfgnet.vcs.git_history import GitHistory
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+    return repo
+
+
+def test_history_oldest_first(get_repo):
+    expected = [commit.hexsha for commit in get_repo.get_commit_history()]
+    history = GitHistory(Git(get_repo.root))
+
+    commits = [history.restore_initial_commit().hexsha]
+    while history.has_next_commit():
+        commits.append(history.next_commit().hexsha)
+
+    assert commits == expected
+    assert history.commit_index == len(expected) - 1
+
+    history.close()
+
+
+def test_history_rev_range(get_repo):
+    expected = [commit.hexsha for commit in get_repo.get_commit_history()]
+    history = GitHistory(
+        Git(get_repo.root), rev_range=f"{expected[0]}..{expected[-1]}"
+    )
+
+    initial_commit = history.restore_initial_commit()
+    assert initial_commit.hexsha == expected[1]
+    assert history.next_commit().hexsha == expected[2]
+    assert not history.has_next_commit()
+
+    history.close()
+
+
+def test_history_explicit_branch(get_repo):
+    get_repo.repo.git.branch("old", get_repo.get_commit_history()[0].hexsha)
+    history = GitHistory(Git(get_repo.root), branch="old")
+
+    assert history.restore_initial_commit()
+    assert not history.has_next_commit()
+
+    history.close()
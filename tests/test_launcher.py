@@ -73,5 +73,14 @@ def test_linker_options():
     result: Result = runner.invoke(
         main, ["init", ROOT_DIR, "--disable-linker", "equality"]
     )
+    assert "equality" not in [
+        linker.name for linker in LinkerManager.enabled_linkers
+    ]
+    assert result.exit_code == 0
+
+    disabled_linkers = []
+    for linker_name in LinkerManager.get_linker_names():
+        disabled_linkers += ["--disable-linker", linker_name]
+    result = runner.invoke(main, ["init", ROOT_DIR] + disabled_linkers)
     assert len(LinkerManager.enabled_linkers) == 0
     assert result.exit_code == 0